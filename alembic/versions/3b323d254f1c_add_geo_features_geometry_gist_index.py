@@ -0,0 +1,37 @@
+"""add_geo_features_geometry_gist_index
+
+Revision ID: 3b323d254f1c
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b323d254f1c"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # geo_features is created by init_db (create_all), so the GiST index may
+    # already exist on fresh databases.
+    op.create_index(
+        "idx_feature_geometry",
+        "geo_features",
+        ["geometry"],
+        unique=False,
+        postgresql_using="gist",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_feature_geometry",
+        table_name="geo_features",
+        postgresql_using="gist",
+        if_exists=True,
+    )
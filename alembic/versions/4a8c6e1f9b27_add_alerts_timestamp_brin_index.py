@@ -0,0 +1,36 @@
+"""add_alerts_timestamp_brin_index
+
+Revision ID: 4a8c6e1f9b27
+Revises: 9e4b1f7c2d53
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4a8c6e1f9b27"
+down_revision = "9e4b1f7c2d53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_alerts_timestamp_brin",
+        "alerts",
+        ["timestamp"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_alerts_timestamp_brin",
+        table_name="alerts",
+        postgresql_using="brin",
+        if_exists=True,
+    )
@@ -0,0 +1,35 @@
+"""add_geo_layer_bbox_columns
+
+Revision ID: 5c7e2a9d4b10
+Revises: 3b323d254f1c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c7e2a9d4b10"
+down_revision = "3b323d254f1c"
+branch_labels = None
+depends_on = None
+
+BBOX_COLUMNS = ("bbox_min_x", "bbox_min_y", "bbox_max_x", "bbox_max_y")
+
+
+def upgrade() -> None:
+    # geo_layers is created by init_db (create_all), so fresh databases may
+    # already have these columns.
+    for column in BBOX_COLUMNS:
+        op.add_column(
+            "geo_layers",
+            sa.Column(column, sa.Float(), nullable=True),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for column in BBOX_COLUMNS:
+        op.drop_column("geo_layers", column, if_exists=True)
@@ -0,0 +1,37 @@
+"""add_geo_features_layer_geometry_index
+
+Revision ID: 7d2f4e8a1c36
+Revises: 5c7e2a9d4b10
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2f4e8a1c36"
+down_revision = "5c7e2a9d4b10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist provides the GiST operator class for the varchar layer_id
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_index(
+        "idx_feature_layer_geometry",
+        "geo_features",
+        ["layer_id", "geometry"],
+        unique=False,
+        postgresql_using="gist",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_feature_layer_geometry",
+        table_name="geo_features",
+        postgresql_using="gist",
+        if_exists=True,
+    )
@@ -0,0 +1,63 @@
+"""server_default_timestamps
+
+Revision ID: 9e4b1f7c2d53
+Revises: 7d2f4e8a1c36
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e4b1f7c2d53"
+down_revision = "7d2f4e8a1c36"
+branch_labels = None
+depends_on = None
+
+# Tables sharing the BaseModel created_at/updated_at columns
+TIMESTAMPED_TABLES = (
+    "datasources",
+    "geo_layers",
+    "geo_features",
+    "projects",
+    "project_members",
+    "dashboards",
+    "computation_scripts",
+    "computation_jobs",
+    "alert_definitions",
+    "alerts",
+)
+
+UTC_NOW = "(now() AT TIME ZONE 'utc')"
+
+
+def _set_default(table: str, column: str, default: str) -> None:
+    # Some tables/columns are only created by init_db (create_all), so skip
+    # the ones that do not exist yet; create_all applies the model default.
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = '{table}' AND column_name = '{column}'
+            ) THEN
+                ALTER TABLE "{table}" ALTER COLUMN "{column}" {default};
+            END IF;
+        END $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            _set_default(table, column, f"SET DEFAULT {UTC_NOW}")
+    _set_default("alerts", "timestamp", f"SET DEFAULT {UTC_NOW}")
+
+
+def downgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            _set_default(table, column, "DROP DEFAULT")
+    _set_default("alerts", "timestamp", "DROP DEFAULT")
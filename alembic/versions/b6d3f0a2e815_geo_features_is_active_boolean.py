@@ -0,0 +1,59 @@
+"""geo_features_is_active_boolean
+
+Revision ID: b6d3f0a2e815
+Revises: 4a8c6e1f9b27
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b6d3f0a2e815"
+down_revision = "4a8c6e1f9b27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # geo_features may be created by init_db (create_all) with the boolean
+    # column already, so only convert a text column.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'geo_features' AND column_name = 'is_active'
+                    AND data_type <> 'boolean'
+            ) THEN
+                DROP INDEX IF EXISTS idx_feature_active;
+                ALTER TABLE geo_features ALTER COLUMN is_active DROP DEFAULT;
+                ALTER TABLE geo_features ALTER COLUMN is_active TYPE boolean
+                    USING (lower(is_active) = 'true');
+                ALTER TABLE geo_features ALTER COLUMN is_active SET DEFAULT true;
+            END IF;
+        END $$;
+        """
+    )
+    op.create_index(
+        "idx_feature_active_layer",
+        "geo_features",
+        ["layer_id"],
+        unique=False,
+        postgresql_where="is_active",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_feature_active_layer", table_name="geo_features", if_exists=True)
+    op.execute(
+        """
+        ALTER TABLE geo_features ALTER COLUMN is_active DROP DEFAULT;
+        ALTER TABLE geo_features ALTER COLUMN is_active TYPE varchar(10)
+            USING (CASE WHEN is_active THEN 'true' ELSE 'false' END);
+        ALTER TABLE geo_features ALTER COLUMN is_active SET DEFAULT 'true';
+        """
+    )
+    op.create_index("idx_feature_active", "geo_features", ["is_active"], unique=False)
@@ -0,0 +1,35 @@
+"""add_datasources_project_id_index
+
+Revision ID: c2e7a9d41f60
+Revises: b6d3f0a2e815
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c2e7a9d41f60"
+down_revision = "b6d3f0a2e815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # datasources is only created by init_db (create_all), which builds the
+    # index itself; index existing tables here.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('datasources') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_datasources_project_id
+                    ON datasources (project_id);
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_datasources_project_id")
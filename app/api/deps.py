@@ -2,9 +2,9 @@
 API Dependencies for Authentication and Authorization.
 """
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import settings
@@ -79,3 +79,16 @@ def get_time_series_service(
     from app.services.time_series_service import TimeSeriesService
 
     return TimeSeriesService(db)
+
+
+def get_bbox(
+    bbox: Optional[str] = Query(
+        None, description="Bounding box (min_lon,min_lat,max_lon,max_lat)"
+    ),
+) -> Optional[Tuple[float, float, float, float]]:
+    """Dependency parsing the bbox query parameter once per request."""
+    if not bbox:
+        return None
+    from app.services.database_service import DatabaseService
+
+    return DatabaseService.parse_bbox(bbox)
@@ -100,10 +100,7 @@ def create_alert_definition(
         is_active=definition.is_active,
         created_by=current_user.get("sub"),
     )
-    db.add(db_def)
-    db.commit()
-    db.refresh(db_def)
-    return db_def
+    return db_def.save_new(db)
 
 
 class AlertDefinitionUpdate(BaseModel):
@@ -178,12 +175,16 @@ def delete_alert_definition(
 def get_alert_history(
     project_id: UUID4,
     status: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(deps.get_current_user),
     limit: int = 100,
 ):
     """
     Get history of triggered alerts for a project.
+    start_time/end_time bound the alert timestamps; the window is served by
+    the BRIN index on alerts.timestamp.
     """
     ProjectService._check_access(db, project_id, current_user, required_role="viewer")
 
@@ -196,6 +197,10 @@ def get_alert_history(
 
     if status:
         query = query.filter(Alert.status == status)
+    if start_time:
+        query = query.filter(Alert.timestamp >= start_time)
+    if end_time:
+        query = query.filter(Alert.timestamp <= end_time)
 
     alerts = query.order_by(Alert.timestamp.desc()).limit(limit).all()
     return alerts
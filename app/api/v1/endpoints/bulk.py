@@ -1,6 +1,7 @@
+import asyncio
 import os
 import uuid
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 from celery.result import AsyncResult
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
@@ -13,6 +14,8 @@ router = APIRouter()
 
 # 200MB limit for bulk files
 MAX_BULK_FILE_SIZE = 200 * 1024 * 1024
+# Bytes copied per read when saving an upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 TEMP_IMPORT_DIR = "app/temp_imports"
 
 if not os.path.exists(TEMP_IMPORT_DIR):
@@ -30,6 +33,29 @@ class TaskStatusResponse(BaseModel):
     result: Optional[Any] = None
 
 
+def _save_upload(src: BinaryIO, file_path: str) -> None:
+    """
+    Copy an upload to disk in chunks, enforcing MAX_BULK_FILE_SIZE.
+    Blocking; run it off the event loop.
+    """
+    total_size = 0
+    with open(file_path, "wb") as buffer:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            if total_size > MAX_BULK_FILE_SIZE:
+                raise HTTPException(status_code=400, detail="File exceeds 200MB limit")
+            buffer.write(chunk)
+
+
+async def _store_upload(file: UploadFile, file_path: str) -> None:
+    """Save an upload to file_path without blocking the event loop."""
+    # The multipart parser already knows the size; reject before copying
+    if file.size is not None and file.size > MAX_BULK_FILE_SIZE:
+        raise HTTPException(status_code=400, detail="File exceeds 200MB limit")
+    await file.seek(0)
+    await asyncio.to_thread(_save_upload, file.file, file_path)
+
+
 @router.post(
     "/import/geojson",
     response_model=TaskSubmissionResponse,
@@ -42,15 +68,7 @@ async def import_geojson(file: UploadFile = File(...)):
 
     try:
         # Stream file to disk to avoid memory exhaustion
-        total_size = 0
-        with open(file_path, "wb") as buffer:
-            while chunk := await file.read(1024 * 1024):  # Read in 1MB chunks
-                total_size += len(chunk)
-                if total_size > MAX_BULK_FILE_SIZE:
-                    raise HTTPException(
-                        status_code=400, detail="File exceeds 200MB limit"
-                    )
-                buffer.write(chunk)
+        await _store_upload(file, file_path)
 
         # Pass file path to task
         task = import_geojson_task.delay(file_path)
@@ -77,15 +95,7 @@ async def import_timeseries(file: UploadFile = File(...)):
     file_path = os.path.join(TEMP_IMPORT_DIR, filename)
 
     try:
-        total_size = 0
-        with open(file_path, "wb") as buffer:
-            while chunk := await file.read(1024 * 1024):
-                total_size += len(chunk)
-                if total_size > MAX_BULK_FILE_SIZE:
-                    raise HTTPException(
-                        status_code=400, detail="File exceeds 200MB limit"
-                    )
-                buffer.write(chunk)
+        await _store_upload(file, file_path)
 
         task = import_timeseries_task.delay(file_path)
         return {"task_id": task.id, "status": "submitted"}
@@ -133,11 +133,7 @@ async def upload_computation_script(
         project_id=project_id,
         uploaded_by=current_user.get("sub", "unknown"),
     )
-    db.add(db_script)
-    db.commit()
-    db.refresh(db_script)
-
-    return db_script
+    return db_script.save_new(db)
 
 
 @router.post("/run/{script_id}", response_model=TaskSubmissionResponse)
@@ -1,18 +1,23 @@
-from typing import Any, List
+import json
+import logging
+from typing import Any, Dict, Iterator, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_superuser, get_current_user, get_db
 from app.schemas.datasource import (
     DataSourceCreate,
     DataSourceResponse,
+    DataSourceSummary,
     DataSourceUpdate,
     QueryRequest,
 )
 from app.services.datasource_service import DataSourceService
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -34,6 +39,22 @@ def get_project_datasources(
     return datasources
 
 
+@router.get(
+    "/projects/{project_id}/datasources/summary",
+    response_model=List[DataSourceSummary],
+)
+def get_project_datasource_summaries(
+    project_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user),
+):
+    """
+    Get id, name and type of all datasources for a project.
+    Skips loading connection details, for pickers and list views.
+    """
+    return DataSourceService(db).list_summary(project_id)
+
+
 @router.post("/projects/{project_id}/datasources", response_model=DataSourceResponse)
 def create_datasource(
     project_id: UUID,
@@ -129,12 +150,56 @@ def execute_query(
         raise HTTPException(status_code=404, detail="Datasource not found")
 
     try:
-        result = service.execute_query(datasource, query.sql)
+        result = service.execute_query(datasource, query.sql, query.params)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/projects/{project_id}/datasources/{datasource_id}/query/stream")
+def stream_query(
+    project_id: UUID,
+    datasource_id: UUID,
+    query: QueryRequest,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_active_superuser),  # Admin only
+):
+    """
+    Execute raw SQL on a datasource and stream the rows as NDJSON.
+    Rows are sent in batches as they are read, so large results are not
+    materialized.
+    RESTRICTED: Admins only.
+    """
+    service = DataSourceService(db)
+    datasource = service.get(datasource_id)
+    if not datasource:
+        raise HTTPException(status_code=404, detail="Datasource not found")
+
+    try:
+        batches = service.stream_query(datasource, query.sql, query.params)
+        # Run up to the first batch so connection and SQL errors still get a 400
+        first = next(batches, None)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def encode(batch: List[Dict[str, Any]]) -> str:
+        return "".join(json.dumps(row, default=str) + "\n" for row in batch)
+
+    def generate() -> Iterator[str]:
+        # One body chunk per batch rather than one send per row
+        if first is None:
+            return
+        yield encode(first)
+        try:
+            for batch in batches:
+                yield encode(batch)
+        except Exception as e:
+            # Headers are already sent; the truncated stream signals the failure
+            logger.error(f"Streaming query on datasource {datasource_id} failed: {e}")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/datasources/available-sensors")
 def get_available_sensors(
     db: Session = Depends(get_db),
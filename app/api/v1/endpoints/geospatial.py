@@ -2,16 +2,20 @@
 Geospatial API endpoints.
 """
 
+import json
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from geoalchemy2.shape import to_shape
+from shapely.geometry import mapping
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, has_role
+from app.api.deps import get_bbox, get_current_user, has_role
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.schemas.geospatial import (
     FeatureListResponse,
     GeoFeatureCreate,
@@ -46,7 +50,7 @@ async def create_geo_layer(layer: GeoLayerCreate, db: Session = Depends(get_db))
 
 
 @router.get("/layers", response_model=LayerListResponse)
-async def get_geo_layers(
+def get_geo_layers(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
     workspace: Optional[str] = Query(None, description="Filter by workspace"),
@@ -161,6 +165,18 @@ async def create_geo_feature(
     return db_service.create_geo_feature(feature)
 
 
+@router.post("/features/bulk", status_code=201)
+async def bulk_create_geo_features(
+    features: List[GeoFeatureCreate],
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """Create many geospatial features in one transaction."""
+    db_service = DatabaseService(db)
+    ids = db_service.bulk_create_geo_features(features)
+    return {"created": len(ids), "ids": ids}
+
+
 @router.get("/features", response_model=FeatureListResponse)
 async def get_geo_features(
     layer_name: str = Query(..., description="Layer name"),
@@ -168,8 +184,14 @@ async def get_geo_features(
     limit: int = Query(1000, ge=1, le=10000, description="Maximum number of records"),
     feature_type: Optional[str] = Query(None, description="Filter by feature type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    bbox: Optional[str] = Query(
-        None, description="Bounding box (min_lon,min_lat,max_lon,max_lat)"
+    bbox: Optional[Tuple[float, float, float, float]] = Depends(get_bbox),
+    bbox_only: bool = Query(
+        False,
+        description="Match bounding boxes only, skipping the exact intersection",
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        description="Return features after this id (keyset paging; overrides skip)",
     ),
     db: Session = Depends(get_db),
 ):
@@ -182,6 +204,13 @@ async def get_geo_features(
         feature_type=feature_type,
         is_active=is_active,
         bbox=bbox,
+        bbox_only=bbox_only,
+        after_id=after_id,
+    )
+
+    # Cursor for the next keyset page; only full pages can have one
+    next_after_id = (
+        features[-1].id if after_id is not None and len(features) == limit else None
     )
 
     return FeatureListResponse(
@@ -190,9 +219,65 @@ async def get_geo_features(
         layer_name=layer_name,
         skip=skip,
         limit=limit,
+        next_after_id=next_after_id,
     )
 
 
+@router.get("/features/export")
+def export_geo_features(
+    layer_name: str = Query(..., description="Layer name"),
+    feature_type: Optional[str] = Query(None, description="Filter by feature type"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    bbox: Optional[Tuple[float, float, float, float]] = Depends(get_bbox),
+    bbox_only: bool = Query(
+        False,
+        description="Match bounding boxes only, skipping the exact intersection",
+    ),
+    include_geometry: bool = Query(
+        True, description="Export geometries; false exports attributes only"
+    ),
+):
+    """
+    Stream all matching features of a layer as a GeoJSON FeatureCollection.
+    Rows are read through a server-side cursor and written out as they
+    arrive, so large layers are not materialized in memory.
+    """
+
+    def generate() -> Iterator[str]:
+        # The request-scoped session is closed before a streamed body is sent,
+        # so the generator owns its own session.
+        db = SessionLocal()
+        try:
+            db_service = DatabaseService(db)
+            yield '{"type": "FeatureCollection", "features": ['
+            separator = ""
+            for feature in db_service.iter_geo_features(
+                layer_name=layer_name,
+                feature_type=feature_type,
+                is_active=is_active,
+                bbox=bbox,
+                bbox_only=bbox_only,
+                include_geometry=include_geometry,
+            ):
+                geojson = {
+                    "type": "Feature",
+                    "id": feature.feature_id,
+                    "geometry": (
+                        mapping(to_shape(feature.geometry))
+                        if include_geometry
+                        else None
+                    ),
+                    "properties": feature.properties or {},
+                }
+                yield separator + json.dumps(geojson, default=str)
+                separator = ","
+            yield "]}"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/geo+json")
+
+
 @router.get("/features/{feature_id}", response_model=GeoFeatureResponse)
 async def get_geo_feature(
     feature_id: str,
@@ -243,7 +328,7 @@ async def spatial_query(query: SpatialQuery, db: Session = Depends(get_db)):
 @router.post(
     "/geoserver/publish", status_code=201, dependencies=[Depends(has_role("admin"))]
 )
-async def publish_layer_to_geoserver(
+def publish_layer_to_geoserver(
     request: LayerPublishRequest, db: Session = Depends(get_db)
 ):
     """Publish a layer to GeoServer."""
@@ -265,7 +350,7 @@ async def publish_layer_to_geoserver(
 @router.delete(
     "/geoserver/unpublish", status_code=204, dependencies=[Depends(has_role("admin"))]
 )
-async def unpublish_layer_from_geoserver(
+def unpublish_layer_from_geoserver(
     request: LayerUnpublishRequest, db: Session = Depends(get_db)
 ):
     """Unpublish a layer from GeoServer."""
@@ -285,7 +370,7 @@ async def unpublish_layer_from_geoserver(
 
 
 @router.get("/geoserver/layers")
-async def get_geoserver_layers(
+def get_geoserver_layers(
     workspace: Optional[str] = Query(None, description="Filter by workspace")
 ):
     """Get layers from GeoServer."""
@@ -305,7 +390,7 @@ async def get_geoserver_layers(
 
 
 @router.get("/geoserver/layers/{layer_name}")
-async def get_geoserver_layer_info(
+def get_geoserver_layer_info(
     layer_name: str,
     workspace: Optional[str] = Query(None, description="Workspace name"),
 ):
@@ -329,7 +414,7 @@ async def get_geoserver_layer_info(
 
 
 @router.get("/geoserver/layers/{layer_name}/capabilities")
-async def get_layer_capabilities(
+def get_layer_capabilities(
     layer_name: str,
     workspace: Optional[str] = Query(None, description="Workspace name"),
 ):
@@ -414,7 +499,7 @@ async def get_wfs_url(
 
 
 @router.get("/geoserver/layers/{layer_name}/geojson")
-async def get_layer_geojson(
+def get_layer_geojson(
     layer_name: str,
     workspace: Optional[str] = Query(None, description="Workspace name"),
 ):
@@ -437,7 +522,7 @@ async def get_layer_geojson(
 
 
 @router.get("/layers/{layer_name}/sensors")
-async def get_sensors_in_layer(
+def get_sensors_in_layer(
     layer_name: str,
     db: Session = Depends(get_db),
 ):
@@ -452,7 +537,7 @@ async def get_sensors_in_layer(
 
 
 @router.get("/layers/{layer_name}/bbox")
-async def get_layer_bbox(
+def get_layer_bbox(
     layer_name: str,
     db: Session = Depends(get_db),
 ):
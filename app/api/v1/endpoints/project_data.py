@@ -47,13 +47,11 @@ def list_project_things(
     sensor_ids = ProjectService.list_sensors(db, project_id, current_user)
 
     results = []
-    # Optimization: This could be slow for many sensors.
-    # Ideal: Schema expansion or Batch API in FROST.
-    # For now, we loop.
-    # FIXME: Potential N+1 performance issue. Consider implementing batch retrieval.
+    # Stations are fetched in batches; latest data is still one call per station
+    stations = ts_service.get_stations_by_ids(sensor_ids)
     for sid in sensor_ids:
         try:
-            station = ts_service.get_station(sid)
+            station = stations.get(sid)
             if not station:
                 continue
 
@@ -233,32 +231,39 @@ async def import_project_thing_file(
     series_id = f"DS_{canonical_id}_{parameter}"
     data_points = []
 
-    content = await file.read()
+    # Parse straight from the spooled upload file instead of copying it into
+    # bytes, a decoded str and a StringIO first
+    await file.seek(0)
 
     try:
         filename = file.filename.lower()
         if filename.endswith(".csv"):
-            text = content.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text))
-            for row in reader:
-                ts_val = row.get("timestamp") or row.get("time") or row.get("date")
-                val = row.get("value") or row.get("val")
-                qual = row.get("quality_flag") or row.get("quality") or "good"
-
-                if not ts_val or val is None:
-                    continue
-
-                data_points.append(
-                    TimeSeriesDataCreate(
-                        timestamp=datetime.fromisoformat(ts_val.replace("Z", "+00:00")),
-                        value=float(val),
-                        quality_flag=qual,
-                        series_id=series_id,
+            text_stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+            try:
+                for row in csv.DictReader(text_stream):
+                    ts_val = row.get("timestamp") or row.get("time") or row.get("date")
+                    val = row.get("value") or row.get("val")
+                    qual = row.get("quality_flag") or row.get("quality") or "good"
+
+                    if not ts_val or val is None:
+                        continue
+
+                    data_points.append(
+                        TimeSeriesDataCreate(
+                            timestamp=datetime.fromisoformat(
+                                ts_val.replace("Z", "+00:00")
+                            ),
+                            value=float(val),
+                            quality_flag=qual,
+                            series_id=series_id,
+                        )
                     )
-                )
+            finally:
+                # Leave the upload file open for FastAPI to clean up
+                text_stream.detach()
 
         elif filename.endswith(".json"):
-            data = json.loads(content)
+            data = json.load(file.file)
             if not isinstance(data, list):
                 raise ValueError("JSON must be a list of objects")
             for item in data:
@@ -172,10 +172,11 @@ def list_project_sensors(
 
     results = []
 
+    # Get Stations (Things) in batches rather than one request per sensor
+    stations = ts_service.get_stations_by_ids(sensor_ids)
     for sid in sensor_ids:
         try:
-            # Get Station (Thing)
-            station = ts_service.get_station(sid)
+            station = stations.get(sid)
             if not station:
                 continue
 
@@ -28,6 +28,13 @@ class Settings(BaseSettings):
     postgres_db: Optional[str] = Field(default=None, alias="POSTGRES_DB")
     database_pool_size: int = Field(default=10, alias="DATABASE_POOL_SIZE")
     database_max_overflow: int = Field(default=20, alias="DATABASE_MAX_OVERFLOW")
+    # Compiled SQL statements kept per engine (SQLAlchemy default is 500)
+    database_query_cache_size: int = Field(
+        default=1200, alias="DATABASE_QUERY_CACHE_SIZE"
+    )
+    # Connection pools kept per external datasource (see DataSourceService)
+    datasource_pool_size: int = Field(default=5, alias="DATASOURCE_POOL_SIZE")
+    datasource_max_overflow: int = Field(default=10, alias="DATASOURCE_MAX_OVERFLOW")
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379", alias="REDIS_URL")
@@ -40,6 +47,8 @@ class Settings(BaseSettings):
     geoserver_password: str = Field(default="geoserver", alias="GEOSERVER_PASSWORD")
     geoserver_workspace: str = Field(default="water_data", alias="GEOSERVER_WORKSPACE")
     geoserver_timeout: int = Field(default=30, alias="GEOSERVER_TIMEOUT")
+    geoserver_wfs_cache_ttl: int = Field(default=300, alias="GEOSERVER_WFS_CACHE_TTL")
+    geoserver_max_workers: int = Field(default=16, alias="GEOSERVER_MAX_WORKERS")
 
     # Time Data Processing
     time_zone: str = Field(default="UTC", alias="TIME_ZONE")
@@ -48,6 +57,10 @@ class Settings(BaseSettings):
         default="http://frost:8080/FROST-Server/v1.1", alias="FROST_URL"
     )
     frost_timeout: int = Field(default=30, alias="FROST_TIMEOUT")
+    # Layer unions up to this WKT size are sent as an exact FROST filter
+    frost_filter_max_wkt_chars: int = Field(
+        default=4000, alias="FROST_FILTER_MAX_WKT_CHARS"
+    )
 
     # Security
     secret_key: str = Field(alias="SECRET_KEY")
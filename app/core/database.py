@@ -20,6 +20,7 @@ engine = create_engine(
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
     pool_pre_ping=True,
+    query_cache_size=settings.database_query_cache_size,
     echo=settings.debug,
 )
 
@@ -72,11 +73,12 @@ def init_db() -> None:
                 f"Targeting tables for creation: {list(Base.metadata.tables.keys())}"
             )
 
-            # Ensure PostGIS extension exists
+            # Ensure PostGIS (and btree_gist for composite GiST indexes) exist
             with engine.connect() as connection:
                 connection.execute(
                     text("CREATE EXTENSION IF NOT EXISTS postgis CASCADE;")
                 )
+                connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist;"))
                 connection.commit()
 
             Base.metadata.create_all(bind=engine, checkfirst=True)
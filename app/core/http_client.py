@@ -0,0 +1,40 @@
+"""
+Shared HTTP session for outbound calls to FROST and GeoServer.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_http_session(
+    pool_connections: int = 10, pool_maxsize: int = 50
+) -> requests.Session:
+    """
+    Create a keep-alive session with a pooled adapter.
+    Connection errors, rate limiting (429, honouring Retry-After) and gateway
+    errors (502/503/504) on idempotent requests are retried with jittered
+    backoff; the last response is returned so callers still see the status
+    through raise_for_status. POST is never retried, since FROST and
+    GeoServer POSTs create resources.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Process-wide session so TCP/TLS connections are reused across requests
+http_session = create_http_session()
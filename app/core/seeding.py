@@ -12,6 +12,7 @@ import requests  # Added for TimeIO seeding
 from geoalchemy2.shape import from_shape
 from shapely.geometry import Polygon, box, shape
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -127,7 +128,7 @@ def seed_data(db: Session) -> None:
                             feature_type="region",
                             geometry=wkt_geom,
                             properties=props,
-                            is_active="true",
+                            is_active=True,
                         )
                         db.add(feature)
                         region_features.append((feature, geom_shape))
@@ -146,7 +147,7 @@ def seed_data(db: Session) -> None:
                         feature_type="region",
                         geometry=wkt_geom,
                         properties={"name": region_name, "code": f"CZ-{idx+1}"},
-                        is_active="true",
+                        is_active=True,
                     )
                     db.add(feature)
                     region_features.append((feature, poly))
@@ -225,7 +226,7 @@ def seed_data(db: Session) -> None:
                             feature_type="country",
                             geometry=wkt,
                             properties=props,
-                            is_active="true",
+                            is_active=True,
                         )
                         db.add(feat)
                 except Exception as e:
@@ -448,18 +449,15 @@ def seed_data(db: Session) -> None:
                     try:
                         # Use nested transaction (savepoint) to handle potential errors safely without rolling back everything
                         with db.begin_nested():
-                            # Check existence (redundant but safe)
-                            exists_stmt = project_sensors.select().where(
-                                and_(
-                                    project_sensors.c.project_id == project.id,
-                                    project_sensors.c.sensor_id == sensor_id,
+                            # Insert unless already linked, in one round trip
+                            stmt = (
+                                pg_insert(project_sensors)
+                                .values(project_id=project.id, sensor_id=sensor_id)
+                                .on_conflict_do_nothing(
+                                    index_elements=["project_id", "sensor_id"]
                                 )
                             )
-                            if not db.execute(exists_stmt).first():
-                                stmt = project_sensors.insert().values(
-                                    project_id=project.id, sensor_id=sensor_id
-                                )
-                                db.execute(stmt)
+                            if db.execute(stmt).rowcount:
                                 logger.info(
                                     f"Linked sensor (Thing ID) {sensor_id} to project."
                                 )
@@ -2,6 +2,7 @@
 Main FastAPI application.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -37,6 +38,7 @@ async def lifespan(app: FastAPI):
         # Always register system datasources (infra discovery)
         from app.core.database import SessionLocal
         from app.core.system_datasources import register_system_datasources
+        from app.services.engine_pool import engine_registry, warmup_datasources
 
         db_sys = SessionLocal()
         try:
@@ -44,6 +46,12 @@ async def lifespan(app: FastAPI):
         finally:
             db_sys.close()
 
+        # Pre-warm datasource engines in the background; unreachable hosts
+        # must not delay readiness
+        app.state.engine_warmup = asyncio.create_task(
+            asyncio.to_thread(warmup_datasources)
+        )
+
         app.state.startup_complete = True
         logger.info("Application is now fully healthy and ready.")
 
@@ -54,6 +62,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Water Data Platform API...")
+    engine_registry.clear()
 
 
 app = FastAPI(
@@ -1,12 +1,11 @@
 import uuid
-from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.models.base import BaseModel
+from app.models.base import UTC_NOW_SQL, BaseModel
 
 
 class AlertDefinition(Base, BaseModel):
@@ -63,7 +62,7 @@ class Alert(Base, BaseModel):
         nullable=False,
     )
 
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime, server_default=UTC_NOW_SQL, nullable=False)
     status = Column(String, default="active")  # active, acknowledged, resolved
 
     message = Column(Text, nullable=False)
@@ -71,3 +70,14 @@ class Alert(Base, BaseModel):
 
     acknowledged_by = Column(String, nullable=True)
     acknowledged_at = Column(DateTime, nullable=True)
+
+    # Alerts are append-only, so timestamp follows physical row order; a BRIN
+    # index prunes history time windows by block range at a tiny index size
+    __table_args__ = (
+        Index(
+            "idx_alerts_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
@@ -2,27 +2,28 @@
 Base model with common fields and functionality.
 """
 
-from datetime import datetime, timezone
 from typing import Any, Dict
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Integer, String, Text, func, text
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Session
 
+# Current UTC time as a naive timestamp, evaluated by the database so inserts
+# do not carry Python-side timestamps
+UTC_NOW_SQL = text("(now() AT TIME ZONE 'utc')")
+
 
 class BaseModel:
     """Base model with common fields."""
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    created_at = Column(DateTime, server_default=UTC_NOW_SQL, nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=UTC_NOW_SQL,
+        onupdate=func.timezone("utc", func.now()),
         nullable=False,
     )
     created_by = Column(String(100), nullable=True)
@@ -44,6 +45,30 @@ class BaseModel:
             column.name: getattr(self, column.name) for column in self.__table__.columns
         }
 
+    def save_new(self, db: Session):
+        """
+        Insert this instance and commit without reloading it afterwards.
+        The flush fetches server-generated columns through INSERT ... RETURNING;
+        detaching before commit keeps them from being expired.
+        """
+        db.add(self)
+        db.flush()
+        db.expunge(self)
+        db.commit()
+        return self
+
+    def save_changes(self, db: Session):
+        """
+        Commit pending changes to this instance without reloading it afterwards.
+        Columns computed by the database on UPDATE (updated_at) are only kept
+        when the mapper sets eager_defaults; otherwise they stay expired and
+        must not be read from the detached instance.
+        """
+        db.flush()
+        db.expunge(self)
+        db.commit()
+        return self
+
     @classmethod
     def get_by_id(cls, db: Session, id: int):
         """Get model instance by ID."""
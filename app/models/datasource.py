@@ -14,6 +14,9 @@ class DataSource(Base, BaseModel):
     """
 
     __tablename__ = "datasources"
+    # Fetch updated_at through UPDATE ... RETURNING so save_changes needs no
+    # follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Override ID to use UUID
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -22,6 +25,7 @@ class DataSource(Base, BaseModel):
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     name = Column(String(255), nullable=False)
     type = Column(String(50), nullable=False)  # POSTGRES, GEOSERVER, TIMEIO
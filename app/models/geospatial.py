@@ -7,7 +7,17 @@ from typing import Any, Dict, Optional
 
 from geoalchemy2 import Geometry
 from pydantic import ConfigDict
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -43,6 +53,12 @@ class GeoLayer(Base, BaseModel):
     properties = Column(JSONB, nullable=True)
     style_config = Column(JSONB, nullable=True)  # SLD or CSS styling
 
+    # Extent in EPSG:4326 from GeoServer, refreshed on layer create and update
+    bbox_min_x = Column(Float, nullable=True)
+    bbox_min_y = Column(Float, nullable=True)
+    bbox_max_x = Column(Float, nullable=True)
+    bbox_max_y = Column(Float, nullable=True)
+
     features = relationship("GeoFeature", back_populates="layer")
 
     __table_args__ = (
@@ -69,16 +85,28 @@ class GeoFeature(Base, BaseModel):
     valid_from = Column(DateTime, nullable=True)
     valid_to = Column(DateTime, nullable=True)
 
-    is_active = Column(String(10), default="true")
+    is_active = Column(Boolean, default=True)
 
     layer = relationship("GeoLayer", back_populates="features")
 
     __table_args__ = (
         Index("idx_feature_layer", "layer_id"),
         Index("idx_feature_type", "feature_type"),
-        Index("idx_feature_active", "is_active"),
+        # Active-feature listings per layer; inactive rows are not indexed
+        Index(
+            "idx_feature_active_layer",
+            "layer_id",
+            postgresql_where=text("is_active"),
+        ),
         Index("idx_feature_valid_from", "valid_from"),
         Index("idx_feature_geometry", "geometry", postgresql_using="gist"),
+        # Layer-scoped spatial filters; needs the btree_gist extension
+        Index(
+            "idx_feature_layer_geometry",
+            "layer_id",
+            "geometry",
+            postgresql_using="gist",
+        ),
     )
 
 
@@ -121,7 +149,7 @@ class GeoFeatureBase(PydanticBase):
     properties: Optional[Dict[str, Any]] = None
     valid_from: Optional[datetime] = None
     valid_to: Optional[datetime] = None
-    is_active: str = "true"
+    is_active: bool = True
 
 
 class GeoFeatureCreate(GeoFeatureBase):
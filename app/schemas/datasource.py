@@ -1,7 +1,11 @@
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Placeholder sent to clients instead of the stored password; echoing it
+# back on update keeps the stored password
+PASSWORD_MASK = "********"
 
 
 class DataSourceBase(BaseModel):
@@ -20,8 +24,19 @@ class DataSourceUpdate(BaseModel):
     connection_details: Optional[Dict[str, Any]] = None
 
 
+class DataSourceSummary(BaseModel):
+    id: UUID
+    name: str
+    type: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class QueryRequest(BaseModel):
     sql: str
+    params: Optional[Dict[str, Any]] = Field(
+        None, description="Values for :name placeholders in sql"
+    )
 
 
 class DataSourceResponse(DataSourceBase):
@@ -36,6 +51,6 @@ class DataSourceResponse(DataSourceBase):
     def mask_password(cls, v: Dict[str, Any]) -> Dict[str, Any]:
         if v and "password" in v:
             v_copy = v.copy()
-            v_copy["password"] = "********"
+            v_copy["password"] = PASSWORD_MASK
             return v_copy
         return v
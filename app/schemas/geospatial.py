@@ -196,6 +196,7 @@ class FeatureListResponse(BaseModel):
     layer_name: str
     skip: int
     limit: int
+    next_after_id: Optional[int] = None
 
 
 class SpatialQueryResponse(BaseModel):
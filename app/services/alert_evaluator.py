@@ -139,8 +139,6 @@ class AlertEvaluator:
             logger.warning(f"Failed to evaluate sensor definition {definition.id}: {e}")
 
     def _create_alert(self, definition: AlertDefinition, value: Any):
-        from datetime import datetime
-
         # Deduplication: Check if an active alert already exists for this definition
         existing_active = (
             self.db.query(Alert)
@@ -156,7 +154,6 @@ class AlertEvaluator:
             definition_id=definition.id,
             message=f"Alert '{definition.name}' triggered: {value}",
             details={"value": value, "rule": definition.conditions},
-            timestamp=datetime.utcnow(),
             status="active",
         )
         self.db.add(alert)
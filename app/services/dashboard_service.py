@@ -26,10 +26,7 @@ class DashboardService:
             widgets=dashboard_in.widgets,
             is_public=dashboard_in.is_public,
         )
-        db.add(db_dashboard)
-        db.commit()
-        db.refresh(db_dashboard)
-        return db_dashboard
+        return db_dashboard.save_new(db)
 
     @staticmethod
     def get_dashboard(
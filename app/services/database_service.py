@@ -2,16 +2,40 @@
 Database service for CRUD operations and data management.
 """
 
+import io
+import json
 import logging
-from typing import Any, Dict, List, Optional
-
-import requests
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import shapely
+from geoalchemy2.shape import from_shape
 from shapely.geometry import shape
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from shapely.strtree import STRtree
+from sqlalchemy import (
+    Row,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import Session, defer, make_transient_to_detached, selectinload
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.exceptions import DatabaseException, ResourceNotFoundException
+from app.core.exceptions import (
+    DatabaseException,
+    ResourceNotFoundException,
+    ValidationException,
+)
+from app.core.http_client import http_session
 from app.models.geospatial import GeoFeature, GeoLayer
 from app.schemas.geospatial import (
     GeoFeatureCreate,
@@ -22,6 +46,247 @@ from app.schemas.geospatial import (
 
 logger = logging.getLogger(__name__)
 
+_FROST_PAGE_WORKERS = 8
+
+# Geometry is sent as GeoJSON text and parsed by PostGIS, not Shapely
+_BULK_INSERT_GEO_FEATURES = (
+    insert(GeoFeature.__table__)
+    .values(
+        geometry=func.ST_SetSRID(
+            func.ST_GeomFromGeoJSON(bindparam("geometry_geojson")), 4326
+        )
+    )
+    .returning(GeoFeature.__table__.c.id, sort_by_parameter_order=True)
+)
+
+# Bulk creates of at least this many features are streamed with COPY
+_COPY_MIN_ROWS = 500
+
+# Ids for COPY are drawn up front so they can be returned in input order
+_NEXT_GEO_FEATURE_IDS = text(
+    "SELECT nextval(pg_get_serial_sequence('geo_features', 'id')) "
+    "FROM generate_series(1, :n)"
+)
+
+# Cells per side of the grid cover sent to FROST for large layers
+_COVER_GRID_SIZE = 8
+
+# Things matched per vectorized point-in-layer check
+_SENSOR_MATCH_BATCH_SIZE = 1024
+
+# Decimals kept in the bbox FROST filter (~0.1 m at WGS84)
+_BBOX_WKT_DECIMALS = 6
+
+# Updatable column names, resolved once instead of hasattr() per key
+_GEO_LAYER_COLUMNS = frozenset(GeoLayer.__table__.columns.keys())
+_GEO_FEATURE_COLUMNS = frozenset(GeoFeature.__table__.columns.keys())
+
+_LAYER_BBOX_COLUMNS = (
+    GeoLayer.bbox_min_x,
+    GeoLayer.bbox_min_y,
+    GeoLayer.bbox_max_x,
+    GeoLayer.bbox_max_y,
+)
+
+# Columns serialized by feature listings; selected as plain rows so list
+# reads skip identity-map bookkeeping and per-attribute ORM hydration
+_GEO_FEATURE_LIST_COLUMNS = (
+    GeoFeature.id,
+    GeoFeature.layer_id,
+    GeoFeature.feature_id,
+    GeoFeature.feature_type,
+    GeoFeature.geometry,
+    GeoFeature.properties,
+    GeoFeature.valid_from,
+    GeoFeature.valid_to,
+    GeoFeature.is_active,
+    GeoFeature.created_at,
+    GeoFeature.updated_at,
+)
+
+# Short-lived per-process cache of GeoLayer column values keyed by layer_name
+_geo_layer_cache = TTLCache(maxsize=512, ttl=60)
+
+# FROST pages keyed by request URL
+_frost_page_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Parsed WFS geometries keyed by layer_name
+_layer_geometry_cache = TTLCache(maxsize=128, ttl=settings.geoserver_wfs_cache_ttl)
+
+# Envelope (SRID 4326) with bound coordinates, built once so every bbox
+# request reuses the same compiled statement from SQLAlchemy's cache.
+_BBOX_ENVELOPE = func.ST_MakeEnvelope(
+    bindparam("min_x"),
+    bindparam("min_y"),
+    bindparam("max_x"),
+    bindparam("max_y"),
+    4326,
+)
+# Explicit && guarantees the GiST index is used for the bbox pre-filter.
+# On its own it is an index-only match on bounding boxes; ST_Intersects
+# refines it to exact geometry intersection.
+_BBOX_OVERLAPS = GeoFeature.geometry.op("&&")(_BBOX_ENVELOPE)
+_BBOX_INTERSECTS = func.ST_Intersects(GeoFeature.geometry, _BBOX_ENVELOPE)
+
+
+BBox = Tuple[float, float, float, float]
+
+
+@lru_cache(maxsize=1024)
+def _parse_bbox(bbox: str) -> BBox:
+    """
+    Parse "min_lon,min_lat,max_lon,max_lat" into floats.
+    Cached because map clients repeat the same tile bboxes; raises ValueError,
+    also for non-finite or inverted bounds, so PostGIS never sees them.
+    """
+    parts = bbox.split(",")
+    if len(parts) != 4:
+        raise ValueError("expected four comma-separated numbers")
+    min_x, min_y, max_x, max_y = map(float, parts)
+    if not all(map(math.isfinite, (min_x, min_y, max_x, max_y))):
+        raise ValueError("bounds must be finite")
+    if min_x > max_x or min_y > max_y:
+        raise ValueError("min bounds must not exceed max bounds")
+    return min_x, min_y, max_x, max_y
+
+
+def _copy_field(value: Any) -> str:
+    """Format a value for COPY's text format."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _feature_geometries(features: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Parse the geometries of GeoJSON features in one vectorized GEOS call.
+    Features with missing or invalid geometry are dropped.
+    """
+    geometries = shapely.from_geojson(
+        [json.dumps(f["geometry"]) for f in features if f.get("geometry")],
+        on_invalid="ignore",
+    )
+    return geometries[~shapely.is_missing(geometries)]
+
+
+class _LayerGeometries:
+    """Parsed WFS geometries of a layer; derived shapes are built on first use."""
+
+    def __init__(self, polygons: np.ndarray):
+        # Prepared once per cache entry; predicates then use GEOS's
+        # per-polygon index instead of scanning every vertex
+        shapely.prepare(polygons)
+        self.polygons = polygons
+
+    @cached_property
+    def bounds(self) -> List[float]:
+        return shapely.total_bounds(self.polygons).tolist()
+
+    @cached_property
+    def union_wkt(self) -> str:
+        """WKT of the slightly simplified union, used as the FROST filter."""
+        return shapely.union_all(self.polygons).simplify(1e-6).wkt
+
+    @cached_property
+    def cover_wkt(self) -> Optional[str]:
+        """
+        WKT of the grid cells over the layer bounds that touch a polygon.
+        A coarse but bounded-size filter, much tighter than the bbox for
+        scattered or concave layers. None for degenerate (zero-area) bounds.
+        """
+        minx, miny, maxx, maxy = self.bounds
+        if minx == maxx or miny == maxy:
+            return None
+        xs = np.linspace(minx, maxx, _COVER_GRID_SIZE + 1)
+        ys = np.linspace(miny, maxy, _COVER_GRID_SIZE + 1)
+        x0, y0 = np.meshgrid(xs[:-1], ys[:-1])
+        x1, y1 = np.meshgrid(xs[1:], ys[1:])
+        cells = shapely.box(x0.ravel(), y0.ravel(), x1.ravel(), y1.ravel())
+        touched = _points_in_polygons(cells, self.polygons)
+        return shapely.union_all(cells[touched]).wkt
+
+    @cached_property
+    def bbox_wkt(self) -> str:
+        """
+        WKT of the layer bounds rounded outwards to _BBOX_WKT_DECIMALS
+        decimals, keeping the FROST URL short without dropping sensors on
+        the edge.
+        """
+        scale = 10**_BBOX_WKT_DECIMALS
+        bounds = np.asarray(self.bounds) * scale
+        minx, miny = np.floor(bounds[:2]) / scale
+        maxx, maxy = np.ceil(bounds[2:]) / scale
+        return shapely.to_wkt(
+            shapely.box(minx, miny, maxx, maxy),
+            rounding_precision=_BBOX_WKT_DECIMALS,
+        )
+
+
+def _points_in_polygons(points: np.ndarray, polygons: np.ndarray) -> np.ndarray:
+    """
+    Return the sorted indices of geometries in points intersecting any of
+    the polygons. The tree indexes the points and is queried with the
+    polygons, so the predicate runs on the (prepared) polygons in one bulk
+    GEOS call.
+    """
+    hits = STRtree(points).query(polygons, predicate="intersects")
+    return np.unique(hits[1])
+
+
+def _match_thing_points(
+    things: List[Dict[str, Any]], polygons: Optional[np.ndarray]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Build sensor dicts for things whose first location is a point, keeping
+    only those intersecting the polygons (all of them if polygons is None).
+    Coordinates are read straight into arrays; no geometry per thing.
+    Returns the sensors and the number of things skipped for non-point
+    locations.
+    """
+    kept = []
+    coords = []
+    skipped = 0
+    for thing in things:
+        thing_locations = thing.get("Locations") or []
+        loc_geo = thing_locations[0].get("location") if thing_locations else None
+        if not loc_geo:
+            continue
+        point = loc_geo.get("coordinates")
+        if loc_geo.get("type") != "Point" or not point or len(point) < 2:
+            skipped += 1
+            continue
+        kept.append(thing)
+        coords.append(point[:2])
+
+    if not kept:
+        return [], skipped
+
+    xs, ys = np.asarray(coords, dtype=np.float64).T
+    matched = np.arange(len(kept))
+    if polygons is not None:
+        matched = _points_in_polygons(shapely.points(xs, ys), polygons)
+        xs, ys = xs[matched], ys[matched]
+
+    sensors = [
+        {
+            "id": str(kept[i].get("@iot.id")),
+            "name": kept[i].get("name"),
+            "description": kept[i].get("description"),
+            "latitude": float(y),
+            "longitude": float(x),
+        }
+        for i, x, y in zip(matched, xs, ys)
+    ]
+    return sensors, skipped
+
 
 class DatabaseService:
     """Service for database operations."""
@@ -31,12 +296,18 @@ class DatabaseService:
 
     # GeoServer Operations
     def create_geo_layer(self, layer_data: GeoLayerCreate) -> GeoLayer:
-        """Create a new geospatial layer."""
+        """Create a new geospatial layer, storing its GeoServer extent."""
+        bbox_values = self._get_layer_bbox_values(layer_data.layer_name)
         try:
-            layer = GeoLayer(**layer_data.model_dump())
-            self.db.add(layer)
+            layer = self.db.execute(
+                insert(GeoLayer)
+                .values(**layer_data.model_dump())
+                .values(bbox_values)
+                .returning(GeoLayer)
+            ).scalar_one()
+            # Detach so commit does not expire the RETURNING values
+            self.db.expunge(layer)
             self.db.commit()
-            self.db.refresh(layer)
             logger.info(f"Created geo layer: {layer.layer_name}")
             return layer
         except Exception as e:
@@ -45,10 +316,16 @@ class DatabaseService:
             raise DatabaseException(f"Failed to create geo layer: {e}")
 
     def get_geo_layers(
-        self, workspace: Optional[str] = None, layer_type: Optional[str] = None
+        self,
+        workspace: Optional[str] = None,
+        layer_type: Optional[str] = None,
+        with_features: bool = False,
     ) -> List[GeoLayer]:
         """Get geospatial layers with filtering."""
         query = self.db.query(GeoLayer)
+        if with_features:
+            # One extra IN query for all features instead of a lazy load per layer
+            query = query.options(selectinload(GeoLayer.features))
 
         if workspace:
             query = query.filter(GeoLayer.workspace == workspace)
@@ -58,8 +335,18 @@ class DatabaseService:
         return query.all()
 
     def get_geo_layer(self, layer_name: str) -> Optional[GeoLayer]:
-        """Get a specific geospatial layer."""
+        """
+        Get a specific geospatial layer.
+        Column values are cached for a short TTL and re-attached to the
+        current session without a SELECT on cache hits.
+        """
         try:
+            cached = _geo_layer_cache.get(layer_name)
+            if cached is not None:
+                layer = GeoLayer(**cached)
+                make_transient_to_detached(layer)
+                return self.db.merge(layer, load=False)
+
             layer = (
                 self.db.query(GeoLayer)
                 .filter(GeoLayer.layer_name == layer_name)
@@ -67,6 +354,7 @@ class DatabaseService:
             )
             if not layer:
                 raise ResourceNotFoundException(f"Geo layer '{layer_name}' not found.")
+            _geo_layer_cache.set(layer_name, layer.to_dict())
             return layer
         except Exception as e:
             if isinstance(e, ResourceNotFoundException):
@@ -74,22 +362,51 @@ class DatabaseService:
             logger.error(f"Failed to get geo layer {layer_name}: {e}")
             raise DatabaseException(f"Failed to get geo layer: {e}")
 
+    def get_geo_layer_with_features(self, layer_name: str) -> GeoLayer:
+        """Get a geospatial layer with its features loaded in one extra query."""
+        try:
+            layer = (
+                self.db.query(GeoLayer)
+                .options(selectinload(GeoLayer.features))
+                .filter(GeoLayer.layer_name == layer_name)
+                .first()
+            )
+        except Exception as e:
+            logger.error(f"Failed to get geo layer {layer_name} with features: {e}")
+            raise DatabaseException(f"Failed to get geo layer: {e}")
+        if not layer:
+            raise ResourceNotFoundException(f"Geo layer '{layer_name}' not found.")
+        return layer
+
     def update_geo_layer(
         self, layer_name: str, layer_update: GeoLayerUpdate
     ) -> Optional[GeoLayer]:
-        """Update a geospatial layer."""
+        """Update a geospatial layer and refresh its stored extent."""
+        bbox_values = self._get_layer_bbox_values(layer_name)
         try:
-            layer = self.get_geo_layer(
-                layer_name
-            )  # Will raise ResourceNotFoundException if not found
-
-            update_data = layer_update.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                if hasattr(layer, key):
-                    setattr(layer, key, value)
+            update_data = {
+                key: value
+                for key, value in layer_update.model_dump(exclude_unset=True).items()
+                if key in _GEO_LAYER_COLUMNS
+            }
+            # Single UPDATE ... RETURNING instead of SELECT then UPDATE
+            stmt = (
+                update(GeoLayer)
+                .where(GeoLayer.layer_name == layer_name)
+                .values(**update_data)
+                .values(bbox_values)
+                .returning(GeoLayer)
+                .execution_options(synchronize_session=False)
+            )
+            layer = self.db.execute(stmt).scalar_one_or_none()
+            if not layer:
+                raise ResourceNotFoundException(f"Geo layer '{layer_name}' not found.")
 
+            # Keep the RETURNING values; commit would expire and reload them
+            self.db.expunge(layer)
             self.db.commit()
-            self.db.refresh(layer)
+            _geo_layer_cache.pop(layer_name)
+            _layer_geometry_cache.pop(layer_name)
             logger.info(f"Updated geo layer: {layer_name}")
             return layer
         except (ResourceNotFoundException, DatabaseException):
@@ -102,10 +419,17 @@ class DatabaseService:
     def delete_geo_layer(self, layer_name: str) -> bool:
         """Delete a geospatial layer."""
         try:
-            layer = self.get_geo_layer(layer_name)  # Raises ResourceNotFoundException
+            stmt = (
+                delete(GeoLayer)
+                .where(GeoLayer.layer_name == layer_name)
+                .returning(GeoLayer.id)
+            )
+            if self.db.execute(stmt).scalar_one_or_none() is None:
+                raise ResourceNotFoundException(f"Geo layer '{layer_name}' not found.")
 
-            self.db.delete(layer)
             self.db.commit()
+            _geo_layer_cache.pop(layer_name)
+            _layer_geometry_cache.pop(layer_name)
             logger.info(f"Deleted geo layer: {layer_name}")
             return True
         except (ResourceNotFoundException, DatabaseException):
@@ -118,50 +442,199 @@ class DatabaseService:
     def create_geo_feature(self, feature_data: GeoFeatureCreate) -> GeoFeature:
         """Create a new geospatial feature."""
         try:
-            feature = GeoFeature(**feature_data.model_dump())
-            self.db.add(feature)
+            row = feature_data.model_dump()
+            row["geometry"] = from_shape(shape(row["geometry"]), srid=4326)
+            feature = self.db.execute(
+                insert(GeoFeature).values(**row).returning(GeoFeature)
+            ).scalar_one()
+            self.db.expunge(feature)
             self.db.commit()
-            self.db.refresh(feature)
             return feature
         except Exception as e:
             logger.error(f"Failed to create geo feature: {e}")
             self.db.rollback()
             raise DatabaseException(f"Failed to create geo feature: {e}")
 
-    def get_geo_features(
+    def bulk_create_geo_features(
+        self, features_data: List[GeoFeatureCreate]
+    ) -> List[int]:
+        """Create many geospatial features in a single transaction."""
+        if not features_data:
+            return []
+
+        try:
+            rows = []
+            for feature_data in features_data:
+                row = feature_data.model_dump()
+                row["geometry_geojson"] = json.dumps(row.pop("geometry"))
+                rows.append(row)
+
+            ids = None
+            if len(rows) >= _COPY_MIN_ROWS:
+                ids = self._copy_geo_features(rows)
+            if ids is None:
+                # One executemany; SQLAlchemy batches it into multi-row
+                # INSERT ... RETURNING statements (insertmanyvalues)
+                ids = self.db.execute(_BULK_INSERT_GEO_FEATURES, rows).scalars().all()
+
+            self.db.commit()
+            logger.info(f"Bulk created {len(ids)} geo features")
+            return ids
+        except Exception as e:
+            logger.error(f"Failed to bulk create geo features: {e}")
+            self.db.rollback()
+            raise DatabaseException(f"Failed to bulk create geo features: {e}")
+
+    def _copy_geo_features(self, rows: List[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Load rows with COPY FROM STDIN, skipping per-row statement handling.
+        Geometries are converted to hex EWKB with Shapely in one vectorized
+        pass. Returns the new ids in input order, or None when the DBAPI
+        driver has no COPY support.
+        """
+        cursor = self.db.connection().connection.cursor()
+        try:
+            if not hasattr(cursor, "copy_expert"):
+                return None
+            params = {"n": len(rows)}
+            ids = self.db.execute(_NEXT_GEO_FEATURE_IDS, params).scalars().all()
+            geometries = shapely.to_wkb(
+                shapely.set_srid(
+                    shapely.from_geojson([row["geometry_geojson"] for row in rows]),
+                    4326,
+                ),
+                hex=True,
+                include_srid=True,
+            )
+            columns = [key for key in rows[0] if key != "geometry_geojson"]
+
+            buffer = io.StringIO()
+            for feature_id, row, geometry in zip(ids, rows, geometries):
+                values = [feature_id, *(row[key] for key in columns), geometry]
+                buffer.write("\t".join(map(_copy_field, values)) + "\n")
+            buffer.seek(0)
+
+            cursor.copy_expert(
+                f"COPY geo_features (id, {', '.join(columns)}, geometry) FROM STDIN",
+                buffer,
+            )
+            return ids
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def parse_bbox(bbox: str) -> BBox:
+        """
+        Validate a "min_lon,min_lat,max_lon,max_lat" filter.
+        Raises ValidationException, so bad input is rejected before any query.
+        """
+        try:
+            return _parse_bbox(bbox)
+        except ValueError as e:
+            raise ValidationException(f"Invalid bbox '{bbox}': {e}")
+
+    def _geo_features_query(
         self,
         layer_name: str,
-        skip: int = 0,
-        limit: int = 1000,
         feature_type: Optional[str] = None,
         is_active: Optional[bool] = None,
-        bbox: Optional[str] = None,
-    ) -> List[GeoFeature]:
-        """Get geospatial features with filtering."""
-        query = self.db.query(GeoFeature).filter(GeoFeature.layer_id == layer_name)
+        bbox: Optional[Union[str, BBox]] = None,
+        bbox_only: bool = False,
+        include_geometry: bool = True,
+        columns: Optional[Tuple[Any, ...]] = None,
+    ):
+        """
+        Build the filtered GeoFeature query shared by list and stream reads.
+        With columns, plain rows of those columns are selected instead of
+        GeoFeature entities.
+        """
+        if columns is not None:
+            if not include_geometry:
+                columns = tuple(c for c in columns if c.key != "geometry")
+            query = self.db.query(*columns)
+        else:
+            query = self.db.query(GeoFeature)
+            if not include_geometry:
+                # Skip the geometry blob; raise instead of lazy-loading it per row
+                query = query.options(defer(GeoFeature.geometry, raiseload=True))
+        query = query.filter(GeoFeature.layer_id == layer_name)
 
         if feature_type:
             query = query.filter(GeoFeature.feature_type == feature_type)
         if is_active is not None:
-            query = query.filter(GeoFeature.is_active == str(is_active).lower())
+            query = query.filter(GeoFeature.is_active == is_active)
 
         if bbox:
-            try:
-                # bbox format: min_lon,min_lat,max_lon,max_lat
-                coords = [float(x) for x in bbox.split(",")]
-                if len(coords) == 4:
-                    # Create envelope (SRID 4326)
-                    envelope = func.ST_MakeEnvelope(
-                        coords[0], coords[1], coords[2], coords[3], 4326
-                    )
-                    query = query.filter(
-                        func.ST_Intersects(GeoFeature.geometry, envelope)
-                    )
-            except Exception as e:
-                logger.warning(f"Invalid BBOX format: {bbox}, error: {e}")
+            if isinstance(bbox, str):
+                bbox = self.parse_bbox(bbox)
+            min_x, min_y, max_x, max_y = bbox
+            if bbox_only:
+                query = query.filter(_BBOX_OVERLAPS)
+            else:
+                query = query.filter(_BBOX_OVERLAPS, _BBOX_INTERSECTS)
+            query = query.params(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+
+        return query
 
+    def get_geo_features(
+        self,
+        layer_name: str,
+        skip: int = 0,
+        limit: int = 1000,
+        feature_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        bbox: Optional[Union[str, BBox]] = None,
+        bbox_only: bool = False,
+        include_geometry: bool = True,
+        after_id: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Get geospatial features with filtering.
+        Returns rows of the listed feature columns rather than GeoFeature
+        entities; they expose the same attributes for response models.
+        The bbox filter tests exact intersection; with bbox_only it matches
+        bounding boxes only (index scan, may include false positives).
+        bbox may also be passed already parsed.
+        With include_geometry=False the geometry column is not fetched, for
+        attribute-only listings.
+        With after_id, pages are read by primary-key seek (id > after_id in id
+        order) instead of OFFSET, so deep pages cost the same as the first;
+        skip is then ignored.
+        """
+        query = self._geo_features_query(
+            layer_name,
+            feature_type,
+            is_active,
+            bbox,
+            bbox_only,
+            include_geometry,
+            columns=_GEO_FEATURE_LIST_COLUMNS,
+        )
+        if after_id is not None:
+            query = query.filter(GeoFeature.id > after_id).order_by(GeoFeature.id)
+            return query.limit(limit).all()
         return query.offset(skip).limit(limit).all()
 
+    def iter_geo_features(
+        self,
+        layer_name: str,
+        feature_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        bbox: Optional[Union[str, BBox]] = None,
+        bbox_only: bool = False,
+        batch_size: int = 500,
+        include_geometry: bool = True,
+    ) -> Iterator[GeoFeature]:
+        """
+        Stream geospatial features for exports.
+        Rows are read through a server-side cursor in batches of batch_size,
+        so memory stays bounded regardless of the layer size.
+        """
+        query = self._geo_features_query(
+            layer_name, feature_type, is_active, bbox, bbox_only, include_geometry
+        )
+        yield from query.execution_options(stream_results=True).yield_per(batch_size)
+
     def get_geo_feature(self, feature_id: str, layer_name: str) -> Optional[GeoFeature]:
         """Get a specific geospatial feature."""
         feature = (
@@ -182,15 +655,34 @@ class DatabaseService:
     ) -> Optional[GeoFeature]:
         """Update a geospatial feature."""
         try:
-            feature = self.get_geo_feature(feature_id, layer_name)
-
-            update_data = feature_update.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                if hasattr(feature, key):
-                    setattr(feature, key, value)
+            update_data = {
+                key: value
+                for key, value in feature_update.model_dump(exclude_unset=True).items()
+                if key in _GEO_FEATURE_COLUMNS
+            }
+            if update_data.get("geometry") is not None:
+                update_data["geometry"] = from_shape(
+                    shape(update_data["geometry"]), srid=4326
+                )
+
+            stmt = (
+                update(GeoFeature)
+                .where(
+                    GeoFeature.feature_id == feature_id,
+                    GeoFeature.layer_id == layer_name,
+                )
+                .values(**update_data)
+                .returning(GeoFeature)
+                .execution_options(synchronize_session=False)
+            )
+            feature = self.db.execute(stmt).scalars().first()
+            if not feature:
+                raise ResourceNotFoundException(
+                    f"Feature '{feature_id}' not found in layer '{layer_name}'."
+                )
 
+            self.db.expunge(feature)
             self.db.commit()
-            self.db.refresh(feature)
             return feature
         except (ResourceNotFoundException, DatabaseException):
             raise
@@ -202,9 +694,20 @@ class DatabaseService:
     def delete_geo_feature(self, feature_id: str, layer_name: str) -> bool:
         """Delete a geospatial feature."""
         try:
-            feature = self.get_geo_feature(feature_id, layer_name)
+            stmt = (
+                delete(GeoFeature)
+                .where(
+                    GeoFeature.feature_id == feature_id,
+                    GeoFeature.layer_id == layer_name,
+                )
+                .returning(GeoFeature.id)
+                .execution_options(synchronize_session=False)
+            )
+            if not self.db.execute(stmt).scalars().all():
+                raise ResourceNotFoundException(
+                    f"Feature '{feature_id}' not found in layer '{layer_name}'."
+                )
 
-            self.db.delete(feature)
             self.db.commit()
             return True
         except (ResourceNotFoundException, DatabaseException):
@@ -214,173 +717,223 @@ class DatabaseService:
             self.db.rollback()
             raise DatabaseException(f"Failed to delete geo feature: {e}")
 
+    def _fetch_frost_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single FROST page, returning None on failure.
+        Successful pages are cached briefly by URL, so repeated lookups for the
+        same layer skip the round trips. Failures are not cached.
+        """
+        page = _frost_page_cache.get(url)
+        if page is not None:
+            return page
+
+        try:
+            resp = http_session.get(url, timeout=20)
+            if resp.status_code != 200:
+                logger.error(f"FROST Error: {resp.status_code} {resp.text}")
+                return None
+            page = resp.json()
+            _frost_page_cache.set(url, page)
+            return page
+        except Exception as e:
+            logger.error(f"Error fetching from FROST: {e}")
+            return None
+
+    def _iter_frost_things(
+        self, url: str, max_pages: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield all entities of a FROST collection query, page by page.
+        The first page is requested with $count so the remaining pages can be
+        fetched concurrently via $skip/$top instead of following nextLinks.
+        """
+        first = self._fetch_frost_page(f"{url}&$count=true")
+        if not first:
+            return
+
+        first_things = first.get("value", [])
+        yield from first_things
+        next_link = first.get("@iot.nextLink")
+        total = first.get("@iot.count")
+        page_size = len(first_things)
+
+        if not next_link or not page_size:
+            return
+
+        if total is None:
+            # Server does not report counts: follow nextLinks sequentially
+            page_count = 1
+            while next_link and page_count < max_pages:
+                data = self._fetch_frost_page(next_link)
+                if not data:
+                    break
+                yield from data.get("value", [])
+                next_link = data.get("@iot.nextLink")
+                page_count += 1
+            return
+
+        page_urls = [
+            f"{url}&$top={page_size}&$skip={skip}"
+            for skip in range(page_size, min(total, page_size * max_pages), page_size)
+        ]
+        with ThreadPoolExecutor(max_workers=_FROST_PAGE_WORKERS) as pool:
+            for data in pool.map(self._fetch_frost_page, page_urls):
+                if data:
+                    yield from data.get("value", [])
+
+    def _get_layer_geometries(self, layer_name: str) -> _LayerGeometries:
+        """
+        Get the parsed WFS geometries of a layer, cached for
+        GEOSERVER_WFS_CACHE_TTL seconds. GeoServer errors propagate uncached.
+        """
+        layer = _layer_geometry_cache.get(layer_name)
+        if layer is None:
+            from app.services.geoserver_service import GeoServerService
+
+            geojson_data = GeoServerService().get_wfs_features(layer_name)
+            layer = _LayerGeometries(
+                _feature_geometries(geojson_data.get("features", []))
+            )
+            _layer_geometry_cache.set(layer_name, layer)
+        return layer
+
     def get_sensors_in_layer(self, layer_name: str) -> List[Dict[str, Any]]:
         """
         Get all sensors (Things) that are spatially within the geometry of a layer's features.
         Fetches layer geometry from GeoServer (WFS) and uses FROST OGC Spatial Filters.
         """
-        from app.services.geoserver_service import GeoServerService
-
-        # 1. Fetch features from GeoServer WFS
+        # 1-2. Layer geometries from GeoServer WFS (cached per layer)
         try:
-            gs_service = GeoServerService()
-            geojson_data = gs_service.get_wfs_features(layer_name)
-            features = geojson_data.get("features", [])
+            layer = self._get_layer_geometries(layer_name)
         except Exception as e:
             logger.error(f"Failed to fetch layer {layer_name} from GeoServer: {e}")
             return []
 
-        if not features:
+        if layer.polygons.size == 0:
             logger.warning(f"No features found in layer {layer_name} from GeoServer.")
             return []
 
         try:
-            # 2. Build geometries from GeoJSON
-            polygons = []
-            for f in features:
-                try:
-                    geom = f.get("geometry")
-                    if geom:
-                        s = shape(geom)
-                        polygons.append(s)
-                except Exception as ex:
-                    fid = f.get("id", "unknown")
-                    logger.warning(f"Skipping invalid geometry in feature {fid}: {ex}")
-
-            if not polygons:
-                return []
-
-            # 3. Calculate BBOX for FROST Optimization
-            # Union all polygons to get the total bounds
-            from shapely.ops import unary_union
-
-            combined = unary_union(polygons)
-            minx, miny, maxx, maxy = combined.bounds
-
-            # 4. Fetch Things from FROST using Spatial Filter (BBOX)
+            # 3. Build the FROST spatial filter. Small layers send the exact
+            # union so FROST/PostGIS does the precise check server-side; large
+            # ones fall back to the bbox plus a local R-tree check.
             frost_url = settings.frost_url
             if not frost_url:
                 logger.warning("FROST_URL not set, cannot retrieve sensors.")
                 return []
 
-            next_link = f"{frost_url}/Things?$expand=Locations"
-
-            # Construct WKT Polygon for BBOX
-            wkt_polygon = f"POLYGON(({minx} {miny}, {maxx} {miny}, {maxx} {maxy}, {minx} {maxy}, {minx} {miny}))"
+            max_chars = settings.frost_filter_max_wkt_chars
+            precise = len(layer.union_wkt) <= max_chars
+            if precise:
+                filter_wkt = layer.union_wkt
+            elif layer.cover_wkt and len(layer.cover_wkt) <= max_chars:
+                filter_wkt = layer.cover_wkt
+            else:
+                filter_wkt = layer.bbox_wkt
 
-            # Append filter to FROST request
-            filter_param = (
-                f"st_intersects(Locations/location, geography'{wkt_polygon}')"
-            )
-            next_link += f"&$filter={filter_param}"
+            # 4. Fetch Things from FROST using the spatial filter
+            things_url = f"{frost_url}/Things?$expand=Locations"
+            filter_param = f"st_intersects(Locations/location, geography'{filter_wkt}')"
+            things_url += f"&$filter={filter_param}"
 
             logger.debug(
-                f"Using spatial optimization for layer {layer_name}. WKT: {wkt_polygon}"
+                f"Using spatial optimization for layer {layer_name} "
+                f"(precise={precise}). WKT: {filter_wkt}"
             )
 
+            # Match things batch by batch as pages arrive, so only the
+            # matches are kept rather than every expanded thing
+            refine_with = None if precise else layer.polygons
             sensors = []
-
-            # Safety limit for pages
-            page_count = 0
-            max_pages = 50
-
-            while next_link and page_count < max_pages:
-                try:
-                    resp = requests.get(next_link, timeout=20)
-                    if resp.status_code != 200:
-                        logger.error(f"FROST Error: {resp.status_code} {resp.text}")
-                        break
-
-                    data = resp.json()
-                    things = data.get("value", [])
-                    next_link = data.get("@iot.nextLink")
-                    page_count += 1
-
-                    for thing in things:
-                        locations = thing.get("Locations", [])
-                        if not locations:
-                            continue
-
-                        # Use first location
-                        loc_entity = locations[0]
-                        loc_geo = loc_entity.get("location")
-
-                        if not loc_geo:
-                            continue
-
-                        # Parse GeoJSON location
-                        try:
-                            # Shapely shape from dict
-                            thing_point = shape(loc_geo)
-
-                            # Check intersection with ANY layer polygon (Precise check)
-                            match = False
-                            for poly in polygons:
-                                if poly.intersects(thing_point):
-                                    match = True
-                                    break
-
-                            if match:
-                                sensors.append(
-                                    {
-                                        "id": str(thing.get("@iot.id")),
-                                        "name": thing.get("name"),
-                                        "description": thing.get("description"),
-                                        "latitude": thing_point.y,
-                                        "longitude": thing_point.x,
-                                    }
-                                )
-                        except Exception as ex:
-                            logger.warning(
-                                f"Failed to parse location for thing {thing.get('@iot.id')}: {ex}"
-                            )
-                            continue
-
-                except Exception as e:
-                    logger.error(f"Error fetching from FROST: {e}")
-                    break
-
+            skipped = 0
+            things = self._iter_frost_things(things_url)
+            while batch := list(islice(things, _SENSOR_MATCH_BATCH_SIZE)):
+                matches, batch_skipped = _match_thing_points(batch, refine_with)
+                sensors.extend(matches)
+                skipped += batch_skipped
+
+            if skipped:
+                logger.warning(f"Skipping {skipped} things without a point location")
             return sensors
 
         except Exception as e:
             logger.error(f"Failed to process sensors in layer {layer_name}: {e}")
             raise DatabaseException(f"Failed to get sensors in layer: {e}")
 
+    def _fetch_bounds(self, stmt) -> Optional[List[float]]:
+        """Run a one-row [minx, miny, maxx, maxy] query; None if empty."""
+        row = self.db.execute(stmt).first()
+        # Aggregates and unset columns are NULL for all four values together
+        if row is None or row[0] is None:
+            return None
+        return list(row)
+
+    def _get_stored_layer_bbox(self, layer_name: str) -> Optional[List[float]]:
+        """Get the extent persisted on the GeoLayer row, if any."""
+        return self._fetch_bounds(
+            select(*_LAYER_BBOX_COLUMNS).where(GeoLayer.layer_name == layer_name)
+        )
+
+    def _get_layer_bbox_values(self, layer_name: str) -> Dict[Any, Optional[float]]:
+        """
+        Extent column values for a layer write, from the bounds GeoServer
+        stores for the layer. All None when GeoServer has none, so
+        get_layer_bbox falls back to computing the extent at read time.
+        """
+        from app.services.geoserver_service import GeoServerService
+
+        bounds = GeoServerService().get_layer_bounds(layer_name)
+        return dict(zip(_LAYER_BBOX_COLUMNS, bounds or [None] * 4))
+
+    def _get_local_layer_extent(self, layer_name: str) -> Optional[List[float]]:
+        """
+        Get the extent of a layer stored in geo_features, computed by PostGIS.
+        Returns: [minx, miny, maxx, maxy] or None if the layer has no features
+        """
+        extent = func.ST_Extent(GeoFeature.geometry)
+        try:
+            return self._fetch_bounds(
+                select(
+                    func.ST_XMin(extent),
+                    func.ST_YMin(extent),
+                    func.ST_XMax(extent),
+                    func.ST_YMax(extent),
+                ).where(GeoFeature.layer_id == layer_name)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to compute local extent for {layer_name}: {e}")
+            return None
+
     def get_layer_bbox(self, layer_name: str) -> Optional[List[float]]:
         """
-        Get the bounding box of a layer from GeoServer WFS data.
+        Get the bounding box of a layer.
+        Reads the extent stored on the layer row by create_geo_layer and
+        update_geo_layer, then the bounds GeoServer stores for the layer,
+        then the extent of local features, and only falls back to
+        downloading the WFS features if none are available. Nothing is
+        written here; an update of the layer refreshes the stored extent.
         Returns: [minx, miny, maxx, maxy] or None
         """
         from app.services.geoserver_service import GeoServerService
 
         try:
-            gs_service = GeoServerService()
-            geojson_data = gs_service.get_wfs_features(layer_name)
-            features = geojson_data.get("features", [])
+            bounds = self._get_stored_layer_bbox(layer_name)
+            if bounds:
+                return bounds
 
-            if not features:
-                return None
+            bounds = GeoServerService().get_layer_bounds(layer_name)
+            if bounds:
+                return bounds
 
-            polygons = []
-            for f in features:
-                geom = f.get("geometry")
-                if geom:
-                    try:
-                        s = shape(geom)
-                        polygons.append(s)
-                    except Exception as ex:
-                        fid = f.get("id", "unknown")
-                        logger.warning(
-                            f"Skipping invalid geometry for bbox calc in feature {fid}: {ex}"
-                        )
-
-            if not polygons:
-                return None
+            bounds = self._get_local_layer_extent(layer_name)
+            if bounds:
+                return bounds
 
-            from shapely.ops import unary_union
+            layer = self._get_layer_geometries(layer_name)
+            if layer.polygons.size == 0:
+                return None
 
-            combined = unary_union(polygons)
-            return list(combined.bounds)
+            return layer.bounds
 
         except Exception as e:
             logger.error(f"Failed to calculate bbox for {layer_name} from WFS: {e}")
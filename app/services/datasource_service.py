@@ -1,38 +1,71 @@
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy import create_engine, text
+from cryptography.fernet import InvalidToken
+from sqlalchemy import Row, TextClause, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session
 
 from app.models.datasource import DataSource
-from app.schemas.datasource import DataSourceCreate, DataSourceUpdate
+from app.schemas.datasource import PASSWORD_MASK, DataSourceCreate, DataSourceUpdate
 from app.services.encryption_service import encryption_service
+from app.services.engine_pool import SQL_DATASOURCE_TYPES, engine_registry
 
 logger = logging.getLogger(__name__)
 
+# Server-side bound on the connection test query (milliseconds)
+_TEST_STATEMENT_TIMEOUT_MS = 2000
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(query: str) -> TextClause:
+    """
+    Parse raw SQL into a reusable TextClause.
+    Only pays off for repeated query text; SQL with inlined literal values
+    is a new cache entry on every call.
+    """
+    return text(query)
+
+
+def _encrypt_conn(conn_details: Dict[str, Any]) -> Dict[str, Any]:
+    """Encrypt the password of connection details in place, if present."""
+    if "password" in conn_details:
+        conn_details["password"] = encryption_service.encrypt(conn_details["password"])
+    return conn_details
+
 
 class DataSourceService:
     def __init__(self, db: Session):
         self.db = db
 
     def get(self, datasource_id: UUID) -> Optional[DataSource]:
-        return self.db.query(DataSource).filter(DataSource.id == datasource_id).first()
+        return self.db.execute(
+            select(DataSource).where(DataSource.id == datasource_id)
+        ).scalar_one_or_none()
 
     def get_by_project(self, project_id: UUID) -> List[DataSource]:
         return (
-            self.db.query(DataSource).filter(DataSource.project_id == project_id).all()
+            self.db.execute(
+                select(DataSource).where(DataSource.project_id == project_id)
+            )
+            .scalars()
+            .all()
         )
 
+    def list_summary(self, project_id: UUID) -> List[Row]:
+        """(id, name, type) rows of a project's datasources, without details."""
+        return self.db.execute(
+            select(DataSource.id, DataSource.name, DataSource.type).where(
+                DataSource.project_id == project_id
+            )
+        ).all()
+
     def create(self, project_id: UUID, schema: DataSourceCreate) -> DataSource:
         data = schema.model_dump()
-        conn_details = data.get("connection_details", {})
-
-        # Encrypt password if present
-        if "password" in conn_details:
-            conn_details["password"] = encryption_service.encrypt(
-                conn_details["password"]
-            )
+        conn_details = _encrypt_conn(data.get("connection_details", {}))
 
         datasource = DataSource(
             project_id=project_id,
@@ -40,10 +73,30 @@ class DataSourceService:
             type=data["type"],
             connection_details=conn_details,
         )
-        self.db.add(datasource)
+        return datasource.save_new(self.db)
+
+    def bulk_create(
+        self, project_id: UUID, schemas: List[DataSourceCreate]
+    ) -> List[UUID]:
+        """Create many datasources with one multi-row INSERT ... RETURNING."""
+        if not schemas:
+            return []
+        rows = [
+            {
+                "project_id": project_id,
+                "name": schema.name,
+                "type": schema.type,
+                "connection_details": _encrypt_conn(dict(schema.connection_details)),
+            }
+            for schema in schemas
+        ]
+        ids = (
+            self.db.execute(insert(DataSource).returning(DataSource.id), rows)
+            .scalars()
+            .all()
+        )
         self.db.commit()
-        self.db.refresh(datasource)
-        return datasource
+        return ids
 
     def update(
         self, datasource_id: UUID, schema: DataSourceUpdate
@@ -56,24 +109,36 @@ class DataSourceService:
 
         if "connection_details" in data:
             conn_details = data["connection_details"]
-            # Encrypt password if present
-            if "password" in conn_details:
-                conn_details["password"] = encryption_service.encrypt(
-                    conn_details["password"]
-                )
+            existing_password = datasource.connection_details.get("password", "")
+            password = conn_details.get("password")
+            if password is None or password == PASSWORD_MASK:
+                # Clients echo back the masked details they were sent; keep
+                # the stored password rather than saving the mask
+                if existing_password:
+                    conn_details["password"] = existing_password
+                else:
+                    conn_details.pop("password", None)
+            elif (
+                password
+                and password != existing_password
+                and not encryption_service.is_token(password)
+            ):
+                # Already-encrypted tokens must not be encrypted a second time
+                conn_details["password"] = encryption_service.encrypt(password)
             # Merge with existing details if needed, but here we replace for simplicity or deep merge?
             # Usually simple replace is safer for simplicity unless partial update is required deep inside JSON.
             # We will replace the whole dict as per standard REST PUT/PATCH on 'connection_details' field.
+            if conn_details.get("password") != existing_password:
+                encryption_service.invalidate(existing_password)
             datasource.connection_details = conn_details
+            engine_registry.invalidate(datasource.id)
 
         if "name" in data:
             datasource.name = data["name"]
         if "type" in data:
             datasource.type = data["type"]
 
-        self.db.commit()
-        self.db.refresh(datasource)
-        return datasource
+        return datasource.save_changes(self.db)
 
     def delete(self, datasource_id: UUID) -> bool:
         datasource = self.get(datasource_id)
@@ -81,6 +146,8 @@ class DataSourceService:
             return False
         self.db.delete(datasource)
         self.db.commit()
+        encryption_service.invalidate(datasource.connection_details.get("password", ""))
+        engine_registry.invalidate(datasource_id)
         return True
 
     def test_connection(self, datasource: DataSource) -> bool:
@@ -88,28 +155,25 @@ class DataSourceService:
         Test connection to the datasource.
         Currently supports Postgres databases.
         """
-        details = datasource.connection_details
-
-        if datasource.type in ["POSTGRES", "GEOSERVER", "TIMEIO"]:
+        if datasource.type in SQL_DATASOURCE_TYPES:
             # Assume all are Postgres for now based on requirements
-            host = details.get("host", "localhost")
-            port = details.get("port", 5432)
-            user = details.get("user", "postgres")
-            dbname = details.get("database", "postgres")
-            password_encrypted = details.get("password", "")
-
-            password = encryption_service.decrypt(password_encrypted)
-
-            # Construct connection string
-            # Minimalistic approach: use sqlalchemy create_engine to test
-            dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
-
             try:
-                engine = create_engine(dsn)
+                engine = engine_registry.get_or_create(datasource)
+            except InvalidToken:
+                logger.error(
+                    f"Stored password of datasource {datasource.id} cannot be decrypted"
+                )
+                return False
+            try:
                 with engine.connect() as conn:
-                    conn.execute(text("SELECT 1"))
+                    conn.execute(
+                        text(
+                            f"SET LOCAL statement_timeout = {_TEST_STATEMENT_TIMEOUT_MS}"
+                        )
+                    )
+                    conn.execute(text("SELECT 1")).scalar()
                 return True
-            except Exception as e:
+            except (DBAPIError, PoolTimeoutError) as e:
                 logger.error(
                     f"Connection test failed for datasource {datasource.id}: {e}"
                 )
@@ -117,40 +181,36 @@ class DataSourceService:
 
         return False
 
-    def execute_query(self, datasource: DataSource, query: str) -> Dict[str, Any]:
+    def execute_query(
+        self,
+        datasource: DataSource,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a raw SQL query on the datasource.
+        Values passed in params are bound to :name placeholders, so repeated
+        query templates share one parsed statement.
         WARNING: This allows arbitrary SQL execution. Ensure caller has permissions.
         """
-        details = datasource.connection_details
-
         # Only support Postgres/Timescale/PostGIS
-        if datasource.type in ["POSTGRES", "GEOSERVER", "TIMEIO"]:
-            host = details.get("host", "localhost")
-            port = details.get("port", 5432)
-            user = details.get("user", "postgres")
-            dbname = details.get("database", "postgres")
-            password_encrypted = details.get("password", "")
-
-            password = encryption_service.decrypt(password_encrypted)
-
-            # Construct connection string
-            dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
-
+        if datasource.type in SQL_DATASOURCE_TYPES:
             try:
-                engine = create_engine(dsn)
+                engine = engine_registry.get_or_create(datasource)
                 with engine.connect() as conn:
                     # Execute using text() which is safer than raw string execution if bound params were used,
                     # but here the query itself comes from the user.
                     # We assume the VALIDATION happens at the API layer or the user is trusted admin.
                     # Ideally we should use bind parameters if the query was static.
                     # Since it's a raw query tool, we can at least use text() wrapper correctly.
-                    result = conn.execute(text(query))
+                    result = conn.execute(_compile(query), params or {})
 
                     # Fetch results if it's a SELECT (returns rows)
                     if result.returns_rows:
                         keys = list(result.keys())
-                        rows = [dict(zip(keys, row)) for row in result.fetchall()]
+                        # RowMappings are built by the driver layer; one dict
+                        # copy each instead of a zip + dict per row
+                        rows = [dict(m) for m in result.mappings()]
                         return {"columns": keys, "rows": rows, "status": "success"}
                     else:
                         # Commit if it was a data modification (INSERT/UPDATE/DELETE)
@@ -168,3 +228,32 @@ class DataSourceService:
                 raise Exception(f"Query failed: {str(e)}")
 
         raise Exception(f"Unsupported datasource type: {datasource.type}")
+
+    def stream_query(
+        self,
+        datasource: DataSource,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a raw SQL query and yield result rows as lists of dicts.
+        params are bound to :name placeholders as in execute_query.
+        Rows are read through a server-side cursor and yielded in batches of
+        up to batch_size, so large results are never held in memory.
+        Statements that return no rows are committed and yield nothing.
+        WARNING: This allows arbitrary SQL execution. Ensure caller has permissions.
+        """
+        if datasource.type not in SQL_DATASOURCE_TYPES:
+            raise Exception(f"Unsupported datasource type: {datasource.type}")
+
+        engine = engine_registry.get_or_create(datasource)
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(_compile(query), params or {})
+            if not result.returns_rows:
+                conn.commit()
+                return
+            for batch in result.mappings().partitions():
+                yield [dict(row) for row in batch]
@@ -1,7 +1,8 @@
 import logging
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -27,15 +28,41 @@ class EncryptionService:
         except Exception as e:
             raise ValueError(f"Invalid ENCRYPTION_KEY: {e}")
 
+        # Plaintexts by token; the same stored secrets are decrypted on every
+        # datasource call, each costing an HMAC check and an AES decryption
+        self._decrypted = TTLCache(maxsize=1024, ttl=300)
+        self._fernet_encrypt = self.fernet.encrypt
+        self._fernet_decrypt = self.fernet.decrypt
+
     def encrypt(self, data: str) -> str:
         if not data:
             return ""
-        return self.fernet.encrypt(data.encode()).decode()
+        # Tokens are base64url, so the ASCII codec is enough on the way out
+        return self._fernet_encrypt(data.encode()).decode("ascii")
 
     def decrypt(self, token: str) -> str:
         if not token:
             return ""
-        return self.fernet.decrypt(token.encode()).decode()
+        plaintext = self._decrypted.get(token)
+        if plaintext is None:
+            plaintext = self._fernet_decrypt(token.encode()).decode()
+            self._decrypted.set(token, plaintext)
+        return plaintext
+
+    def is_token(self, data: str) -> bool:
+        """Whether data is already a token issued under the current key."""
+        if not data:
+            return False
+        try:
+            self.fernet.extract_timestamp(data.encode())
+        except (InvalidToken, ValueError):
+            return False
+        return True
+
+    def invalidate(self, token: str) -> None:
+        """Forget the cached plaintext of a token that is no longer stored."""
+        if token:
+            self._decrypted.pop(token)
 
 
 encryption_service = EncryptionService()
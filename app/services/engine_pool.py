@@ -0,0 +1,143 @@
+"""
+Registry of pooled SQLAlchemy engines for external datasources.
+"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Tuple
+from uuid import UUID
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.datasource import DataSource
+from app.services.encryption_service import encryption_service
+
+logger = logging.getLogger(__name__)
+
+# Datasource types reachable through a Postgres engine
+SQL_DATASOURCE_TYPES = ("POSTGRES", "GEOSERVER", "TIMEIO")
+
+# Unreachable hosts fail after this many seconds instead of the OS TCP timeout
+_CONNECT_TIMEOUT_S = 3
+# Seconds to wait for a free pooled connection before giving up
+_POOL_TIMEOUT_S = 5
+# Upper bound on concurrent connections opened during warmup
+_WARMUP_WORKERS = 8
+
+
+def build_dsn(details: Dict[str, Any]) -> URL:
+    """Build the Postgres URL for stored connection details."""
+    return URL.create(
+        "postgresql",
+        username=details.get("user", "postgres"),
+        password=encryption_service.decrypt(details.get("password", "")),
+        host=details.get("host", "localhost"),
+        port=details.get("port", 5432),
+        database=details.get("database", "postgres"),
+    )
+
+
+class EngineRegistry:
+    """
+    Pooled engines per datasource id, paired with the hash of the DSN they
+    were built from so changed connection details get a fresh pool.
+    Connections are reused across requests instead of paying the TCP, TLS
+    and auth handshake on every call.
+    """
+
+    def __init__(self):
+        self.engines: Dict[UUID, Tuple[str, Engine]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, datasource: DataSource) -> Engine:
+        """Return the pooled engine for a datasource, creating it on first use."""
+        dsn = build_dsn(datasource.connection_details or {})
+        dsn_hash = hashlib.sha256(
+            dsn.render_as_string(hide_password=False).encode()
+        ).hexdigest()
+        with self._lock:
+            cached = self.engines.get(datasource.id)
+            if cached and cached[0] == dsn_hash:
+                return cached[1]
+            engine = create_engine(
+                dsn,
+                poolclass=QueuePool,
+                pool_size=settings.datasource_pool_size,
+                max_overflow=settings.datasource_max_overflow,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                pool_timeout=_POOL_TIMEOUT_S,
+                connect_args={"connect_timeout": _CONNECT_TIMEOUT_S},
+            )
+            self.engines[datasource.id] = (dsn_hash, engine)
+        if cached:
+            cached[1].dispose()
+        return engine
+
+    def invalidate(self, datasource_id: UUID) -> None:
+        """Drop the cached engine of a datasource and close its connections."""
+        with self._lock:
+            cached = self.engines.pop(datasource_id, None)
+        if cached:
+            cached[1].dispose()
+
+    def clear(self) -> None:
+        """Dispose every cached engine."""
+        with self._lock:
+            cached = list(self.engines.values())
+            self.engines.clear()
+        for _, engine in cached:
+            engine.dispose()
+
+    def _warm(self, datasource: DataSource) -> bool:
+        try:
+            with self.get_or_create(datasource).connect() as conn:
+                conn.execute(text("SELECT 1")).scalar()
+            return True
+        except (InvalidToken, DBAPIError, PoolTimeoutError) as e:
+            logger.warning(f"Warmup failed for datasource {datasource.id}: {e}")
+            return False
+
+    def warmup(self, datasources: Iterable[DataSource]) -> int:
+        """
+        Open one pooled connection per SQL datasource in parallel so the
+        first real query does not pay the handshake.
+        Failures are logged and skipped. Returns the number of warm engines.
+        """
+        targets = [ds for ds in datasources if ds.type in SQL_DATASOURCE_TYPES]
+        if not targets:
+            return 0
+        with ThreadPoolExecutor(
+            max_workers=min(_WARMUP_WORKERS, len(targets))
+        ) as executor:
+            warmed = sum(executor.map(self._warm, targets))
+        logger.info(f"Warmed {warmed}/{len(targets)} datasource engines")
+        return warmed
+
+
+engine_registry = EngineRegistry()
+
+
+def warmup_datasources() -> int:
+    """
+    Warm the engines of every stored datasource.
+    Runs at startup off the event loop; errors are logged, never raised.
+    """
+    db = SessionLocal()
+    try:
+        datasources = db.query(DataSource).all()
+    except SQLAlchemyError as e:
+        logger.warning(f"Skipping datasource warmup: {e}")
+        return 0
+    finally:
+        db.close()
+    return engine_registry.warmup(datasources)
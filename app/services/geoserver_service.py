@@ -3,14 +3,17 @@ GeoServer integration service for geospatial data management.
 """
 
 import logging
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
 
 import requests
 from requests.auth import HTTPBasicAuth
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.exceptions import GeoServerException
+from app.core.http_client import http_session
 from app.schemas.geospatial import (
     GeoServerLayerInfo,
     LayerPublishRequest,
@@ -18,6 +21,24 @@ from app.schemas.geospatial import (
 
 logger = logging.getLogger(__name__)
 
+# Fixed parts of the OGC request URLs built by the service
+_WMS_GETMAP_PARAMS = {
+    "service": "WMS",
+    "version": "1.3.0",
+    "request": "GetMap",
+}
+_WFS_GETFEATURE_PARAMS = {
+    "service": "WFS",
+    "version": "2.0.0",
+    "request": "GetFeature",
+}
+# Characters left readable in generated query strings
+_URL_SAFE_CHARS = ":,/"
+
+# Successful REST lookups and capability checks by URL; workspaces, stores
+# and layers rarely change, and every write through this service clears it
+_rest_get_cache = TTLCache(maxsize=1024, ttl=60)
+
 
 class GeoServerService:
     """Service for GeoServer operations."""
@@ -36,23 +57,45 @@ class GeoServerService:
         self.wcs_url = f"{self.base_url}/wcs"
 
     def _make_request(
-        self, method: str, endpoint: str, check_status: bool = True, **kwargs
+        self,
+        method: str,
+        endpoint: str,
+        check_status: bool = True,
+        cached: bool = False,
+        **kwargs,
     ) -> requests.Response:
-        """Make HTTP request to GeoServer."""
+        """
+        Make HTTP request to GeoServer.
+        With cached=True, a GET is answered from the last 200 response for the
+        same URL if it is still fresh. Any other method drops cached lookups.
+        """
         endpoint = endpoint.lstrip("/")
         url = f"{self.rest_url}/{endpoint}"
         kwargs.setdefault("auth", self.auth)
         kwargs.setdefault("headers", {"Content-Type": "application/json"})
         kwargs.setdefault("timeout", settings.geoserver_timeout)
 
+        if cached and method == "GET":
+            response = _rest_get_cache.get(url)
+            if response is not None:
+                return response
+
         try:
-            response = requests.request(method, url, **kwargs)
+            response = http_session.request(method, url, **kwargs)
+            if method != "GET":
+                _rest_get_cache.clear()
+            elif cached and response.status_code == 200:
+                _rest_get_cache.set(url, response)
             if check_status:
                 response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
             logger.error(f"GeoServer request failed: {e}")
-            raise GeoServerException(f"GeoServer request failed: {e}")
+            status_code = getattr(e.response, "status_code", None)
+            raise GeoServerException(
+                f"GeoServer request failed: {e}",
+                details={"status_code": status_code} if status_code else None,
+            )
 
     def test_connection(self) -> bool:
         """Test connection to GeoServer."""
@@ -67,30 +110,49 @@ class GeoServerService:
             logger.error(f"Failed to connect to GeoServer: {e}")
             return False
 
+    def _exists_key(self, endpoint: str) -> Tuple[str, str]:
+        return ("exists", f"{self.rest_url}/{endpoint.lstrip('/')}")
+
+    def _create_resource(
+        self, collection: str, resource: str, payload: Dict[str, Any]
+    ) -> bool:
+        """
+        Create a REST resource with a single POST.
+        Returns True if it was created and False if it already existed.
+        A duplicate is recognised by 409; any other failure is confirmed with
+        a GET before giving up, as older GeoServers answer duplicates with 500.
+        """
+        response = self._make_request(
+            "POST", collection, check_status=False, json=payload
+        )
+        if 200 <= response.status_code < 300:
+            created = True
+        elif response.status_code == 409:
+            created = False
+        elif self._make_request("GET", resource, check_status=False).status_code == 200:
+            created = False
+        else:
+            response.raise_for_status()
+            raise GeoServerException(
+                f"Unexpected status {response.status_code} creating {resource}"
+            )
+        _rest_get_cache.set(self._exists_key(resource), True)
+        return created
+
     def create_workspace(self, workspace_name: str = None) -> bool:
         """Create workspace if it doesn't exist."""
         workspace_name = workspace_name or self.workspace
+        resource = f"/workspaces/{workspace_name}.json"
+        if _rest_get_cache.get(self._exists_key(resource)):
+            return True
 
         try:
-            # Check if workspace exists
-            resp = self._make_request(
-                "GET", f"/workspaces/{workspace_name}.json", check_status=False
-            )
-            if resp.status_code == 200:
-                logger.info(f"Workspace {workspace_name} already exists")
-                return True
-            elif resp.status_code == 404:
-                # Workspace doesn't exist, create it
-                workspace_data = {
-                    "workspace": {"name": workspace_name, "isolated": False}
-                }
-
-                self._make_request("POST", "/workspaces.json", json=workspace_data)
+            workspace_data = {"workspace": {"name": workspace_name, "isolated": False}}
+            if self._create_resource("/workspaces.json", resource, workspace_data):
                 logger.info(f"Created workspace: {workspace_name}")
-                return True
             else:
-                resp.raise_for_status()
-                return False
+                logger.info(f"Workspace {workspace_name} already exists")
+            return True
         except Exception as e:
             raise GeoServerException(f"Failed to check/create workspace: {e}")
 
@@ -100,55 +162,35 @@ class GeoServerService:
         store_type: str = "postgis",
         connection_params: Dict[str, Any] = None,
     ) -> bool:
-        """Create data store."""
-        try:
-            # Check if store exists
-            resp = self._make_request(
-                "GET",
-                f"/workspaces/{self.workspace}/datastores/{store_name}.json",
-                check_status=False,
-            )
-            if resp.status_code == 200:
-                logger.info(
-                    f"Data store {store_name} already exists. Updating configuration..."
-                )
-                # Update existing store
-                store_data = {
-                    "dataStore": {
-                        "name": store_name,
-                        "type": store_type,
-                        "enabled": True,
-                        "connectionParameters": connection_params or {},
-                    }
-                }
-                self._make_request(
-                    "PUT",
-                    f"/workspaces/{self.workspace}/datastores/{store_name}.json",
-                    json=store_data,
-                )
-                logger.info(f"Updated data store: {store_name}")
-                return True
-            elif resp.status_code == 404:
-                # Store doesn't exist, create it
-                store_data = {
-                    "dataStore": {
-                        "name": store_name,
-                        "type": store_type,
-                        "enabled": True,
-                        "connectionParameters": connection_params or {},
-                    }
-                }
+        """Create data store, or update its configuration if it exists."""
+        resource = f"/workspaces/{self.workspace}/datastores/{store_name}.json"
+        store_data = {
+            "dataStore": {
+                "name": store_name,
+                "type": store_type,
+                "enabled": True,
+                "connectionParameters": connection_params or {},
+            }
+        }
 
-                self._make_request(
-                    "POST",
+        try:
+            if not _rest_get_cache.get(self._exists_key(resource)):
+                if self._create_resource(
                     f"/workspaces/{self.workspace}/datastores.json",
-                    json=store_data,
-                )
-                logger.info(f"Created data store: {store_name}")
-                return True
-            else:
-                resp.raise_for_status()
-                return False
+                    resource,
+                    store_data,
+                ):
+                    logger.info(f"Created data store: {store_name}")
+                    return True
+
+            logger.info(
+                f"Data store {store_name} already exists. Updating configuration..."
+            )
+            self._make_request("PUT", resource, json=store_data)
+            # The PUT dropped cached lookups; the store is still there
+            _rest_get_cache.set(self._exists_key(resource), True)
+            logger.info(f"Updated data store: {store_name}")
+            return True
         except Exception as e:
             raise GeoServerException(f"Failed to check/create datastore: {e}")
 
@@ -342,7 +384,7 @@ class GeoServerService:
 
         try:
             response = self._make_request(
-                "GET", f"/workspaces/{workspace}/layers/{layer_name}.json"
+                "GET", f"/workspaces/{workspace}/layers/{layer_name}.json", cached=True
             )
             layer_data = response.json()
 
@@ -363,11 +405,41 @@ class GeoServerService:
             logger.error(f"Failed to get layer info for {layer_name}: {e}")
             raise GeoServerException(f"Failed to get layer info: {e}")
 
+    def get_layer_bounds(
+        self, layer_name: str, workspace: str = None
+    ) -> Optional[List[float]]:
+        """
+        Get the precomputed lat/lon bounds of a feature type from the REST API.
+        Returns: [minx, miny, maxx, maxy] or None
+        """
+        workspace = workspace or self.workspace
+
+        try:
+            response = self._make_request(
+                "GET",
+                f"/workspaces/{workspace}/featuretypes/{layer_name}.json",
+                cached=True,
+            )
+            bbox = response.json()["featureType"]["latLonBoundingBox"]
+            return [
+                float(bbox["minx"]),
+                float(bbox["miny"]),
+                float(bbox["maxx"]),
+                float(bbox["maxy"]),
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to get bounds for {layer_name}: {e}")
+            return None
+
     def get_layer_capabilities(
         self, layer_name: str, workspace: str = None
     ) -> Dict[str, Any]:
         """Get layer capabilities (WMS/WFS)."""
         workspace = workspace or self.workspace
+        cache_key = ("capabilities", workspace, layer_name)
+        capabilities = _rest_get_cache.get(cache_key)
+        if capabilities is not None:
+            return capabilities
 
         try:
             # WMS GetCapabilities
@@ -378,7 +450,7 @@ class GeoServerService:
                 "layers": f"{workspace}:{layer_name}",
             }
 
-            response = requests.get(
+            response = http_session.get(
                 self.wms_url,
                 params=wms_params,
                 auth=self.auth,
@@ -386,8 +458,9 @@ class GeoServerService:
             )
             response.raise_for_status()
 
-            # Parse XML response
-            ET.fromstring(response.content)
+            # Only WMS availability is reported; the formats and SRS below are
+            # what this deployment serves, so the capabilities document is not
+            # parsed
             capabilities = {
                 "wms_available": True,
                 "wms_url": self.wms_url,
@@ -396,6 +469,7 @@ class GeoServerService:
                 "srs": ["EPSG:4326", "EPSG:3857"],
             }
 
+            _rest_get_cache.set(cache_key, capabilities)
             return capabilities
         except Exception as e:
             logger.error(f"Failed to get capabilities for layer {layer_name}: {e}")
@@ -406,21 +480,33 @@ class GeoServerService:
         workspace = workspace or self.workspace
 
         try:
-            response = self._make_request("GET", f"/workspaces/{workspace}/layers.json")
+            response = self._make_request(
+                "GET", f"/workspaces/{workspace}/layers.json", cached=True
+            )
             layers_data = response.json()
 
-            layers = []
             layers_list = layers_data.get("layers", {})
             if not layers_list:
                 return []
 
-            for layer_info in layers_list.get("layer", []):
-                layer_name = layer_info["name"]
-                layer_details = self.get_layer_info(layer_name, workspace)
-                if layer_details:
-                    layers.append(layer_details)
-
-            return layers
+            # The REST listing only carries names; fetch the details in
+            # parallel over the pooled session so latency does not grow
+            # with the workspace size. GEOSERVER_MAX_WORKERS caps the
+            # concurrent requests GeoServer sees
+            layer_names = [
+                layer_info["name"] for layer_info in layers_list.get("layer", [])
+            ]
+            if not layer_names:
+                return []
+            with ThreadPoolExecutor(
+                max_workers=max(
+                    1, min(settings.geoserver_max_workers, len(layer_names))
+                )
+            ) as pool:
+                details = pool.map(
+                    lambda name: self.get_layer_info(name, workspace), layer_names
+                )
+                return [layer for layer in details if layer]
         except Exception as e:
             logger.error(f"Failed to get layers for workspace {workspace}: {e}")
             raise GeoServerException(f"Failed to get layers: {e}")
@@ -439,9 +525,7 @@ class GeoServerService:
         workspace = workspace or self.workspace
 
         params = {
-            "service": "WMS",
-            "version": "1.3.0",
-            "request": "GetMap",
+            **_WMS_GETMAP_PARAMS,
             "layers": f"{workspace}:{layer_name}",
             "styles": "",
             "crs": srs,
@@ -453,8 +537,8 @@ class GeoServerService:
         if bbox:
             params["bbox"] = f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}"
 
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{self.wms_url}?{param_string}"
+        query = urlencode(params, safe=_URL_SAFE_CHARS, quote_via=quote)
+        return f"{self.wms_url}?{query}"
 
     def generate_wfs_url(
         self,
@@ -466,15 +550,13 @@ class GeoServerService:
         workspace = workspace or self.workspace
 
         params = {
-            "service": "WFS",
-            "version": "2.0.0",
-            "request": "GetFeature",
+            **_WFS_GETFEATURE_PARAMS,
             "typeNames": f"{workspace}:{layer_name}",
             "outputFormat": output_format,
         }
 
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{self.wfs_url}?{param_string}"
+        query = urlencode(params, safe=_URL_SAFE_CHARS, quote_via=quote)
+        return f"{self.wfs_url}?{query}"
 
     def get_wfs_features(
         self,
@@ -486,15 +568,13 @@ class GeoServerService:
         workspace = workspace or self.workspace
 
         params = {
-            "service": "WFS",
-            "version": "2.0.0",
-            "request": "GetFeature",
+            **_WFS_GETFEATURE_PARAMS,
             "typeNames": f"{workspace}:{layer_name}",
             "outputFormat": output_format,
         }
 
         try:
-            response = requests.get(
+            response = http_session.get(
                 self.wfs_url,
                 params=params,
                 auth=self.auth,
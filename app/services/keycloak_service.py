@@ -1,12 +1,22 @@
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from keycloak import KeycloakAdmin
+from keycloak.exceptions import KeycloakAuthenticationError
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# User representations keyed by ("i", id), ("u", username) or ("e", email);
+# membership listings resolve the same users on every request, so each is
+# fetched from Keycloak at most once per TTL
+_user_cache = TTLCache(maxsize=1024, ttl=300)
+
+# Response codes that mean the admin token is no longer accepted
+_AUTH_FAILURE_CODES = (401, 403)
+
 
 class KeycloakService:
     _admin_client: Optional[KeycloakAdmin] = None
@@ -76,6 +86,31 @@ class KeycloakService:
             logger.error(f"Failed to initialize Keycloak Admin client: {e}")
             raise
 
+    @classmethod
+    def _reset_on_auth_failure(cls, error: Exception) -> None:
+        """
+        Drop the cached admin client only when Keycloak rejected its token.
+        Timeouts and other errors keep it, so a slow Keycloak does not force
+        every following call through a fresh token fetch.
+        """
+        if isinstance(error, KeycloakAuthenticationError) or (
+            getattr(error, "response_code", None) in _AUTH_FAILURE_CODES
+        ):
+            cls._admin_client = None
+
+    @classmethod
+    def _lookup_user(cls, key: tuple, query: dict) -> Optional[dict]:
+        """Find a single user by an exact query, caching found users."""
+        cached = _user_cache.get(key)
+        if cached is not None:
+            return cached
+        admin = cls.get_admin_client()
+        users = admin.get_users(query={**query, "exact": True})
+        if not users:
+            return None
+        _user_cache.set(key, users[0])
+        return users[0]
+
     @classmethod
     def get_user_by_username(cls, username: str) -> Optional[dict]:
         """
@@ -83,41 +118,54 @@ class KeycloakService:
         Returns user dict (id, username, email, etc.) or None.
         """
         try:
-            admin = cls.get_admin_client()
-            # method: get_users(query={"username": ...})
-            users = admin.get_users(query={"username": username, "exact": True})
-            if users:
-                return users[0]
-            return None
+            return cls._lookup_user(("u", username), {"username": username})
         except Exception as e:
             logger.error(f"Error fetching user {username} from Keycloak: {e}")
-            # Reset client on failure (token expiry etc)
-            cls._admin_client = None
+            # Reset client on rejected token (expiry etc)
+            cls._reset_on_auth_failure(e)
             return None
 
     @classmethod
     def get_user_by_email(cls, email: str) -> Optional[dict]:
         try:
-            admin = cls.get_admin_client()
-            users = admin.get_users(query={"email": email, "exact": True})
-            if users:
-                return users[0]
-            return None
+            return cls._lookup_user(("e", email), {"email": email})
         except Exception as e:
             logger.error(f"Error fetching user email {email} from Keycloak: {e}")
-            cls._admin_client = None
+            cls._reset_on_auth_failure(e)
             return None
 
     @classmethod
     def get_user_by_id(cls, user_id: str) -> Optional[dict]:
-        """Fetch user by UUID."""
+        """
+        Fetch user by UUID.
+        Found users are cached for a short TTL; failed lookups are not.
+        """
+        cached = _user_cache.get(("i", user_id))
+        if cached is not None:
+            return cached
         try:
             admin = cls.get_admin_client()
-            return admin.get_user(user_id)
+            user = admin.get_user(user_id)
         except Exception as e:
             logger.error(f"Error fetching user ID {user_id} from Keycloak: {e}")
-            cls._admin_client = None
+            cls._reset_on_auth_failure(e)
             return None
+        if user:
+            _user_cache.set(("i", user_id), user)
+        return user
+
+    @classmethod
+    def get_users_by_ids(cls, user_ids: Iterable[str]) -> Dict[str, dict]:
+        """
+        Fetch several users by UUID, keyed by id.
+        Users that cannot be resolved are left out of the result.
+        """
+        users = {}
+        for user_id in dict.fromkeys(user_ids):
+            user = cls.get_user_by_id(user_id)
+            if user:
+                users[user_id] = user
+        return users
 
     @classmethod
     def create_group(cls, group_name: str) -> Optional[str]:
@@ -130,5 +178,5 @@ class KeycloakService:
             return group_id
         except Exception as e:
             logger.error(f"Error creating group '{group_name}' in Keycloak: {e}")
-            cls._admin_client = None
+            cls._reset_on_auth_failure(e)
             return None
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy import and_, or_, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.user_context import Project, ProjectMember, project_sensors
@@ -297,18 +297,17 @@ class ProjectService:
     def add_sensor(db: Session, project_id: UUID, sensor_id: str, user: Dict[str, Any]):
         ProjectService._check_access(db, project_id, user, required_role="editor")
 
-        # Check if already exists using execute for table
-        stmt = project_sensors.insert().values(
-            project_id=project_id, sensor_id=sensor_id
+        # Single atomic statement; an existing link is left untouched
+        stmt = (
+            pg_insert(project_sensors)
+            .values(project_id=project_id, sensor_id=sensor_id)
+            .on_conflict_do_nothing(index_elements=["project_id", "sensor_id"])
         )
         try:
-            db.execute(stmt)
+            result = db.execute(stmt)
             db.commit()
-        except IntegrityError:
-            db.rollback()
-            # Log the duplicate attempt
-            logger.info(f"Sensor {sensor_id} already in project {project_id}")
-            pass
+            if result.rowcount == 0:
+                logger.info(f"Sensor {sensor_id} already in project {project_id}")
         except Exception as e:
             db.rollback()
             logger.error(f"Error adding sensor to project: {e}")
@@ -412,10 +411,7 @@ class ProjectService:
         member = ProjectMember(
             project_id=project_id, user_id=member_in.user_id, role=member_in.role
         )
-        db.add(member)
-        db.commit()
-        db.refresh(member)
-        return member
+        return member.save_new(db)
 
     @staticmethod
     def list_members(
@@ -429,6 +425,13 @@ class ProjectService:
         # Populate usernames
         from app.services.keycloak_service import KeycloakService
 
+        try:
+            k_users = KeycloakService.get_users_by_ids(str(m.user_id) for m in members)
+        except Exception as exc:
+            # Best-effort: on any failure, keep the default "Unknown" usernames but log the error.
+            logger.warning("Failed to resolve member usernames: %s", exc)
+            k_users = {}
+
         results = []
         for m in members:
             # Convert SQLAlchemy model to Pydantic dict foundation
@@ -441,16 +444,9 @@ class ProjectService:
                 "updated_at": m.updated_at,
                 "username": "Unknown",
             }
-            # Try resolve username
-            try:
-                k_user = KeycloakService.get_user_by_id(str(m.user_id))
-                if k_user:
-                    m_dict["username"] = k_user.get("username")
-            except Exception as exc:
-                # Best-effort: on any failure, keep the default "Unknown" username but log the error.
-                logger.warning(
-                    "Failed to resolve username for user_id %s: %s", m.user_id, exc
-                )
+            k_user = k_users.get(str(m.user_id))
+            if k_user:
+                m_dict["username"] = k_user.get("username")
             results.append(ProjectMemberResponse(**m_dict))
 
         return results
@@ -3,6 +3,7 @@ Time series data processing and analysis service.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -11,10 +12,12 @@ import pandas as pd
 import requests
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.exceptions import (
     ResourceNotFoundException,
     TimeSeriesException,
 )
+from app.core.http_client import http_session
 from app.schemas.time_series import (
     AggregatedDataPoint,
     DataType,
@@ -30,6 +33,22 @@ from app.schemas.user_context import SensorCreate
 
 logger = logging.getLogger(__name__)
 
+# Observations sent per FROST CreateObservations request
+_OBSERVATION_BATCH_SIZE = 1000
+
+# Things looked up per FROST "id eq ... or ..." filter
+_STATION_BATCH_SIZE = 50
+
+# Only the names of a Datastream's Thing and ObservedProperty are mapped
+_DATASTREAM_METADATA_EXPAND = "Thing($select=name),ObservedProperty($select=name)"
+
+# Concurrent FROST requests when looking up many stations
+_STATION_FETCH_WORKERS = 8
+
+# @iot.ids of ObservedProperties and Sensors keyed by (collection, name).
+# They are created once and rarely change, so imports skip the lookup.
+_frost_entity_id_cache = TTLCache(maxsize=1024, ttl=300)
+
 
 class TimeSeriesService:
     """Service for time series data processing and analysis."""
@@ -107,7 +126,7 @@ class TimeSeriesService:
         url = f"{self._get_frost_url()}/Things"
         params = {"$expand": "Locations", "$top": limit, "$skip": skip}
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
 
             try:
@@ -134,7 +153,9 @@ class TimeSeriesService:
         params_id = {"$expand": "Locations"}
 
         try:
-            resp = requests.get(url_id, params=params_id, timeout=self._get_timeout())
+            resp = http_session.get(
+                url_id, params=params_id, timeout=self._get_timeout()
+            )
             if resp.status_code == 200:
                 try:
                     return self._map_thing_to_station(resp.json())
@@ -154,7 +175,7 @@ class TimeSeriesService:
             "$filter": f"properties/station_id eq '{escaped_id}'",
         }
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             try:
                 val = resp.json().get("value")
@@ -176,6 +197,61 @@ class TimeSeriesService:
             )
             raise TimeSeriesException(f"Failed to fetch station details: {e}")
 
+    def _get_station_batch(self, batch: List[str]) -> List[Dict]:
+        """Fetch Things by numeric @iot.id with a single filtered request."""
+        params = {
+            "$expand": "Locations",
+            "$filter": " or ".join(f"id eq {sid}" for sid in batch),
+            "$top": len(batch),
+        }
+        try:
+            resp = http_session.get(
+                f"{self._get_frost_url()}/Things",
+                params=params,
+                timeout=self._get_timeout(),
+            )
+            resp.raise_for_status()
+            return [self._map_thing_to_station(t) for t in resp.json().get("value", [])]
+        except Exception as e:
+            logger.warning(f"Batch station lookup failed, falling back: {e}")
+            return []
+
+    def _get_station_or_none(self, station_id: str) -> Optional[Dict]:
+        try:
+            return self.get_station(station_id)
+        except (ResourceNotFoundException, TimeSeriesException) as e:
+            logger.warning(f"Failed to fetch station {station_id}: {e}")
+            return None
+
+    def get_stations_by_ids(self, station_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get many stations (Things) keyed by the requested ID.
+        Numeric @iot.ids are fetched with one filtered request per
+        _STATION_BATCH_SIZE IDs; other IDs, and IDs the batch did not
+        return, fall back to get_station. Requests of both kinds run
+        concurrently on up to _STATION_FETCH_WORKERS threads, so the wall
+        time follows the slowest request rather than their sum.
+        Unknown stations are left out.
+        """
+        stations = {}
+        numeric_ids = [sid for sid in station_ids if str(sid).isdigit()]
+        batches = [
+            numeric_ids[start : start + _STATION_BATCH_SIZE]
+            for start in range(0, len(numeric_ids), _STATION_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=_STATION_FETCH_WORKERS) as pool:
+            for batch_stations in pool.map(self._get_station_batch, batches):
+                for station in batch_stations:
+                    stations[station["id"]] = station
+
+            missing = [sid for sid in dict.fromkeys(station_ids) if sid not in stations]
+            for sid, station in zip(
+                missing, pool.map(self._get_station_or_none, missing)
+            ):
+                if station:
+                    stations[sid] = station
+        return stations
+
     def get_datastreams_for_station(
         self, station_id: int | str, parameter: Optional[str] = None
     ) -> List[Dict]:
@@ -200,7 +276,7 @@ class TimeSeriesService:
             params["$filter"] = f"ObservedProperty/name eq '{escaped_param}'"
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             return resp.json().get("value", [])
         except requests.exceptions.RequestException as e:
@@ -223,7 +299,7 @@ class TimeSeriesService:
         # 1. Try fetching by Direct ID first
         url_id = f"{self._get_frost_url()}/Things({station_id})"
         try:
-            resp = requests.get(url_id, timeout=self._get_timeout())
+            resp = http_session.get(url_id, timeout=self._get_timeout())
             if resp.status_code == 200:
                 iot_id = station_id
         except Exception as e:
@@ -235,7 +311,7 @@ class TimeSeriesService:
             escaped_id = self._escape_odata_string(station_id)
             params = {"$filter": f"properties/station_id eq '{escaped_id}'"}
             try:
-                resp = requests.get(url, params=params, timeout=self._get_timeout())
+                resp = http_session.get(url, params=params, timeout=self._get_timeout())
                 resp.raise_for_status()
                 val = resp.json().get("value", [])
                 if val:
@@ -283,7 +359,7 @@ class TimeSeriesService:
         # 4. Execute PATCH
         patch_url = f"{self._get_frost_url()}/Things({iot_id})"
         try:
-            patch_resp = requests.patch(
+            patch_resp = http_session.patch(
                 patch_url, json=payload, timeout=self._get_timeout()
             )
             patch_resp.raise_for_status()
@@ -299,7 +375,7 @@ class TimeSeriesService:
         # 1. Try fetching by Direct ID first
         url_id = f"{self._get_frost_url()}/Things({station_id})"
         try:
-            resp = requests.get(url_id, timeout=self._get_timeout())
+            resp = http_session.get(url_id, timeout=self._get_timeout())
             if resp.status_code == 200:
                 # Found by ID
                 iot_id = station_id  # It is the ID
@@ -313,7 +389,7 @@ class TimeSeriesService:
             escaped_id = self._escape_odata_string(station_id)
             params = {"$filter": f"properties/station_id eq '{escaped_id}'"}
             try:
-                resp = requests.get(url, params=params, timeout=self._get_timeout())
+                resp = http_session.get(url, params=params, timeout=self._get_timeout())
                 resp.raise_for_status()
 
                 try:
@@ -337,7 +413,7 @@ class TimeSeriesService:
         # Execute DELETE
         del_url = f"{self._get_frost_url()}/Things({iot_id})"
         try:
-            del_resp = requests.delete(del_url, timeout=self._get_timeout())
+            del_resp = http_session.delete(del_url, timeout=self._get_timeout())
             if del_resp.status_code in [200, 204]:
                 return True
             else:
@@ -368,7 +444,7 @@ class TimeSeriesService:
         }
         url = f"{self._get_frost_url()}/Things"
         try:
-            resp = requests.post(url, json=payload, timeout=self._get_timeout())
+            resp = http_session.post(url, json=payload, timeout=self._get_timeout())
             if resp.status_code == 201:
                 loc = resp.headers.get("Location")
                 if loc:
@@ -402,7 +478,7 @@ class TimeSeriesService:
         }
         url = f"{self._get_frost_url()}/Things"
         try:
-            resp = requests.post(url, json=payload, timeout=self._get_timeout())
+            resp = http_session.post(url, json=payload, timeout=self._get_timeout())
             if resp.status_code == 201:
                 loc = resp.headers.get("Location")
                 if loc:
@@ -419,6 +495,46 @@ class TimeSeriesService:
         return None
 
     # --- Metadata (Datastreams) ---
+    def _map_datastream_to_metadata(
+        self, item: Dict, now: datetime
+    ) -> TimeSeriesMetadataResponse:
+        """Map a Datastream with its Thing and ObservedProperty to metadata."""
+        thing = item.get("Thing", {})
+        op = item.get("ObservedProperty", {})
+        uom = item.get("unitOfMeasurement", {})  # camelCase
+
+        # Parsing phenomenonTime
+        pt = item.get("phenomenonTime")
+        start_t = now
+        end_t = None
+        if pt:
+            parts = pt.split("/")
+            try:
+                start_t = datetime.fromisoformat(parts[0].replace("Z", "+00:00"))
+                if len(parts) > 1:
+                    end_t = datetime.fromisoformat(parts[1].replace("Z", "+00:00"))
+            except ValueError:
+                logger.warning(f"Failed to parse phenomenonTime: {pt}")
+
+        return TimeSeriesMetadataResponse(
+            id=item.get("@iot.id"),
+            series_id=item.get("name"),
+            name=item.get("name"),  # Required
+            description=item.get("description"),
+            parameter=op.get("name", "unknown"),
+            unit=uom.get("name", "unknown"),
+            station_id=thing.get("name", "unknown"),
+            source_type=SourceType.SENSOR,  # Required
+            data_type=DataType.CONTINUOUS,  # Required
+            start_time=start_t,  # Required
+            end_time=end_t,
+            interval="variable",
+            is_active=True,
+            data_retention_days=365,
+            created_at=now,  # Dummy
+            updated_at=now,  # Dummy
+        )
+
     def get_time_series_metadata(
         self,
         skip: int = 0,
@@ -434,7 +550,7 @@ class TimeSeriesService:
         params = {
             "$top": limit,
             "$skip": skip,
-            "$expand": "Thing,Sensor,ObservedProperty",
+            "$expand": _DATASTREAM_METADATA_EXPAND,
         }
 
         # Add filters
@@ -453,7 +569,7 @@ class TimeSeriesService:
             params["$filter"] = " and ".join(filter_list)
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             try:
                 data = resp.json()
@@ -464,51 +580,8 @@ class TimeSeriesService:
                 return []
             items = data.get("value", [])
 
-            results = []
-            for item in items:
-                # Extract details
-                thing = item.get("Thing", {})
-                op = item.get("ObservedProperty", {})
-                uom = item.get("unitOfMeasurement", {})  # camelCase
-
-                # Parsing phenomenonTime
-                pt = item.get("phenomenonTime")
-                start_t = datetime.now()
-                end_t = None
-                if pt:
-                    parts = pt.split("/")
-                    try:
-                        start_t = datetime.fromisoformat(
-                            parts[0].replace("Z", "+00:00")
-                        )
-                        if len(parts) > 1:
-                            end_t = datetime.fromisoformat(
-                                parts[1].replace("Z", "+00:00")
-                            )
-                    except ValueError:
-                        logger.warning(f"Failed to parse phenomenonTime: {pt}")
-
-                results.append(
-                    TimeSeriesMetadataResponse(
-                        id=item.get("@iot.id"),
-                        series_id=item.get("name"),
-                        name=item.get("name"),  # Required
-                        description=item.get("description"),
-                        parameter=op.get("name", "unknown"),
-                        unit=uom.get("name", "unknown"),
-                        station_id=thing.get("name", "unknown"),
-                        source_type=SourceType.SENSOR,  # Required
-                        data_type=DataType.CONTINUOUS,  # Required
-                        start_time=start_t,  # Required
-                        end_time=end_t,
-                        interval="variable",
-                        is_active=True,
-                        data_retention_days=365,
-                        created_at=datetime.now(),  # Dummy
-                        updated_at=datetime.now(),  # Dummy
-                    )
-                )
-            return results
+            now = datetime.now()
+            return [self._map_datastream_to_metadata(item, now) for item in items]
         except requests.exceptions.RequestException as e:
             logger.error(
                 f"Request failure fetching metadata from FROST: {e} URL: {url}"
@@ -527,11 +600,12 @@ class TimeSeriesService:
         escaped_id = self._escape_odata_string(series_id)
         params = {
             "$filter": f"name eq '{escaped_id}'",
-            "$expand": "Thing,Sensor,ObservedProperty",
+            "$expand": _DATASTREAM_METADATA_EXPAND,
+            "$top": 1,
         }
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             try:
                 val = resp.json().get("value", [])
@@ -543,42 +617,7 @@ class TimeSeriesService:
             if not val:
                 raise ResourceNotFoundException(f"Time series '{series_id}' not found.")
 
-            item = val[0]
-            thing = item.get("Thing", {})
-            op = item.get("ObservedProperty", {})
-            uom = item.get("unitOfMeasurement", {})
-
-            # Parsing phenomenonTime
-            pt = item.get("phenomenonTime")
-            start_t = datetime.now()
-            end_t = None
-            if pt:
-                parts = pt.split("/")
-                try:
-                    start_t = datetime.fromisoformat(parts[0].replace("Z", "+00:00"))
-                    if len(parts) > 1:
-                        end_t = datetime.fromisoformat(parts[1].replace("Z", "+00:00"))
-                except ValueError:
-                    logger.warning(f"Failed to parse phenomenonTime: {pt}")
-
-            return TimeSeriesMetadataResponse(
-                id=item.get("@iot.id"),
-                series_id=item.get("name"),
-                name=item.get("name"),  # Required
-                description=item.get("description"),
-                parameter=op.get("name", "unknown"),
-                unit=uom.get("name", "unknown"),
-                station_id=thing.get("name", "unknown"),
-                source_type=SourceType.SENSOR,  # Required
-                data_type=DataType.CONTINUOUS,  # Required
-                start_time=start_t,  # Required
-                end_time=end_t,
-                interval="variable",
-                is_active=True,
-                data_retention_days=365,
-                created_at=datetime.now(),  # Dummy
-                updated_at=datetime.now(),  # Dummy
-            )
+            return self._map_datastream_to_metadata(val[0], datetime.now())
         except requests.exceptions.RequestException as e:
             logger.error(
                 f"Request failure fetching metadata by ID '{series_id}' from FROST: {e}"
@@ -599,6 +638,7 @@ class TimeSeriesService:
     def add_bulk_data(self, series_id: str, data_points: List[Any]) -> int:
         """
         Bulk add data points to a datastream (identified by name/series_id).
+        Points are posted in chunks of _OBSERVATION_BATCH_SIZE.
         """
         # 1. Resolve Datastream ID
         # 1. Resolve Datastream ID and Check Thing Location
@@ -616,7 +656,7 @@ class TimeSeriesService:
         has_location = False
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             vals = resp.json().get("value", [])
             if vals:
@@ -642,37 +682,45 @@ class TimeSeriesService:
                 logger.warning(f"Failed to ensure location for Thing {thing_id}: {e}")
                 # We proceed, but import might fail if FoI cannot be generated.
 
-        # 2. Prepare Payloads
-        # FROST Server might support batch operations, but standard OGC SensorThings API
-        # uses MQTT or individual POSTs. Some implementations have extensions.
-        # We will use individual POSTs for now, but in parallel or loop.
-        # Ideally: Create Observations in bulk?
-        # FROST supports batch requests via $batch, but simpler to just loop for MVP.
-
+        # 2. Create Observations through FROST's DataArray extension, one
+        # POST /CreateObservations per chunk instead of one POST per point.
         count = 0
-        # TODO: Use $batch endpoint if available for performance.
-        post_url = f"{self._get_frost_url()}/Observations"
+        post_url = f"{self._get_frost_url()}/CreateObservations"
 
         errors = []
-        for dp in data_points:
-            try:
-                payload = {
-                    "phenomenonTime": dp.timestamp.isoformat(),
-                    "result": dp.value,
+        for start in range(0, len(data_points), _OBSERVATION_BATCH_SIZE):
+            chunk = data_points[start : start + _OBSERVATION_BATCH_SIZE]
+            payload = [
+                {
                     "Datastream": {"@iot.id": ds_id},
-                    "parameters": {"quality_flag": dp.quality_flag},
+                    "components": ["phenomenonTime", "result", "parameters"],
+                    "dataArray@iot.count": len(chunk),
+                    "dataArray": [
+                        [
+                            dp.timestamp.isoformat(),
+                            dp.value,
+                            {"quality_flag": dp.quality_flag},
+                        ]
+                        for dp in chunk
+                    ],
                 }
-
-                r = requests.post(post_url, json=payload, timeout=self._get_timeout())
-                if r.status_code in [200, 201]:
-                    count += 1
-                else:
-                    logger.error(
-                        f"FROST Error ({r.status_code}): {r.text} - Payload: {payload}"
-                    )
+            ]
+            try:
+                r = http_session.post(
+                    post_url, json=payload, timeout=self._get_timeout()
+                )
+                if r.status_code not in [200, 201]:
+                    logger.error(f"FROST Error ({r.status_code}): {r.text}")
                     errors.append(f"{r.status_code}: {r.text}")
+                    continue
+
+                # One self link per created Observation, or an "error" entry
+                results = r.json()
+                failed = [res for res in results if str(res).startswith("error")]
+                count += len(results) - len(failed)
+                errors.extend(failed)
             except Exception as e:
-                logger.error(f"Failed to post observation for {series_id}: {e}")
+                logger.error(f"Failed to post observations for {series_id}: {e}")
                 errors.append(str(e))
 
         if count == 0 and errors:
@@ -706,7 +754,7 @@ class TimeSeriesService:
         }
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             ds_id = None
             thing_id = None
             if resp.status_code == 200:
@@ -744,7 +792,7 @@ class TimeSeriesService:
             }
 
             post_url = f"{self._get_frost_url()}/Observations"
-            post_resp = requests.post(
+            post_resp = http_session.post(
                 post_url, json=obs_payload, timeout=self._get_timeout()
             )
             post_resp.raise_for_status()
@@ -809,13 +857,18 @@ class TimeSeriesService:
 
         url = f"{self._get_frost_url()}/{url_part}/Datastreams"
 
-        params = {"$expand": "ObservedProperty"}
+        # Expand each Datastream's newest Observation so FROST returns one
+        # row per parameter in a single request, not one request per stream
+        params = {
+            "$expand": "ObservedProperty,"
+            "Observations($top=1;$orderby=phenomenonTime desc)"
+        }
         if parameter:
             escaped_param = self._escape_odata_string(parameter)
             params["$filter"] = f"ObservedProperty/name eq '{escaped_param}'"
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             resp.raise_for_status()
             try:
                 datastreams = resp.json().get("value", [])
@@ -827,65 +880,42 @@ class TimeSeriesService:
 
             results = []
             for ds in datastreams:
-                ds_id = ds.get("@iot.id")
                 op_name = ds.get("ObservedProperty", {}).get("name", "unknown")
                 uom = ds.get("unitOfMeasurement", {}).get("name", "unknown")
 
-                # Get latest observation
-                # Get latest observation
-                if isinstance(ds_id, str) and not str(ds_id).isdigit():
-                    quot_ds_id = f"'{ds_id}'"
-                else:
-                    quot_ds_id = ds_id
+                obs_vals = ds.get("Observations") or []
+                if not obs_vals:
+                    continue
+                obs = obs_vals[0]
 
-                obs_url = f"{self._get_frost_url()}/Datastreams({quot_ds_id})/Observations?$top=1&$orderby=phenomenonTime desc"
+                # Parse time
+                t_str = obs.get("phenomenonTime")
                 try:
-                    obs_resp = requests.get(obs_url, timeout=self._get_timeout())
-                    obs_resp.raise_for_status()
-                    try:
-                        obs_vals = obs_resp.json().get("value", [])
-                    except (
-                        ValueError,
-                        requests.exceptions.JSONDecodeError,
-                    ) as json_err:
-                        logger.error(f"Failed to parse observation JSON: {json_err}")
-                        continue
-                    if obs_vals:
-                        obs = obs_vals[0]
-
-                        # Parse time
-                        t_str = obs.get("phenomenonTime")
-                        try:
-                            t = datetime.fromisoformat(t_str.replace("Z", "+00:00"))
-                        except ValueError:
-                            t = datetime.now()  # Fallback
-
-                        # Normalize parameter (slugify)
-                        param_slug = op_name.lower().replace(" ", "_").replace("-", "_")
-                        if param_slug == "water_temperature":
-                            param_slug = "temperature"
-                        elif param_slug == "level":
-                            param_slug = "water_level"
-
-                        results.append(
-                            {
-                                "id": str(obs.get("@iot.id")),
-                                "timestamp": t,
-                                "parameter": param_slug,
-                                "value": obs.get("result"),
-                                "unit": uom,
-                                "quality_flag": obs.get("parameters", {}).get(
-                                    "quality_flag", "good"
-                                ),
-                                "created_at": datetime.now(),
-                                "updated_at": datetime.now(),
-                            }
-                        )
-                except requests.exceptions.RequestException as e:
-                    logger.warning(
-                        f"Failed to fetch latest observation for Datastream {ds_id}: {e}"
-                    )
-                    continue
+                    t = datetime.fromisoformat(t_str.replace("Z", "+00:00"))
+                except ValueError:
+                    t = datetime.now()  # Fallback
+
+                # Normalize parameter (slugify)
+                param_slug = op_name.lower().replace(" ", "_").replace("-", "_")
+                if param_slug == "water_temperature":
+                    param_slug = "temperature"
+                elif param_slug == "level":
+                    param_slug = "water_level"
+
+                results.append(
+                    {
+                        "id": str(obs.get("@iot.id")),
+                        "timestamp": t,
+                        "parameter": param_slug,
+                        "value": obs.get("result"),
+                        "unit": uom,
+                        "quality_flag": (obs.get("parameters") or {}).get(
+                            "quality_flag", "good"
+                        ),
+                        "created_at": datetime.now(),
+                        "updated_at": datetime.now(),
+                    }
+                )
             return results
 
         except requests.exceptions.RequestException as e:
@@ -948,7 +978,7 @@ class TimeSeriesService:
             if query.limit:
                 params["$top"] = query.limit
 
-            resp = requests.get(
+            resp = http_session.get(
                 f"{self._get_frost_url()}/Observations",
                 params=params,
                 timeout=self._get_timeout(),
@@ -1178,9 +1208,12 @@ class TimeSeriesService:
         start_time: Optional[datetime],
         end_time: Optional[datetime],
     ) -> Dict:
-        """Get aggregated statistics for a station."""
-
-        # 1. Get all Datastreams for the station
+        """
+        Get aggregated statistics for a station.
+        Count, min and max of every Datastream come from two Datastreams
+        requests with nested Observations expands, independent of the number
+        of Datastreams.
+        """
         url = f"{self._get_frost_url()}/Datastreams"
 
         # Handle ID quoting
@@ -1190,24 +1223,6 @@ class TimeSeriesService:
         else:
             filter_str = f"Thing/id eq {station_id}"
 
-        params = {"$filter": filter_str, "$expand": "ObservedProperty"}
-
-        try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
-            resp.raise_for_status()
-            try:
-                datastreams = resp.json().get("value", [])
-            except (ValueError, requests.exceptions.JSONDecodeError) as json_err:
-                logger.error(f"Failed to parse JSON response from FROST: {json_err}")
-                datastreams = []
-        except Exception as e:
-            logger.error(f"Failed to fetch datastreams for station stats: {e}")
-            datastreams = []
-
-        total_measurements = 0
-        global_min = None
-        global_max = None
-
         # Date filters
         time_filter = ""
         if start_time or end_time:
@@ -1224,77 +1239,46 @@ class TimeSeriesService:
                 filters.append(f"phenomenonTime le {e_iso}")
             time_filter = " and ".join(filters)
 
-        for ds in datastreams:
-            ds_id = ds.get("@iot.id")
-            if not ds_id:
-                continue
-
-            # Determine ID for URL (quote if string)
-            if isinstance(ds_id, str) and not str(ds_id).isdigit():
-                safe_ds_id = f"'{ds_id}'"
-            else:
-                safe_ds_id = ds_id
-
-            obs_base_url = (
-                f"{self._get_frost_url()}/Datastreams({safe_ds_id})/Observations"
-            )
-
-            # 2. Get Count
+        def observations_expand(order: str, count: bool = False) -> str:
+            options = [f"$orderby=result {order}", "$top=1", "$select=result"]
+            if time_filter:
+                options.insert(0, f"$filter={time_filter}")
+            if count:
+                options.append("$count=true")
+            return f"Observations({';'.join(options)})"
+
+        def fetch_datastreams(expand: str) -> List[Dict[str, Any]]:
+            # Only the expanded Observations are read; $select=id keeps the
+            # Datastream's own properties (observedArea etc.) out of the payload
+            params = {"$filter": filter_str, "$select": "id", "$expand": expand}
             try:
-                # Use $count=true and $top=0 to just get the count
-                count_params = {"$count": "true", "$top": 0}
-                if time_filter:
-                    count_params["$filter"] = time_filter
-
-                c_resp = requests.get(
-                    obs_base_url, params=count_params, timeout=self._get_timeout()
-                )
-                if c_resp.status_code == 200:
-                    data = c_resp.json()
-                    ds_count = data.get(
-                        "@iot.count", 0
-                    )  # Standard OGC SensorThings uses @iot.count
-                    total_measurements += ds_count
+                resp = http_session.get(url, params=params, timeout=self._get_timeout())
+                resp.raise_for_status()
+                return resp.json().get("value", [])
             except Exception as e:
-                logger.warning(f"Failed to get count for DS {ds_id}: {e}")
-
-            # 3. Get Min (OrderBy Result Asc, Top 1)
-            try:
-                min_params = {"$orderby": "result asc", "$top": 1, "$select": "result"}
-                if time_filter:
-                    min_params["$filter"] = time_filter
+                logger.error(f"Failed to fetch datastreams for station stats: {e}")
+                return []
 
-                min_resp = requests.get(
-                    obs_base_url, params=min_params, timeout=self._get_timeout()
-                )
-                if min_resp.status_code == 200:
-                    vals = min_resp.json().get("value", [])
-                    if vals:
-                        val = vals[0].get("result")
-                        if isinstance(val, (int, float)):
-                            if global_min is None or val < global_min:
-                                global_min = val
-            except Exception as e:
-                logger.warning(f"Failed to get min for DS {ds_id}: {e}")
+        def extreme_results(datastreams: List[Dict[str, Any]]) -> List[float]:
+            results = []
+            for ds in datastreams:
+                observations = ds.get("Observations") or []
+                if observations:
+                    val = observations[0].get("result")
+                    if isinstance(val, (int, float)):
+                        results.append(val)
+            return results
 
-            # 4. Get Max (OrderBy Result Desc, Top 1)
-            try:
-                max_params = {"$orderby": "result desc", "$top": 1, "$select": "result"}
-                if time_filter:
-                    max_params["$filter"] = time_filter
+        # 1. Per-Datastream count and min (result asc, top 1, with $count)
+        by_min = fetch_datastreams(observations_expand("asc", count=True))
+        # 2. Per-Datastream max (result desc, top 1)
+        by_max = fetch_datastreams(observations_expand("desc")) if by_min else []
 
-                max_resp = requests.get(
-                    obs_base_url, params=max_params, timeout=self._get_timeout()
-                )
-                if max_resp.status_code == 200:
-                    vals = max_resp.json().get("value", [])
-                    if vals:
-                        val = vals[0].get("result")
-                        if isinstance(val, (int, float)):
-                            if global_max is None or val > global_max:
-                                global_max = val
-            except Exception as e:
-                logger.warning(f"Failed to get max for DS {ds_id}: {e}")
+        total_measurements = sum(
+            ds.get("Observations@iot.count", 0) or 0 for ds in by_min
+        )
+        global_min = min(extreme_results(by_min), default=None)
+        global_max = max(extreme_results(by_max), default=None)
 
         return {
             "id": station_id,
@@ -1357,13 +1341,22 @@ class TimeSeriesService:
 
     # --- Helper: Ensure Entities ---
     def _ensure_observed_property(self, name: str) -> Any:
+        cache_key = ("ObservedProperties", name)
+        cached_id = _frost_entity_id_cache.get(cache_key)
+        if cached_id is not None:
+            return cached_id
+        entity_id = self._find_or_create_observed_property(name)
+        _frost_entity_id_cache.set(cache_key, entity_id)
+        return entity_id
+
+    def _find_or_create_observed_property(self, name: str) -> Any:
         # Check if exists
         url = f"{self._get_frost_url()}/ObservedProperties"
         escaped = self._escape_odata_string(name)
         params = {"$filter": f"name eq '{escaped}'"}
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             if resp.status_code == 200:
                 vals = resp.json().get("value", [])
                 if vals:
@@ -1377,18 +1370,27 @@ class TimeSeriesService:
             "definition": "http://www.opengis.net/def/nil/OGC/0/unknown",
             "description": f"Observed Property: {name}",
         }
-        resp = requests.post(url, json=payload, timeout=self._get_timeout())
+        resp = http_session.post(url, json=payload, timeout=self._get_timeout())
         resp.raise_for_status()
         loc = resp.headers["Location"]
         return loc.split("(")[1].split(")")[0]
 
     def _ensure_sensor(self, name: str) -> Any:
+        cache_key = ("Sensors", name)
+        cached_id = _frost_entity_id_cache.get(cache_key)
+        if cached_id is not None:
+            return cached_id
+        entity_id = self._find_or_create_sensor(name)
+        _frost_entity_id_cache.set(cache_key, entity_id)
+        return entity_id
+
+    def _find_or_create_sensor(self, name: str) -> Any:
         url = f"{self._get_frost_url()}/Sensors"
         escaped = self._escape_odata_string(name)
         params = {"$filter": f"name eq '{escaped}'"}
 
         try:
-            resp = requests.get(url, params=params, timeout=self._get_timeout())
+            resp = http_session.get(url, params=params, timeout=self._get_timeout())
             if resp.status_code == 200:
                 vals = resp.json().get("value", [])
                 if vals:
@@ -1402,7 +1404,7 @@ class TimeSeriesService:
             "encodingType": "application/pdf",
             "metadata": "http://example.org/sensor.pdf",
         }
-        resp = requests.post(url, json=payload, timeout=self._get_timeout())
+        resp = http_session.post(url, json=payload, timeout=self._get_timeout())
         resp.raise_for_status()
         loc = resp.headers["Location"]
         return loc.split("(")[1].split(")")[0]
@@ -1417,7 +1419,7 @@ class TimeSeriesService:
             "location": {"type": "Point", "coordinates": [0, 0]},
         }
         try:
-            resp = requests.post(url, json=payload, timeout=self._get_timeout())
+            resp = http_session.post(url, json=payload, timeout=self._get_timeout())
             if resp.status_code not in [200, 201]:
                 logger.warning(
                     f"Failed to add location to Thing {thing_id}: {resp.text}"
@@ -1452,7 +1454,7 @@ class TimeSeriesService:
         if station_id_str.isdigit():
             url_id = f"{self._get_frost_url()}/Things({station_id_str})"
             try:
-                r = requests.get(url_id, timeout=self._get_timeout())
+                r = http_session.get(url_id, timeout=self._get_timeout())
                 if r.status_code == 200:
                     thing_id = r.json().get("@iot.id")
             except Exception as e:
@@ -1467,7 +1469,7 @@ class TimeSeriesService:
                 "$select": "id",
             }
             try:
-                resp = requests.get(url, params=params, timeout=self._get_timeout())
+                resp = http_session.get(url, params=params, timeout=self._get_timeout())
                 vals = resp.json().get("value", [])
                 if vals:
                     thing_id = vals[0]["@iot.id"]
@@ -1501,7 +1503,7 @@ class TimeSeriesService:
         }
 
         ds_url = f"{self._get_frost_url()}/Datastreams"
-        resp = requests.post(ds_url, json=payload, timeout=self._get_timeout())
+        resp = http_session.post(ds_url, json=payload, timeout=self._get_timeout())
         resp.raise_for_status()
 
         return series_id
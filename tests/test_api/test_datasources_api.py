@@ -0,0 +1,106 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+
+def test_stream_query_ndjson(client):
+    pid, did = uuid4(), uuid4()
+    with patch("app.api.v1.endpoints.datasources.DataSourceService") as MockService:
+        MockService.return_value.stream_query.return_value = iter(
+            [[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], [{"id": 3, "name": "c"}]]
+        )
+
+        response = client.post(
+            f"/api/v1/projects/{pid}/datasources/{did}/query/stream",
+            json={"sql": "SELECT id, name FROM t"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines() == [
+        '{"id": 1, "name": "a"}',
+        '{"id": 2, "name": "b"}',
+        '{"id": 3, "name": "c"}',
+    ]
+
+
+def test_stream_query_error_before_stream(client):
+    pid, did = uuid4(), uuid4()
+    with patch("app.api.v1.endpoints.datasources.DataSourceService") as MockService:
+        MockService.return_value.stream_query.side_effect = Exception("Query failed")
+
+        response = client.post(
+            f"/api/v1/projects/{pid}/datasources/{did}/query/stream",
+            json={"sql": "SELEC"},
+        )
+
+    assert response.status_code == 400
+
+
+def test_execute_query_passes_params(client):
+    pid, did = uuid4(), uuid4()
+    with patch("app.api.v1.endpoints.datasources.DataSourceService") as MockService:
+        MockService.return_value.execute_query.return_value = {
+            "columns": ["id"],
+            "rows": [{"id": 1}],
+            "status": "success",
+        }
+
+        response = client.post(
+            f"/api/v1/projects/{pid}/datasources/{did}/query",
+            json={"sql": "SELECT id FROM t WHERE id = :id", "params": {"id": 1}},
+        )
+
+    assert response.status_code == 200
+    args = MockService.return_value.execute_query.call_args.args
+    assert args[1:] == ("SELECT id FROM t WHERE id = :id", {"id": 1})
+
+
+def test_get_datasource_summaries(client, mock_db_session):
+    from sqlalchemy.engine import result_tuple
+
+    did = uuid4()
+    row = result_tuple(["id", "name", "type"])((did, "ext", "POSTGRES"))
+    mock_db_session.execute.return_value.all.return_value = [row]
+
+    response = client.get(f"/api/v1/projects/{uuid4()}/datasources/summary")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": str(did), "name": "ext", "type": "POSTGRES"}]
+    statement = str(mock_db_session.execute.call_args.args[0])
+    assert "connection_details" not in statement
+
+
+def test_update_with_masked_password_keeps_stored_password(client, mock_db_session):
+    from app.models.datasource import DataSource
+
+    pid = uuid4()
+    datasource = DataSource(
+        id=uuid4(),
+        project_id=pid,
+        name="ext",
+        type="POSTGRES",
+        connection_details={"host": "db", "password": "stored-token"},
+    )
+    mock_db_session.execute.return_value.scalars.return_value.all.return_value = [
+        datasource
+    ]
+    mock_db_session.execute.return_value.scalar_one_or_none.return_value = datasource
+
+    listed = client.get(f"/api/v1/projects/{pid}/datasources").json()[0]
+    assert listed["connection_details"]["password"] == "********"
+
+    with patch(
+        "app.services.datasource_service.encryption_service.encrypt"
+    ) as mock_encrypt:
+        response = client.put(
+            f"/api/v1/projects/{pid}/datasources/{datasource.id}",
+            json={"connection_details": {**listed["connection_details"], "port": 5433}},
+        )
+
+    assert response.status_code == 200
+    mock_encrypt.assert_not_called()
+    assert datasource.connection_details == {
+        "host": "db",
+        "port": 5433,
+        "password": "stored-token",
+    }
@@ -80,3 +80,135 @@ def test_create_geo_feature_error(client):
         response = client.post("/api/v1/geospatial/features", json=data)
         assert response.status_code == 500
         assert response.json()["detail"] == "Database operation failed"
+
+
+def test_export_geo_features(client):
+    from geoalchemy2.shape import from_shape
+    from shapely.geometry import Point
+
+    feature = MagicMock(
+        feature_id="F1",
+        geometry=from_shape(Point(14.4, 50.1), srid=4326),
+        properties={"name": "Vltava"},
+    )
+    with patch("app.api.v1.endpoints.geospatial.SessionLocal") as MockSession, patch(
+        "app.api.v1.endpoints.geospatial.DatabaseService"
+    ) as MockService:
+        MockService.return_value.iter_geo_features.return_value = iter([feature])
+
+        response = client.get("/api/v1/geospatial/features/export?layer_name=rivers")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/geo+json"
+        assert response.json() == {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "id": "F1",
+                    "geometry": {"type": "Point", "coordinates": [14.4, 50.1]},
+                    "properties": {"name": "Vltava"},
+                }
+            ],
+        }
+        MockSession.return_value.close.assert_called_once()
+
+
+def test_export_geo_features_without_geometry(client):
+    feature = MagicMock(feature_id="F1", properties=None)
+    with patch("app.api.v1.endpoints.geospatial.SessionLocal"), patch(
+        "app.api.v1.endpoints.geospatial.DatabaseService"
+    ) as MockService:
+        MockService.return_value.iter_geo_features.return_value = iter([feature])
+
+        response = client.get(
+            "/api/v1/geospatial/features/export"
+            "?layer_name=rivers&include_geometry=false"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["features"] == [
+            {"type": "Feature", "id": "F1", "geometry": None, "properties": {}}
+        ]
+        kwargs = MockService.return_value.iter_geo_features.call_args.kwargs
+        assert kwargs["include_geometry"] is False
+
+
+def test_get_geo_features_keyset_cursor(client):
+    from datetime import datetime
+
+    features = [
+        MagicMock(
+            id=feature_id,
+            layer_id="rivers",
+            feature_id=f"F{feature_id}",
+            feature_type="river",
+            geometry={"type": "Point", "coordinates": [0, 0]},
+            properties=None,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        for feature_id in (11, 12)
+    ]
+    with patch("app.api.v1.endpoints.geospatial.DatabaseService") as MockService:
+        MockService.return_value.get_geo_features.return_value = features
+
+        response = client.get(
+            "/api/v1/geospatial/features?layer_name=rivers&after_id=10&limit=2"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_after_id"] == 12
+        kwargs = MockService.return_value.get_geo_features.call_args.kwargs
+        assert kwargs["after_id"] == 10
+
+
+def test_get_geo_features_invalid_bbox(client, mock_db_session):
+    response = client.get("/api/v1/geospatial/features?layer_name=rivers&bbox=1,2,3")
+
+    assert response.status_code == 422
+    assert "Invalid bbox" in response.json()["detail"]
+    mock_db_session.query.return_value.filter.return_value.offset.assert_not_called()
+
+
+def test_get_geo_features_bbox_parsed_once(client):
+    with patch("app.api.v1.endpoints.geospatial.DatabaseService") as MockService:
+        MockService.return_value.get_geo_features.return_value = []
+
+        response = client.get(
+            "/api/v1/geospatial/features?layer_name=rivers&bbox=12.1,48.5,18.9,51.1"
+        )
+
+        assert response.status_code == 200
+        kwargs = MockService.return_value.get_geo_features.call_args.kwargs
+        assert kwargs["bbox"] == (12.1, 48.5, 18.9, 51.1)
+
+
+def test_export_geo_features_invalid_bbox(client):
+    with patch("app.api.v1.endpoints.geospatial.DatabaseService") as MockService:
+        response = client.get(
+            "/api/v1/geospatial/features/export?layer_name=rivers&bbox=1,2,x,4"
+        )
+
+        assert response.status_code == 422
+        MockService.return_value.iter_geo_features.assert_not_called()
+
+
+def test_geoserver_endpoints_run_in_threadpool():
+    import inspect
+
+    from app.api.v1.endpoints import geospatial
+
+    # Blocking GeoServer I/O must not run on the event loop
+    for endpoint in (
+        geospatial.get_geo_layers,
+        geospatial.get_geoserver_layers,
+        geospatial.get_geoserver_layer_info,
+        geospatial.get_layer_capabilities,
+        geospatial.get_layer_geojson,
+        geospatial.publish_layer_to_geoserver,
+        geospatial.unpublish_layer_from_geoserver,
+        geospatial.get_layer_bbox,
+        geospatial.get_sensors_in_layer,
+    ):
+        assert not inspect.iscoroutinefunction(endpoint), endpoint.__name__
@@ -196,3 +196,28 @@ def test_get_alert_history(client, mock_db_session: Session):
         data = response.json()
         assert len(data) >= 1
         assert data[0]["status"] == "active"
+
+
+def test_get_alert_history_time_window(client, mock_db_session: Session):
+    """Test the start_time/end_time filters on alert history."""
+    import uuid
+
+    query = MagicMock()
+    query.join.return_value = query
+    query.filter.return_value = query
+    query.order_by.return_value.limit.return_value.all.return_value = []
+    mock_db_session.query.return_value = query
+
+    with patch("app.api.v1.endpoints.alerts.ProjectService._check_access"):
+        response = client.get(
+            f"{settings.api_prefix}/alerts/history/{uuid.uuid4()}",
+            params={
+                "start_time": "2026-01-01T00:00:00",
+                "end_time": "2026-01-02T00:00:00",
+            },
+        )
+
+    assert response.status_code == 200, response.text
+    criteria = [str(c.args[0]) for c in query.filter.call_args_list]
+    assert "alerts.timestamp >= :timestamp_1" in criteria
+    assert "alerts.timestamp <= :timestamp_1" in criteria
@@ -134,3 +134,29 @@ def test_get_import_status_unauthorized(override_deps, mock_normal_user):
 
     response = client.get("/api/v1/bulk/tasks/123")
     assert response.status_code == 403
+
+
+def test_import_timeseries_saves_upload_to_disk(
+    override_deps, mock_superuser, tmp_path
+):
+    app.dependency_overrides[deps.get_current_active_superuser] = lambda: mock_superuser
+
+    with patch(
+        "app.tasks.import_tasks.import_timeseries_task.delay"
+    ) as mock_task, patch(
+        "app.api.v1.endpoints.bulk.TEMP_IMPORT_DIR", str(tmp_path)
+    ), patch(
+        "app.api.v1.endpoints.bulk.UPLOAD_CHUNK_SIZE", 4
+    ):
+        mock_task.return_value.id = "task-ts-456"
+        payload = '[{"value": 1}, {"value": 2}]'
+
+        response = client.post(
+            "/api/v1/bulk/import/timeseries",
+            files={"file": ("data.json", payload, "application/json")},
+        )
+
+        assert response.status_code == 200
+        saved_path = mock_task.call_args.args[0]
+        with open(saved_path) as saved:
+            assert saved.read() == payload
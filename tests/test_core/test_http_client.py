@@ -0,0 +1,16 @@
+from app.core.http_client import create_http_session
+
+
+def test_create_http_session_pools_and_retries():
+    session = create_http_session(pool_connections=4, pool_maxsize=16)
+
+    adapter = session.get_adapter("https://frost.example.org")
+    assert adapter is session.get_adapter("http://geoserver.example.org")
+    assert adapter._pool_maxsize == 16
+    retries = adapter.max_retries
+    assert retries.total == 3
+    assert 503 in retries.status_forcelist
+    assert 429 in retries.status_forcelist
+    assert "POST" not in retries.allowed_methods
+    assert retries.backoff_jitter > 0
+    assert retries.raise_on_status is False
@@ -1,5 +1,10 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 import pytest
+import shapely
 
+from app.core.config import settings
 from app.core.exceptions import DatabaseException, ResourceNotFoundException
 from app.models.geospatial import GeoFeature, GeoLayer
 from app.schemas.geospatial import (
@@ -8,17 +13,30 @@ from app.schemas.geospatial import (
     GeoLayerCreate,
     GeoLayerUpdate,
 )
-from app.services.database_service import DatabaseService
+from app.services.database_service import (
+    DatabaseService,
+    _frost_page_cache,
+    _geo_layer_cache,
+    _layer_geometry_cache,
+    _LayerGeometries,
+    _parse_bbox,
+    _points_in_polygons,
+)
 
 
 class TestDatabaseService:
     @pytest.fixture
     def service(self, mock_db_session):
+        _geo_layer_cache.clear()
+        _frost_page_cache.clear()
+        _layer_geometry_cache.clear()
         return DatabaseService(mock_db_session)
 
     # GeoServer Tests
 
-    def test_create_geo_layer(self, service, mock_db_session):
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_create_geo_layer(self, MockGeoServer, service, mock_db_session):
+        MockGeoServer.return_value.get_layer_bounds.return_value = [0, 1, 2, 3]
         layer_data = GeoLayerCreate(
             layer_name="rivers",
             title="River Layer",
@@ -28,11 +46,20 @@ class TestDatabaseService:
             geometry_type="line",
             srid="EPSG:4326",  # Schema uses string for geometry type?
         )
+        mock_db_session.execute.return_value.scalar_one.return_value = GeoLayer(
+            layer_name="rivers"
+        )
         result = service.create_geo_layer(layer_data)
-        mock_db_session.add.assert_called_once()
+        stmt = mock_db_session.execute.call_args[0][0]
+        assert "RETURNING" in str(stmt)
+        assert stmt.compile().params["bbox_max_y"] == 3
+        mock_db_session.refresh.assert_not_called()
+        mock_db_session.expunge.assert_called_once_with(result)
+        mock_db_session.commit.assert_called_once()
         assert result.layer_name == "rivers"
 
-    def test_create_geo_layer_failure(self, service, mock_db_session):
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_create_geo_layer_failure(self, MockGeoServer, service, mock_db_session):
         layer_data = GeoLayerCreate(
             layer_name="fail_layer",
             title="Fail",
@@ -43,7 +70,7 @@ class TestDatabaseService:
             srid="EPSG:4326",
         )
         # Simulate DB Error
-        mock_db_session.add.side_effect = Exception("DB Error")
+        mock_db_session.execute.side_effect = Exception("DB Error")
 
         with pytest.raises(DatabaseException):
             service.create_geo_layer(layer_data)
@@ -64,29 +91,98 @@ class TestDatabaseService:
         result = service.get_geo_layer("rivers")
         assert result.layer_name == "rivers"
 
+    def test_get_geo_layers_with_features(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.options.return_value = mock_query
+        service.get_geo_layers(with_features=True)
+        mock_query.options.assert_called_once()
+
+    def test_get_geo_layer_with_features(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.options.return_value = mock_query
+        mock_query.filter.return_value.first.return_value = GeoLayer(
+            layer_name="rivers", features=[GeoFeature(feature_id="F1")]
+        )
+
+        result = service.get_geo_layer_with_features("rivers")
+
+        assert [f.feature_id for f in result.features] == ["F1"]
+        mock_query.options.assert_called_once()
+
+    def test_get_geo_layer_with_features_not_found(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.options.return_value = mock_query
+        mock_query.filter.return_value.first.return_value = None
+        with pytest.raises(ResourceNotFoundException):
+            service.get_geo_layer_with_features("missing")
+
+    def test_get_geo_layer_cached(self, service, mock_db_session):
+        mock_db_session.query.return_value.filter.return_value.first.return_value = (
+            GeoLayer(id=1, layer_name="rivers", title="Rivers")
+        )
+        mock_db_session.merge.side_effect = lambda obj, load: obj
+
+        service.get_geo_layer("rivers")
+        result = service.get_geo_layer("rivers")
+
+        assert result.title == "Rivers"
+        assert mock_db_session.query.call_count == 1
+        mock_db_session.merge.assert_called_once()
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_update_geo_layer_invalidates_cache(
+        self, MockGeoServer, service, mock_db_session
+    ):
+        _geo_layer_cache.set("rivers", {"id": 1, "layer_name": "rivers"})
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = GeoLayer(
+            layer_name="rivers"
+        )
+
+        service.update_geo_layer("rivers", GeoLayerUpdate(title="New"))
+
+        assert _geo_layer_cache.get("rivers") is None
+
     def test_get_geo_layer_not_found(self, service, mock_db_session):
         mock_db_session.query.return_value.filter.return_value.first.return_value = None
         with pytest.raises(ResourceNotFoundException):
             service.get_geo_layer("missing_layer")
 
-    def test_update_geo_layer(self, service, mock_db_session):
-        mock_layer = GeoLayer(layer_name="rivers", description="Old Desc")
-        mock_db_session.query.return_value.filter.return_value.first.return_value = (
-            mock_layer
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_update_geo_layer(self, MockGeoServer, service, mock_db_session):
+        # Implementation: UPDATE ... RETURNING, no prior SELECT
+        MockGeoServer.return_value.get_layer_bounds.return_value = None
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = GeoLayer(
+            layer_name="rivers", description="New Desc"
         )
 
         update_data = GeoLayerUpdate(description="New Desc")
         result = service.update_geo_layer("rivers", update_data)
         assert result.description == "New Desc"
+        # The stored extent is refreshed; unknown bounds clear it
+        params = mock_db_session.execute.call_args[0][0].compile().params
+        assert params["bbox_min_x"] is None
+        mock_db_session.query.assert_not_called()
+        mock_db_session.expunge.assert_called_once_with(result)
+        mock_db_session.commit.assert_called_once()
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_update_geo_layer_not_found(self, MockGeoServer, service, mock_db_session):
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
+        with pytest.raises(ResourceNotFoundException):
+            service.update_geo_layer("missing", GeoLayerUpdate(title="New"))
+        mock_db_session.commit.assert_not_called()
 
     def test_delete_geo_layer(self, service, mock_db_session):
-        mock_layer = GeoLayer(layer_name="rivers")
-        mock_db_session.query.return_value.filter.return_value.first.return_value = (
-            mock_layer
-        )
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = 1
 
-        service.delete_geo_layer("rivers")
-        mock_db_session.delete.assert_called_with(mock_layer)
+        assert service.delete_geo_layer("rivers") is True
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+
+    def test_delete_geo_layer_not_found(self, service, mock_db_session):
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
+        with pytest.raises(ResourceNotFoundException):
+            service.delete_geo_layer("missing")
 
     def test_create_geo_feature(self, service, mock_db_session):
         # First mock get_geo_layer to return a layer
@@ -106,7 +202,106 @@ class TestDatabaseService:
             properties={"name": "Danube"},
         )
         service.create_geo_feature(feature_data)
-        mock_db_session.add.assert_called()
+        stmt = mock_db_session.execute.call_args[0][0]
+        assert "RETURNING" in str(stmt)
+        mock_db_session.refresh.assert_not_called()
+        mock_db_session.commit.assert_called_once()
+
+    def test_bulk_create_geo_features(self, service, mock_db_session):
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [
+            1,
+            2,
+        ]
+        features = [
+            GeoFeatureCreate(
+                layer_id="rivers",
+                feature_id=f"F{i}",
+                feature_type="point",
+                geometry={"type": "Point", "coordinates": [i, i]},
+            )
+            for i in range(2)
+        ]
+
+        ids = service.bulk_create_geo_features(features)
+
+        assert ids == [1, 2]
+        mock_db_session.execute.assert_called_once()
+        rows = mock_db_session.execute.call_args[0][1]
+        assert rows[1]["geometry_geojson"] == '{"type": "Point", "coordinates": [1, 1]}'
+        assert "geometry" not in rows[1]
+        mock_db_session.add.assert_not_called()
+        mock_db_session.commit.assert_called_once()
+
+    def test_bulk_create_geo_features_copy(self, service, mock_db_session):
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [
+            7,
+            8,
+        ]
+        cursor = mock_db_session.connection.return_value.connection.cursor.return_value
+        buffers = []
+        cursor.copy_expert.side_effect = lambda sql, buf: buffers.append(buf.read())
+        features = [
+            GeoFeatureCreate(
+                layer_id="rivers",
+                feature_id=f"F{i}",
+                feature_type="point",
+                geometry={"type": "Point", "coordinates": [i, i]},
+                properties={"name": "a\tb"} if i else None,
+            )
+            for i in range(2)
+        ]
+
+        with patch("app.services.database_service._COPY_MIN_ROWS", 2):
+            ids = service.bulk_create_geo_features(features)
+
+        assert ids == [7, 8]
+        # Only the id allocation goes through execute; rows are COPY-ed
+        assert "nextval" in str(mock_db_session.execute.call_args[0][0])
+        sql = cursor.copy_expert.call_args[0][0]
+        assert sql.startswith("COPY geo_features (id, layer_id, feature_id,")
+        assert sql.endswith(", geometry) FROM STDIN")
+        lines = buffers[0].splitlines()
+        assert lines[0].split("\t")[:4] == ["7", "rivers", "F0", "point"]
+        assert "\\N" in lines[0].split("\t")
+        # JSON escapes the tab, and COPY escapes the resulting backslash
+        assert r'{"name": "a\\tb"}' in lines[1]
+        assert lines[1].endswith("\t0101000020E6100000000000000000F03F000000000000F03F")
+        cursor.close.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+
+    def test_bulk_create_geo_features_copy_unsupported(self, service, mock_db_session):
+        mock_db_session.connection.return_value.connection.cursor.return_value = (
+            MagicMock(spec=["close"])
+        )
+        features = [
+            GeoFeatureCreate(
+                layer_id="rivers",
+                feature_id="F1",
+                feature_type="point",
+                geometry={"type": "Point", "coordinates": [0, 0]},
+            )
+        ]
+
+        with patch("app.services.database_service._COPY_MIN_ROWS", 1):
+            service.bulk_create_geo_features(features)
+
+        rows = mock_db_session.execute.call_args[0][1]
+        assert rows[0]["feature_id"] == "F1"
+
+    def test_bulk_create_geo_features_failure(self, service, mock_db_session):
+        mock_db_session.execute.side_effect = Exception("DB Error")
+        features = [
+            GeoFeatureCreate(
+                layer_id="rivers",
+                feature_id="F1",
+                feature_type="point",
+                geometry={"type": "Point", "coordinates": [0, 0]},
+            )
+        ]
+
+        with pytest.raises(DatabaseException):
+            service.bulk_create_geo_features(features)
+        mock_db_session.rollback.assert_called_once()
 
     def test_get_geo_features(self, service, mock_db_session):
         mock_query = mock_db_session.query.return_value
@@ -118,6 +313,90 @@ class TestDatabaseService:
         )
         mock_db_session.query.assert_called()
 
+    def test_get_geo_features_is_active_boolean(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value = mock_query
+
+        service.get_geo_features("rivers", is_active=False)
+
+        criterion = mock_query.filter.call_args[0][0]
+        assert str(criterion) == "geo_features.is_active = false"
+
+    def test_get_geo_features_keyset(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+
+        service.get_geo_features("rivers", skip=500, limit=100, after_id=42)
+
+        criterion = mock_query.filter.call_args[0][0]
+        assert str(criterion) == "geo_features.id > :id_1"
+        mock_query.order_by.assert_called_once_with(GeoFeature.id)
+        mock_query.offset.assert_not_called()
+        mock_query.limit.assert_called_once_with(100)
+
+    def test_get_geo_features_selects_list_columns(self, service, mock_db_session):
+        service.get_geo_features("rivers")
+
+        columns = mock_db_session.query.call_args.args
+        assert [c.key for c in columns][:5] == [
+            "id",
+            "layer_id",
+            "feature_id",
+            "feature_type",
+            "geometry",
+        ]
+
+    def test_get_geo_features_without_geometry(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value.filter.return_value
+
+        service.get_geo_features("rivers", include_geometry=False)
+
+        columns = mock_db_session.query.call_args.args
+        assert "geometry" not in [c.key for c in columns]
+        mock_query.options.assert_not_called()
+        mock_query.offset.assert_called_with(0)
+
+    def test_get_geo_features_bbox_only(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value = mock_query
+
+        service.get_geo_features("rivers", bbox="0,0,1,1", bbox_only=True)
+
+        # Layer filter, then a single && filter without ST_Intersects
+        bbox_call = mock_query.filter.call_args_list[-1]
+        assert len(bbox_call.args) == 1
+        mock_query.params.assert_called_once_with(
+            min_x=0.0, min_y=0.0, max_x=1.0, max_y=1.0
+        )
+
+    def test_get_geo_features_bbox_exact_by_default(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value = mock_query
+
+        service.get_geo_features("rivers", bbox="0,0,1,1")
+
+        # && prefilter plus the exact ST_Intersects check
+        bbox_call = mock_query.filter.call_args_list[-1]
+        assert len(bbox_call.args) == 2
+        mock_query.params.assert_called_once_with(
+            min_x=0.0, min_y=0.0, max_x=1.0, max_y=1.0
+        )
+
+    def test_iter_geo_features_streams(self, service, mock_db_session):
+        mock_query = mock_db_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.execution_options.return_value = mock_query
+        mock_query.yield_per.return_value = iter(
+            [GeoFeature(feature_id="F1"), GeoFeature(feature_id="F2")]
+        )
+
+        features = service.iter_geo_features("rivers", batch_size=100)
+
+        assert [f.feature_id for f in features] == ["F1", "F2"]
+        mock_query.execution_options.assert_called_once_with(stream_results=True)
+        mock_query.yield_per.assert_called_once_with(100)
+
     def test_get_geo_feature(self, service, mock_db_session):
         mock_feature = GeoFeature(feature_id="F1", layer_id="rivers")
         # Implementation: query(GeoFeature).filter(F_id, L_id).first()
@@ -134,22 +413,285 @@ class TestDatabaseService:
             service.get_geo_feature("F_MISSING", "rivers")
 
     def test_update_geo_feature(self, service, mock_db_session):
-        mock_feature = GeoFeature(feature_id="F1", layer_id="rivers", properties={})
-        # Implementation calls specific query, let's just match the return of first()
-        # Note: update likely calls get_geo_feature internally or does similar query
-        mock_db_session.query.return_value.filter.return_value.first.return_value = (
-            mock_feature
+        # Implementation: UPDATE ... RETURNING, no prior SELECT
+        mock_db_session.execute.return_value.scalars.return_value.first.return_value = (
+            GeoFeature(feature_id="F1", layer_id="rivers", properties={"new": "prop"})
         )
 
         update_data = GeoFeatureUpdate(properties={"new": "prop"})
         result = service.update_geo_feature("F1", "rivers", update_data)
         assert result.properties == {"new": "prop"}
+        mock_db_session.query.assert_not_called()
+        mock_db_session.expunge.assert_called_once_with(result)
+
+    def test_update_geo_feature_not_found(self, service, mock_db_session):
+        mock_db_session.execute.return_value.scalars.return_value.first.return_value = (
+            None
+        )
+        with pytest.raises(ResourceNotFoundException):
+            service.update_geo_feature(
+                "F_MISSING", "rivers", GeoFeatureUpdate(properties={})
+            )
 
     def test_delete_geo_feature(self, service, mock_db_session):
-        mock_feature = GeoFeature(feature_id="F1", layer_id="rivers")
-        mock_db_session.query.return_value.filter.return_value.first.return_value = (
-            mock_feature
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [7]
+
+        assert service.delete_geo_feature("F1", "rivers") is True
+        mock_db_session.query.assert_not_called()
+        mock_db_session.delete.assert_not_called()
+        mock_db_session.commit.assert_called_once()
+
+    def test_delete_geo_feature_not_found(self, service, mock_db_session):
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
+
+        with pytest.raises(ResourceNotFoundException):
+            service.delete_geo_feature("F1", "rivers")
+        mock_db_session.commit.assert_not_called()
+
+    @patch.object(settings, "frost_filter_max_wkt_chars", 0)
+    @patch("app.services.database_service._SENSOR_MATCH_BATCH_SIZE", 2)
+    @patch("app.services.database_service.http_session.get")
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_sensors_in_layer(self, MockGeoServer, mock_get, service):
+        MockGeoServer.return_value.get_wfs_features.return_value = {
+            "features": [
+                {
+                    "id": "poly1",
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+                    },
+                }
+            ]
+        }
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "value": [
+                {
+                    "@iot.id": 1,
+                    "name": "Inside",
+                    "Locations": [
+                        {"location": {"type": "Point", "coordinates": [1, 1]}}
+                    ],
+                },
+                {
+                    "@iot.id": 2,
+                    "name": "Outside",
+                    "Locations": [
+                        {"location": {"type": "Point", "coordinates": [5, 5]}}
+                    ],
+                },
+                {"@iot.id": 3, "name": "No location", "Locations": []},
+                {
+                    "@iot.id": 4,
+                    "name": "Line",
+                    "Locations": [
+                        {
+                            "location": {
+                                "type": "LineString",
+                                "coordinates": [[0, 0], [1, 1]],
+                            }
+                        }
+                    ],
+                },
+            ]
+        }
+
+        sensors = service.get_sensors_in_layer("catchments")
+
+        assert [s["id"] for s in sensors] == ["1"]
+        assert sensors[0]["latitude"] == 1
+        assert sensors[0]["longitude"] == 1
+
+    @patch("app.services.database_service.http_session.get")
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_sensors_in_layer_pushes_union_to_frost(
+        self, MockGeoServer, mock_get, service
+    ):
+        MockGeoServer.return_value.get_wfs_features.return_value = {
+            "features": [
+                {
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+                    }
+                }
+            ]
+        }
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "value": [
+                {
+                    "@iot.id": 1,
+                    "Locations": [
+                        {"location": {"type": "Point", "coordinates": [1, 1]}}
+                    ],
+                }
+            ]
+        }
+
+        sensors = service.get_sensors_in_layer("catchments")
+
+        assert [s["id"] for s in sensors] == ["1"]
+        url = mock_get.call_args[0][0]
+        assert "geography'POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))'" in url
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_layer_bbox_uses_stored_bounds(
+        self, MockGeoServer, service, mock_db_session
+    ):
+        mock_db_session.execute.return_value.first.return_value = (0.0, 1.0, 2.0, 3.0)
+
+        assert service.get_layer_bbox("catchments") == [0.0, 1.0, 2.0, 3.0]
+        MockGeoServer.assert_not_called()
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_layer_bbox_uses_geoserver_bounds(
+        self, MockGeoServer, service, mock_db_session
+    ):
+        mock_db_session.execute.return_value.first.return_value = None
+        MockGeoServer.return_value.get_layer_bounds.return_value = [0, 0, 1, 1]
+
+        assert service.get_layer_bbox("catchments") == [0, 0, 1, 1]
+        MockGeoServer.return_value.get_wfs_features.assert_not_called()
+        # Read path: only the stored-extent SELECT, nothing written
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_not_called()
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_layer_bbox_uses_local_extent(
+        self, MockGeoServer, service, mock_db_session
+    ):
+        MockGeoServer.return_value.get_layer_bounds.return_value = None
+        mock_db_session.execute.return_value.first.side_effect = [
+            None,
+            (0.0, 1.0, 2.0, 3.0),
+        ]
+
+        assert service.get_layer_bbox("czech_regions") == [0.0, 1.0, 2.0, 3.0]
+        MockGeoServer.return_value.get_wfs_features.assert_not_called()
+        mock_db_session.commit.assert_not_called()
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_get_layer_bbox(self, MockGeoServer, service, mock_db_session):
+        MockGeoServer.return_value.get_layer_bounds.return_value = None
+        mock_db_session.execute.return_value.first.return_value = (
+            None,
+            None,
+            None,
+            None,
+        )
+        MockGeoServer.return_value.get_wfs_features.return_value = {
+            "features": [
+                {"geometry": {"type": "Point", "coordinates": [1, 5]}},
+                {
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+                    }
+                },
+                {"geometry": None},
+            ]
+        }
+
+        assert service.get_layer_bbox("catchments") == [0, 0, 2, 5]
+
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_layer_geometries_cached(self, MockGeoServer, service):
+        MockGeoServer.return_value.get_layer_bounds.return_value = None
+        MockGeoServer.return_value.get_wfs_features.return_value = {
+            "features": [{"geometry": {"type": "Point", "coordinates": [1, 5]}}]
+        }
+        service.db.execute.return_value.first.return_value = None
+
+        assert service.get_layer_bbox("catchments") == [1, 5, 1, 5]
+        assert service.get_layer_bbox("catchments") == [1, 5, 1, 5]
+        MockGeoServer.return_value.get_wfs_features.assert_called_once()
+
+        service.db.execute.return_value.scalar_one_or_none.return_value = 1
+        service.delete_geo_layer("catchments")
+        assert _layer_geometry_cache.get("catchments") is None
+
+    @patch("app.services.database_service.http_session.get")
+    def test_fetch_frost_page_cached(self, mock_get, service):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"value": [{"@iot.id": 1}]}
+
+        first = service._fetch_frost_page("http://frost/Things")
+        second = service._fetch_frost_page("http://frost/Things")
+
+        assert first == second == {"value": [{"@iot.id": 1}]}
+        mock_get.assert_called_once()
+
+    @patch("app.services.database_service.http_session.get")
+    def test_iter_frost_things_pages_concurrently(self, mock_get, service):
+        def page(url, timeout):
+            resp = MagicMock(status_code=200)
+            if "$count=true" in url:
+                resp.json.return_value = {
+                    "@iot.count": 5,
+                    "@iot.nextLink": "next",
+                    "value": [{"@iot.id": 0}, {"@iot.id": 1}],
+                }
+            else:
+                skip = int(url.rsplit("$skip=", 1)[1])
+                resp.json.return_value = {
+                    "value": [{"@iot.id": i} for i in range(skip, min(skip + 2, 5))]
+                }
+            return resp
+
+        mock_get.side_effect = page
+
+        things = list(
+            service._iter_frost_things("http://frost/Things?$expand=Locations")
         )
 
-        service.delete_geo_feature("F1", "rivers")
-        mock_db_session.delete.assert_called_with(mock_feature)
+        assert [t["@iot.id"] for t in things] == [0, 1, 2, 3, 4]
+        assert mock_get.call_count == 3
+
+
+def test_points_in_polygons():
+    polygons = shapely.box([0, 10], [0, 10], [2, 12], [2, 12])
+    shapely.prepare(polygons)
+    points = shapely.points([[1, 1], [5, 5], [11, 11], [2, 2]])
+
+    assert _points_in_polygons(points, polygons).tolist() == [0, 2, 3]
+
+
+def test_parse_bbox():
+    assert _parse_bbox("12.1,48.5,18.9,51.1") == (12.1, 48.5, 18.9, 51.1)
+    with pytest.raises(ValueError):
+        _parse_bbox("10,20,30")
+    with pytest.raises(ValueError):
+        _parse_bbox("a,b,c,d")
+    with pytest.raises(ValueError):
+        _parse_bbox("18.9,48.5,12.1,51.1")
+    with pytest.raises(ValueError):
+        _parse_bbox("nan,48.5,18.9,inf")
+    with pytest.raises(ValueError):
+        _parse_bbox("12.1,48.5,18.9,51.1,")
+
+
+def test_parse_bbox_accepts_float_grammar():
+    assert _parse_bbox("10.0, 50.0, 11.0, 51.0") == (10.0, 50.0, 11.0, 51.0)
+    assert _parse_bbox("1e1,.5,10.,5e1") == (10.0, 0.5, 10.0, 50.0)
+
+
+def test_layer_cover_is_tighter_than_bbox():
+    # Two small squares in opposite corners: only the two corner cells remain
+    layer = _LayerGeometries(
+        shapely.box([0.2, 7.2], [0.2, 7.2], [0.8, 7.8], [0.8, 7.8])
+    )
+
+    cover = shapely.from_wkt(layer.cover_wkt)
+
+    assert cover.area == pytest.approx(2 * (7.6 / 8) ** 2)
+    assert cover.covers(shapely.union_all(layer.polygons))
+
+
+def test_layer_bbox_wkt_rounds_outwards():
+    layer = _LayerGeometries(np.array([shapely.box(0.12345678, 1.5, 2.87654321, 3)]))
+
+    assert layer.bbox_wkt == (
+        "POLYGON ((2.876544 1.5, 2.876544 3, 0.123456 3, 0.123456 1.5, 2.876544 1.5))"
+    )
@@ -0,0 +1,231 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.datasource import DataSource
+from app.services.datasource_service import DataSourceService
+from app.services.engine_pool import engine_registry
+
+
+@pytest.fixture
+def service(mock_db_session):
+    engine_registry.engines.clear()
+    yield DataSourceService(mock_db_session)
+    engine_registry.engines.clear()
+
+
+@pytest.fixture
+def datasource():
+    return DataSource(
+        id=uuid4(),
+        project_id=uuid4(),
+        name="ext",
+        type="POSTGRES",
+        connection_details={"host": "db", "user": "u", "password": "enc"},
+    )
+
+
+@pytest.fixture
+def mock_create_engine():
+    with patch(
+        "app.services.engine_pool.encryption_service.decrypt",
+        return_value="p@ss",
+    ), patch("app.services.engine_pool.create_engine") as mock:
+        mock.side_effect = lambda *args, **kwargs: MagicMock()
+        yield mock
+
+
+def test_engine_reused_across_calls(service, datasource, mock_create_engine):
+    assert service.test_connection(datasource)
+    assert service.test_connection(datasource)
+
+    mock_create_engine.assert_called_once()
+    dsn = mock_create_engine.call_args.args[0]
+    assert dsn.password == "p@ss"
+    assert dsn.host == "db"
+    assert mock_create_engine.call_args.kwargs["pool_pre_ping"] is True
+
+
+def test_engine_rebuilt_when_details_change(service, datasource, mock_create_engine):
+    service.test_connection(datasource)
+    old_engine = engine_registry.engines[datasource.id][1]
+
+    datasource.connection_details = {**datasource.connection_details, "host": "db2"}
+    service.test_connection(datasource)
+
+    assert mock_create_engine.call_count == 2
+    old_engine.dispose.assert_called_once()
+
+
+def test_delete_disposes_engine(service, datasource, mock_create_engine):
+    service.test_connection(datasource)
+    engine = engine_registry.engines[datasource.id][1]
+    service.db.execute.return_value.scalar_one_or_none.return_value = datasource
+
+    assert service.delete(datasource.id)
+
+    engine.dispose.assert_called_once()
+    assert datasource.id not in engine_registry.engines
+
+
+def test_connection_failure_is_bounded(service, datasource, mock_create_engine):
+    from sqlalchemy.exc import OperationalError
+
+    mock_create_engine.side_effect = None
+    engine = mock_create_engine.return_value
+    engine.connect.side_effect = OperationalError("SELECT 1", {}, Exception("down"))
+
+    assert service.test_connection(datasource) is False
+
+    kwargs = mock_create_engine.call_args.kwargs
+    assert kwargs["connect_args"] == {"connect_timeout": 3}
+    assert kwargs["pool_timeout"] == 5
+
+
+def test_connection_sets_statement_timeout(service, datasource, mock_create_engine):
+    mock_create_engine.side_effect = None
+    conn = mock_create_engine.return_value.connect.return_value.__enter__.return_value
+
+    assert service.test_connection(datasource) is True
+
+    statements = [str(c.args[0]) for c in conn.execute.call_args_list]
+    assert statements == ["SET LOCAL statement_timeout = 2000", "SELECT 1"]
+
+
+def test_stream_query_yields_row_batches(service, datasource, mock_create_engine):
+    mock_create_engine.side_effect = None
+    conn = mock_create_engine.return_value.connect.return_value.__enter__.return_value
+    result = conn.execution_options.return_value.execute.return_value
+    result.returns_rows = True
+    result.mappings.return_value.partitions.return_value = iter(
+        [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    )
+
+    batches = list(service.stream_query(datasource, "SELECT id FROM t", batch_size=50))
+
+    assert batches == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    conn.execution_options.assert_called_once_with(stream_results=True, yield_per=50)
+
+
+def test_warmup_opens_sql_datasources(service, datasource, mock_create_engine):
+    from sqlalchemy.exc import OperationalError
+
+    down = DataSource(id=uuid4(), type="POSTGRES", connection_details={"host": "down"})
+    other = DataSource(id=uuid4(), type="FROST", connection_details={})
+
+    def make_engine(dsn, **kwargs):
+        engine = MagicMock()
+        if dsn.host == "down":
+            engine.connect.side_effect = OperationalError("SELECT 1", {}, None)
+        return engine
+
+    mock_create_engine.side_effect = make_engine
+
+    assert engine_registry.warmup([datasource, down, other]) == 1
+    assert set(engine_registry.engines) == {datasource.id, down.id}
+
+
+def test_update_does_not_reencrypt_stored_token(service, datasource):
+    from app.schemas.datasource import DataSourceUpdate
+
+    service.db.execute.return_value.scalar_one_or_none.return_value = datasource
+    schema = DataSourceUpdate(connection_details={"host": "db2", "password": "enc"})
+
+    with patch(
+        "app.services.datasource_service.encryption_service.encrypt"
+    ) as mock_encrypt:
+        service.update(datasource.id, schema)
+
+    mock_encrypt.assert_not_called()
+    assert datasource.connection_details["password"] == "enc"
+
+
+def test_bulk_create_single_insert(service):
+    from app.schemas.datasource import DataSourceCreate
+
+    project_id = uuid4()
+    ids = [uuid4(), uuid4()]
+    service.db.execute.return_value.scalars.return_value.all.return_value = ids
+    schemas = [
+        DataSourceCreate(name=f"ds{i}", type="POSTGRES", connection_details=details)
+        for i, details in enumerate([{"password": "secret"}, {"host": "db"}])
+    ]
+
+    with patch(
+        "app.services.datasource_service.encryption_service.encrypt",
+        return_value="token",
+    ):
+        assert service.bulk_create(project_id, schemas) == ids
+
+    service.db.execute.assert_called_once()
+    rows = service.db.execute.call_args.args[1]
+    assert [row["connection_details"] for row in rows] == [
+        {"password": "token"},
+        {"host": "db"},
+    ]
+    assert all(row["project_id"] == project_id for row in rows)
+    service.db.commit.assert_called_once()
+
+
+def test_update_skips_refresh(service, datasource):
+    from app.schemas.datasource import DataSourceUpdate
+
+    service.db.execute.return_value.scalar_one_or_none.return_value = datasource
+
+    updated = service.update(datasource.id, DataSourceUpdate(name="renamed"))
+
+    assert updated.name == "renamed"
+    service.db.expunge.assert_called_once_with(datasource)
+    service.db.commit.assert_called_once()
+    service.db.refresh.assert_not_called()
+
+
+def test_get_by_project_uses_select(service):
+    rows = [MagicMock()]
+    service.db.execute.return_value.scalars.return_value.all.return_value = rows
+    project_id = uuid4()
+
+    assert service.get_by_project(project_id) == rows
+
+    statement = service.db.execute.call_args.args[0]
+    assert "datasources.project_id = :project_id_1" in str(statement)
+    service.db.query.assert_not_called()
+
+
+def test_execute_query_reuses_compiled_text(service, datasource, mock_create_engine):
+    mock_create_engine.side_effect = None
+    conn = mock_create_engine.return_value.connect.return_value.__enter__.return_value
+    conn.execute.return_value.returns_rows = False
+
+    service.execute_query(datasource, "UPDATE t SET x = 1")
+    service.execute_query(datasource, "UPDATE t SET x = 1")
+
+    first, second = (c.args[0] for c in conn.execute.call_args_list)
+    assert first is second
+
+
+def test_execute_query_binds_params(service, datasource, mock_create_engine):
+    mock_create_engine.side_effect = None
+    conn = mock_create_engine.return_value.connect.return_value.__enter__.return_value
+    result = conn.execute.return_value
+    result.returns_rows = True
+    result.keys.return_value = ["id"]
+    result.mappings.return_value = [{"id": 7}]
+
+    out = service.execute_query(
+        datasource, "SELECT id FROM t WHERE id = :id", {"id": 7}
+    )
+
+    assert out["rows"] == [{"id": 7}]
+    assert conn.execute.call_args.args[1] == {"id": 7}
+
+
+def test_update_without_password_keeps_stored_password(service, datasource):
+    from app.schemas.datasource import DataSourceUpdate
+
+    service.db.execute.return_value.scalar_one_or_none.return_value = datasource
+
+    service.update(datasource.id, DataSourceUpdate(connection_details={"host": "db2"}))
+
+    assert datasource.connection_details == {"host": "db2", "password": "enc"}
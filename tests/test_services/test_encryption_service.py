@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import InvalidToken
+
+from app.services.encryption_service import EncryptionService
+
+
+@pytest.fixture
+def service():
+    return EncryptionService()
+
+
+def test_decrypt_round_trip_is_cached(service):
+    token = service.encrypt("secret")
+
+    with patch.object(
+        service, "_fernet_decrypt", wraps=service.fernet.decrypt
+    ) as mock_decrypt:
+        assert service.decrypt(token) == "secret"
+        assert service.decrypt(token) == "secret"
+
+    mock_decrypt.assert_called_once()
+
+
+def test_invalidate_forgets_plaintext(service):
+    token = service.encrypt("secret")
+    service.decrypt(token)
+
+    service.invalidate(token)
+
+    assert service._decrypted.get(token) is None
+
+
+def test_invalid_token_not_cached(service):
+    with pytest.raises(InvalidToken):
+        service.decrypt("not-a-token")
+    assert len(service._decrypted) == 0
+
+
+def test_is_token(service):
+    assert service.is_token(service.encrypt("secret"))
+    assert not service.is_token("secret")
+    assert not service.is_token("")
+    assert not service.is_token(EncryptionService().encrypt("other-key"))
@@ -4,15 +4,18 @@ import pytest
 
 from app.core.exceptions import GeoServerException
 from app.schemas.geospatial import LayerPublishRequest
+from app.services import geoserver_service
 from app.services.geoserver_service import GeoServerService
 
 
 class TestGeoServerService:
     @pytest.fixture
     def service(self, mock_settings):
-        return GeoServerService()
+        geoserver_service._rest_get_cache.clear()
+        yield GeoServerService()
+        geoserver_service._rest_get_cache.clear()
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_test_connection_success(self, mock_request, service):
         mock_response = MagicMock()
         mock_response.json.return_value = {"version": "2.20.0"}
@@ -20,33 +23,43 @@ class TestGeoServerService:
         result = service.test_connection()
         assert result is True
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_test_connection_failure(self, mock_request, service):
         mock_request.side_effect = Exception("Connection Error")
         result = service.test_connection()
         assert result is False
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_create_workspace_new(self, mock_request, service):
-        import requests
+        # A single POST creates it; no existence check first
+        mock_request.return_value.status_code = 201
 
-        # First call checks if workspace exists (404), second creates it
-        mock_response_check = MagicMock()
-        mock_response_check.status_code = 404
-        mock_response_check.raise_for_status.side_effect = (
-            requests.exceptions.HTTPError(response=mock_response_check)
-        )
+        result = service.create_workspace("new_workspace")
+        assert result is True
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.args[0] == "POST"
 
-        mock_response_create = MagicMock()
-        mock_response_create.status_code = 201
+        # Known to exist now, so no further requests
+        assert service.create_workspace("new_workspace") is True
+        assert mock_request.call_count == 1
 
-        mock_request.side_effect = [mock_response_check, mock_response_create]
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_create_workspace_conflict(self, mock_request, service):
+        mock_request.return_value.status_code = 409
 
-        result = service.create_workspace("new_workspace")
-        assert result is True
-        assert mock_request.call_count == 2
+        assert service.create_workspace("existing_workspace") is True
+        assert mock_request.call_count == 1
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_create_workspace_duplicate_as_server_error(self, mock_request, service):
+        post = MagicMock(status_code=500)
+        check = MagicMock(status_code=200)
+        mock_request.side_effect = [post, check]
+
+        assert service.create_workspace("existing_workspace") is True
+        post.raise_for_status.assert_not_called()
+
+    @patch("app.services.geoserver_service.http_session.request")
     def test_create_workspace_existing(self, mock_request, service):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -54,7 +67,7 @@ class TestGeoServerService:
         result = service.create_workspace("existing_workspace")
         assert result is True
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_create_workspace_failure(self, mock_request, service):
         import requests
 
@@ -70,7 +83,7 @@ class TestGeoServerService:
         with pytest.raises(GeoServerException):
             service.create_workspace("fail_workspace")
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_publish_layer(self, mock_request, service):
         layer_request = LayerPublishRequest(
             layer_name="test_layer",
@@ -88,7 +101,7 @@ class TestGeoServerService:
         assert result is True
         assert "featureType" in mock_request.call_args.kwargs["json"]
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_publish_sql_view(self, mock_request, service):
         import requests
 
@@ -115,7 +128,7 @@ class TestGeoServerService:
         assert result is True
         assert mock_request.call_count == 2
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_unpublish_layer(self, mock_request, service):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -125,7 +138,7 @@ class TestGeoServerService:
         assert result is True
         assert mock_request.call_args[0][0] == "DELETE"
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_get_layer_info(self, mock_request, service):
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -140,7 +153,32 @@ class TestGeoServerService:
         assert info.name == "test_layer"
         assert info.srs == "EPSG:4326"
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_get_layer_bounds(self, mock_request, service):
+        mock_request.return_value.json.return_value = {
+            "featureType": {
+                "latLonBoundingBox": {
+                    "minx": 12.1,
+                    "maxx": 18.9,
+                    "miny": 48.5,
+                    "maxy": 51.1,
+                    "crs": "EPSG:4326",
+                }
+            }
+        }
+
+        assert service.get_layer_bounds("test_layer") == [12.1, 48.5, 18.9, 51.1]
+        assert mock_request.call_args[0][1].endswith(
+            "/workspaces/test_workspace/featuretypes/test_layer.json"
+        )
+
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_get_layer_bounds_unavailable(self, mock_request, service):
+        mock_request.return_value.json.return_value = {"coverage": {}}
+
+        assert service.get_layer_bounds("test_layer") is None
+
+    @patch("app.services.geoserver_service.http_session.request")
     def test_get_layers(self, mock_request, service):
         # 1. Get list of layers
         mock_list = MagicMock()
@@ -163,32 +201,125 @@ class TestGeoServerService:
         layers = service.get_layers("ws")
         assert len(layers) == 2
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_get_layers_keeps_listing_order(self, mock_request, service):
+        names = [f"layer{i}" for i in range(20)]
+
+        def respond(method, url, **kwargs):
+            response = MagicMock()
+            if url.endswith("/workspaces/ws/layers.json"):
+                response.json.return_value = {
+                    "layers": {"layer": [{"name": name} for name in names]}
+                }
+            else:
+                name = url.rsplit("/", 1)[1].removesuffix(".json")
+                response.json.return_value = {
+                    "layer": {"name": name, "resource": {"name": "store"}}
+                }
+            return response
+
+        mock_request.side_effect = respond
+
+        layers = service.get_layers("ws")
+
+        assert [layer.name for layer in layers] == names
+        assert mock_request.call_count == len(names) + 1
+
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_layer_info_cached_until_write(self, mock_request, service):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.json.return_value = {
+            "layer": {"name": "rivers", "resource": {"name": "store"}}
+        }
+
+        service.get_layer_info("rivers", "ws")
+        service.get_layer_info("rivers", "ws")
+        assert mock_request.call_count == 1
+
+        service.set_layer_style("rivers", "blue", "ws")
+        service.get_layer_info("rivers", "ws")
+        assert mock_request.call_count == 3
+
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_missing_workspace_not_cached(self, mock_request, service):
+        import requests
+
+        missing = MagicMock(status_code=404)
+        missing.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_request.return_value = missing
+
+        service._make_request(
+            "GET", "/workspaces/ws.json", check_status=False, cached=True
+        )
+        service._make_request(
+            "GET", "/workspaces/ws.json", check_status=False, cached=True
+        )
+
+        assert mock_request.call_count == 2
+
+    @patch("app.services.geoserver_service.ThreadPoolExecutor")
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_get_layers_caps_workers(
+        self, mock_request, mock_executor, service, monkeypatch
+    ):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "geoserver_max_workers", 2)
+        mock_request.return_value.json.return_value = {
+            "layers": {"layer": [{"name": f"layer{i}"} for i in range(5)]}
+        }
+        mock_executor.return_value.__enter__.return_value.map.return_value = []
+
+        service.get_layers("ws")
+
+        mock_executor.assert_called_once_with(max_workers=2)
+
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_make_request_reports_status_code(self, mock_request, service):
+        import requests
+
+        response = MagicMock(status_code=503)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "503 Server Error", response=response
+        )
+        mock_request.return_value = response
+
+        with pytest.raises(GeoServerException) as exc_info:
+            service._make_request("GET", "/about/version.json")
+
+        assert exc_info.value.details == {"status_code": 503}
+
+    @patch("app.services.geoserver_service.http_session.request")
     def test_get_layers_failure(self, mock_request, service):
         mock_request.side_effect = Exception("Conn Error")
 
         with pytest.raises(GeoServerException):
             service.get_layers("ws")
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_create_datastore(self, mock_request, service):
-        # 1. Check exists -> 404
-        mock_check = MagicMock()
-        mock_check.status_code = 404
-
-        # 2. Create -> 201
-        mock_create = MagicMock()
-        mock_create.status_code = 201
-
-        mock_request.side_effect = [mock_check, mock_create]
+        # Create -> 201 in one request
+        mock_request.return_value.status_code = 201
 
         result = service.create_datastore(
             "new_store", connection_params={"host": "localhost"}
         )
         assert result is True
-        assert mock_request.call_count == 2
+        assert mock_request.call_count == 1
+
+    @patch("app.services.geoserver_service.http_session.request")
+    def test_create_datastore_existing_is_updated(self, mock_request, service):
+        conflict = MagicMock(status_code=409)
+        update = MagicMock(status_code=200)
+        mock_request.side_effect = [conflict, update]
+
+        assert service.create_datastore("store", connection_params={"a": 1}) is True
+
+        method, url = mock_request.call_args.args
+        assert method == "PUT"
+        assert url.endswith("/datastores/store.json")
 
-    @patch("app.services.geoserver_service.requests.request")
+    @patch("app.services.geoserver_service.http_session.request")
     def test_create_style(self, mock_request, service):
         mock_request.return_value.status_code = 201
 
@@ -199,9 +330,8 @@ class TestGeoServerService:
             == "application/vnd.ogc.sld+xml"
         )
 
-    @patch("app.services.geoserver_service.requests.get")
-    @patch("app.services.geoserver_service.ET.fromstring")
-    def test_get_layer_capabilities(self, mock_et, mock_get, service):
+    @patch("app.services.geoserver_service.http_session.get")
+    def test_get_layer_capabilities(self, mock_get, service):
         mock_get.return_value.text = "<WMS_Capabilities>...</WMS_Capabilities>"
         mock_get.return_value.content = b"<WMS_Capabilities>...</WMS_Capabilities>"
         # Implementation returns a dict with wms_available=True if successful
@@ -215,6 +345,15 @@ class TestGeoServerService:
         assert "layers=my_ws:my_layer" in url
         assert "width=500" in url
 
+    def test_generate_wms_url_encodes_values(self, service):
+        url = service.generate_wms_url(
+            "river levels", workspace="ws", bbox=(12.1, 48.5, 18.9, 51.1)
+        )
+
+        assert "layers=ws:river%20levels" in url
+        assert "bbox=12.1,48.5,18.9,51.1" in url
+        assert "format=image/png" in url
+
     def test_generate_wfs_url(self, service):
         url = service.generate_wfs_url("my_layer", workspace="my_ws")
         assert service.wfs_url in url
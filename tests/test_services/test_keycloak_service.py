@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import keycloak_service
+from app.services.keycloak_service import KeycloakService
+
+
+@pytest.fixture
+def admin():
+    keycloak_service._user_cache.clear()
+    admin = MagicMock()
+    with patch.object(KeycloakService, "get_admin_client", return_value=admin):
+        yield admin
+    keycloak_service._user_cache.clear()
+
+
+def test_get_user_by_id_is_cached(admin):
+    admin.get_user.return_value = {"id": "u1", "username": "alice"}
+
+    assert KeycloakService.get_user_by_id("u1")["username"] == "alice"
+    assert KeycloakService.get_user_by_id("u1")["username"] == "alice"
+
+    admin.get_user.assert_called_once_with("u1")
+
+
+def test_get_user_by_id_failure_not_cached(admin):
+    admin.get_user.side_effect = [Exception("down"), {"id": "u1", "username": "a"}]
+
+    assert KeycloakService.get_user_by_id("u1") is None
+    assert KeycloakService.get_user_by_id("u1")["username"] == "a"
+
+
+def test_get_users_by_ids_dedupes_and_skips_missing(admin):
+    admin.get_user.side_effect = lambda user_id: (
+        {"id": user_id, "username": "alice"} if user_id == "u1" else None
+    )
+
+    users = KeycloakService.get_users_by_ids(["u1", "u2", "u1"])
+
+    assert users == {"u1": {"id": "u1", "username": "alice"}}
+    assert admin.get_user.call_count == 2
+
+
+def test_get_user_by_username_is_cached(admin):
+    admin.get_users.return_value = [{"id": "u1", "username": "alice"}]
+
+    assert KeycloakService.get_user_by_username("alice")["id"] == "u1"
+    assert KeycloakService.get_user_by_username("alice")["id"] == "u1"
+
+    admin.get_users.assert_called_once_with(query={"username": "alice", "exact": True})
+
+
+def test_admin_client_kept_on_transient_error(admin):
+    from keycloak.exceptions import KeycloakGetError
+
+    KeycloakService._admin_client = admin
+    admin.get_user.side_effect = KeycloakGetError("timeout", response_code=504)
+    assert KeycloakService.get_user_by_id("u1") is None
+    assert KeycloakService._admin_client is admin
+
+    admin.get_user.side_effect = KeycloakGetError("expired", response_code=401)
+    assert KeycloakService.get_user_by_id("u1") is None
+    assert KeycloakService._admin_client is None
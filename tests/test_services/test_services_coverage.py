@@ -3,13 +3,18 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
-from app.core.exceptions import DatabaseException, GeoServerException
+from app.core.exceptions import (
+    DatabaseException,
+    GeoServerException,
+    ValidationException,
+)
 from app.schemas.geospatial import (
     GeoFeatureCreate,
     GeoFeatureUpdate,
     GeoLayerCreate,
     GeoLayerUpdate,
 )
+from app.services import geoserver_service
 from app.services.database_service import DatabaseService
 from app.services.geoserver_service import GeoServerService
 
@@ -20,7 +25,8 @@ class TestDatabaseServiceCoverage:
         return DatabaseService(mock_db_session)
 
     # --- GeoLayer Coverage ---
-    def test_create_geo_layer_exception(self, service):
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_create_geo_layer_exception(self, MockGeoServer, service):
         """Test exception handling during layer creation (rollback)."""
         service.db.commit.side_effect = Exception("DB Error")
 
@@ -39,7 +45,8 @@ class TestDatabaseServiceCoverage:
         assert "Failed to create geo layer" in str(exc.value)
         service.db.rollback.assert_called_once()
 
-    def test_update_geo_layer_exception(self, service):
+    @patch("app.services.geoserver_service.GeoServerService")
+    def test_update_geo_layer_exception(self, MockGeoServer, service):
         """Test exception handling during layer update."""
         # Setup existing layer
         mock_layer = MagicMock()
@@ -107,32 +114,28 @@ class TestDatabaseServiceCoverage:
         service.db.rollback.assert_called_once()
 
     def test_get_geo_features_bbox_error(self, service):
-        """Test invalid BBOX handling (logs warning, doesn't crash)."""
-        # Should just return base query if bbox fails
-        # Mock query
-        service.db.query.return_value.filter.return_value.offset.return_value.limit.return_value.all.return_value = (
-            []
-        )
-
+        """Test invalid BBOX handling (rejected before querying)."""
         # Invalid BBOX (3 coords)
-        res = service.get_geo_features("L1", bbox="10,20,30")
-        assert res == []
+        with pytest.raises(ValidationException):
+            service.get_geo_features("L1", bbox="10,20,30")
+        service.db.query.return_value.filter.return_value.offset.assert_not_called()
 
 
 class TestGeoServerServiceCoverage:
     @pytest.fixture
     def service(self):
+        geoserver_service._rest_get_cache.clear()
         return GeoServerService()
 
     def test_test_connection_fail(self, service):
         """Test connection failure."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.side_effect = requests.exceptions.RequestException("Conn Fail")
             assert service.test_connection() is False
 
     def test_create_workspace_status_paths(self, service):
         """Test different status codes for create_workspace."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             # Case: 500 error
             mock_req.return_value.status_code = 500
             mock_req.return_value.raise_for_status.side_effect = (
@@ -144,13 +147,13 @@ class TestGeoServerServiceCoverage:
 
     def test_create_datastore_exists(self, service):
         """Test create_datastore when already exists (True return)."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.return_value.status_code = 200
             assert service.create_datastore("DS1") is True
 
     def test_create_datastore_fail_status(self, service):
         """Test create_datastore non-200/404."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.return_value.status_code = 500
             mock_req.return_value.raise_for_status.side_effect = (
                 requests.exceptions.HTTPError()
@@ -161,27 +164,27 @@ class TestGeoServerServiceCoverage:
 
     def test_publish_sql_view_exists(self, service):
         """Test publish_sql_view when already exists."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.return_value.status_code = 200
             assert service.publish_sql_view("L1", "S1", "SELECT 1") is True
 
     def test_publish_sql_view_exception(self, service):
         """Test publish_sql_view exception."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.side_effect = Exception("Boom")
             with pytest.raises(GeoServerException):
                 service.publish_sql_view("L1", "S1", "SELECT 1")
 
     def test_get_layer_info_fail(self, service):
         """Test get_layer_info failure."""
-        with patch("app.services.geoserver_service.requests.request") as mock_req:
+        with patch("app.services.geoserver_service.http_session.request") as mock_req:
             mock_req.side_effect = Exception("Boom")
             with pytest.raises(GeoServerException):
                 service.get_layer_info("L1")
 
     def test_get_layer_capabilities_fail(self, service):
         """Test get_layer_capabilities failure logic (returns dict with wms_available=False)."""
-        with patch("app.services.geoserver_service.requests.get") as mock_req:
+        with patch("app.services.geoserver_service.http_session.get") as mock_req:
             mock_req.side_effect = Exception("Boom")
             cap = service.get_layer_capabilities("L1")
             assert cap["wms_available"] is False
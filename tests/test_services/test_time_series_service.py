@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.core.exceptions import ResourceNotFoundException
 from app.schemas.time_series import (
     InterpolationRequest,
     TimeSeriesAggregation,
@@ -152,7 +153,7 @@ class TestTimeSeriesService:
             ]
         }
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -185,7 +186,7 @@ class TestTimeSeriesService:
             ]
         }
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -220,9 +221,103 @@ class TestTimeSeriesService:
         resp_200.status_code = 200
         resp_200.json.return_value = mock_list_response
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.side_effect = [resp_404, resp_200]
 
             station = service.get_station("ST_1")
             assert station is not None
             assert station["id"] == "1"
+
+    def test_add_bulk_data_posts_chunks(self, service, sample_data):
+        datastream = MagicMock(status_code=200)
+        datastream.json.return_value = {
+            "value": [
+                {"@iot.id": 7, "Thing": {"@iot.id": 3, "Locations": [{"@iot.id": 1}]}}
+            ]
+        }
+        created = MagicMock(status_code=201)
+        created.json.side_effect = [
+            ["http://frost/Observations(1)"] * 4,
+            ["http://frost/Observations(5)"] * 4,
+            ["http://frost/Observations(9)", "error: duplicate"],
+        ]
+
+        with patch(
+            "app.services.time_series_service._OBSERVATION_BATCH_SIZE", 4
+        ), patch(
+            "app.services.time_series_service.http_session.get", return_value=datastream
+        ), patch(
+            "app.services.time_series_service.http_session.post", return_value=created
+        ) as mock_post:
+            count = service.add_bulk_data("DS_1", sample_data)
+
+        assert count == 9
+        assert mock_post.call_count == 3
+        assert mock_post.call_args_list[0][0][0].endswith("/CreateObservations")
+        payload = mock_post.call_args_list[0].kwargs["json"][0]
+        assert payload["Datastream"] == {"@iot.id": 7}
+        assert payload["dataArray@iot.count"] == 4
+        assert payload["dataArray"][0][2] == {"quality_flag": "good"}
+
+    def test_get_stations_by_ids_batches(self, service):
+        batch = MagicMock(status_code=200)
+        batch.json.return_value = {
+            "value": [
+                {"@iot.id": 1, "name": "One", "properties": {}},
+                {"@iot.id": 2, "name": "Two", "properties": {}},
+            ]
+        }
+
+        with patch(
+            "app.services.time_series_service.http_session.get", return_value=batch
+        ) as mock_get, patch.object(
+            service, "get_station", return_value={"id": "9", "name": "Legacy"}
+        ) as mock_get_station:
+            stations = service.get_stations_by_ids(["1", "2", "ST_9"])
+
+        assert stations["1"]["name"] == "One"
+        assert stations["2"]["name"] == "Two"
+        assert stations["ST_9"]["name"] == "Legacy"
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["$filter"] == "id eq 1 or id eq 2"
+        mock_get_station.assert_called_once_with("ST_9")
+
+    def test_get_stations_by_ids_fetches_batches_concurrently(self, service):
+        def fake_get(url, params=None, timeout=None):
+            ids = [int(p.split()[-1]) for p in params["$filter"].split(" or ")]
+            resp = MagicMock(status_code=200)
+            resp.json.return_value = {
+                "value": [
+                    {"@iot.id": i, "name": f"S{i}", "properties": {}} for i in ids
+                ]
+            }
+            return resp
+
+        ids = [str(i) for i in range(1, 121)]
+        with patch(
+            "app.services.time_series_service.http_session.get", side_effect=fake_get
+        ) as mock_get, patch.object(
+            service, "get_station", side_effect=ResourceNotFoundException("gone")
+        ) as mock_get_station:
+            stations = service.get_stations_by_ids(ids + ["ST_X"])
+
+        assert len(stations) == 120
+        assert stations["120"]["name"] == "S120"
+        assert mock_get.call_count == 3
+        mock_get_station.assert_called_once_with("ST_X")
+
+    def test_ensure_sensor_cached(self, service):
+        from app.services.time_series_service import _frost_entity_id_cache
+
+        _frost_entity_id_cache.clear()
+        found = MagicMock(status_code=200)
+        found.json.return_value = {"value": [{"@iot.id": 5}]}
+
+        with patch(
+            "app.services.time_series_service.http_session.get", return_value=found
+        ) as mock_get:
+            assert service._ensure_sensor("DataImportSensor") == 5
+            assert service._ensure_sensor("DataImportSensor") == 5
+
+        mock_get.assert_called_once()
+        _frost_entity_id_cache.clear()
@@ -34,7 +34,7 @@ class TestTimeSeriesServiceCoverage:
     def test_get_datastreams_for_station_coverage(self, service):
         """Test get_datastreams_for_station with filters."""
         mock_response = {"value": [{"@iot.id": 1, "name": "DS1"}]}
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -65,7 +65,7 @@ class TestTimeSeriesServiceCoverage:
             "phenomenonTime": "2023-01-01T00:00:00Z/2023-01-02T00:00:00Z",
         }
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             # 1. Success
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"value": [mock_val]}
@@ -74,6 +74,11 @@ class TestTimeSeriesServiceCoverage:
             assert meta.series_id == "TargetDS"
             assert meta.station_id == "St1"
             assert meta.start_time.year == 2023
+            params = mock_get.call_args.kwargs["params"]
+            assert params["$expand"] == (
+                "Thing($select=name),ObservedProperty($select=name)"
+            )
+            assert params["$top"] == 1
 
             # 2. Not Found (Empty value)
             mock_get.return_value.json.return_value = {"value": []}
@@ -90,6 +95,24 @@ class TestTimeSeriesServiceCoverage:
             with pytest.raises(TimeSeriesException):
                 service.get_time_series_metadata_by_id("NetError")
 
+    def test_get_time_series_metadata_maps_list(self, service):
+        item = {
+            "@iot.id": 7,
+            "name": "DS7",
+            "Thing": {"name": "St7"},
+            "ObservedProperty": {"name": "Level"},
+            "unitOfMeasurement": {"name": "m"},
+        }
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
+            mock_get.return_value.json.return_value = {"value": [item, item]}
+
+            results = service.get_time_series_metadata(station_id="St7")
+
+        assert [r.parameter for r in results] == ["Level", "Level"]
+        # Undated datastreams share the request timestamp
+        assert results[0].start_time == results[1].created_at
+        assert "Sensor" not in mock_get.call_args.kwargs["params"]["$expand"]
+
     def test_create_data_point_coverage(self, service):
         """Test create_data_point including Datastream lookup."""
         data_point = WaterDataPointCreate(
@@ -100,8 +123,10 @@ class TestTimeSeriesServiceCoverage:
             unit="C",
         )
 
-        with patch("app.services.time_series_service.requests.get") as mock_get, patch(
-            "app.services.time_series_service.requests.post"
+        with patch(
+            "app.services.time_series_service.http_session.get"
+        ) as mock_get, patch(
+            "app.services.time_series_service.http_session.post"
         ) as mock_post:
 
             # 1. Datastream Lookup Success
@@ -133,7 +158,7 @@ class TestTimeSeriesServiceCoverage:
             quality_flag=QualityFlag.GOOD,
             unit="m",
         )
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"value": []}  # Empty
 
@@ -144,55 +169,34 @@ class TestTimeSeriesServiceCoverage:
     def test_get_latest_data_coverage(self, service):
         """Test get_latest_data logic."""
 
-        # Mock Datastreams response
+        # Mock Datastreams response with the newest Observation expanded
         ds_resp = {
             "value": [
                 {
                     "@iot.id": 101,
                     "ObservedProperty": {"name": "Temp"},
                     "unitOfMeasurement": {"name": "C"},
+                    "Observations": [
+                        {
+                            "@iot.id": 5001,
+                            "phenomenonTime": "2023-01-01T12:00:00Z",
+                            "result": 25.0,
+                        }
+                    ],
                 },
                 {
                     "@iot.id": 102,
                     "ObservedProperty": {"name": "Level"},
                     "unitOfMeasurement": {"name": "m"},
+                    "Observations": [],  # No data for second DS
                 },
             ]
         }
 
-        # Mock Observations response (latest)
-        obs_resp_1 = {
-            "value": [
-                {
-                    "@iot.id": 5001,
-                    "phenomenonTime": "2023-01-01T12:00:00Z",
-                    "result": 25.0,
-                }
-            ]
-        }
-        obs_resp_2 = {"value": []}  # No data for second DS
-
-        with patch("app.services.time_series_service.requests.get") as mock_get:
-            # Sequence:
-            # 1. Get Datastreams
-            # 2. Get Obs for DS 101
-            # 3. Get Obs for DS 102
-
-            mock_get.side_effect = [
-                MagicMock(
-                    status_code=200, json=lambda: ds_resp, raise_for_status=lambda: None
-                ),
-                MagicMock(
-                    status_code=200,
-                    json=lambda: obs_resp_1,
-                    raise_for_status=lambda: None,
-                ),
-                MagicMock(
-                    status_code=200,
-                    json=lambda: obs_resp_2,
-                    raise_for_status=lambda: None,
-                ),
-            ]
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
+            mock_get.return_value = MagicMock(
+                status_code=200, json=lambda: ds_resp, raise_for_status=lambda: None
+            )
 
             results = service.get_latest_data(station_id=50)
 
@@ -200,11 +204,14 @@ class TestTimeSeriesServiceCoverage:
             assert results[0]["parameter"] == "temp"
             assert results[0]["value"] == 25.0
             assert "station_id" not in results[0]
-            assert mock_get.call_count == 3
+            # One request for all parameters
+            assert mock_get.call_count == 1
+            expand = mock_get.call_args.kwargs["params"]["$expand"]
+            assert "Observations($top=1;$orderby=phenomenonTime desc)" in expand
 
     def test_unexpected_json_errors(self, service):
         """Test handling of malformed JSON from FROST."""
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.side_effect = ValueError("Invalid JSON")
 
@@ -230,7 +237,7 @@ class TestTimeSeriesServiceCoverage:
             ]
         }
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
 
@@ -319,34 +326,60 @@ class TestTimeSeriesServiceCoverage:
             assert s["mean"] == 20.0
 
     def test_get_station_statistics_coverage(self, service):
-        """Test get_station_statistics with the new count/min/max implementation."""
+        """Test get_station_statistics with the nested count/min/max expands."""
         # Mock responses for:
-        # 1. Datastreams lookup
-        # 2. Observation count ($count=true)
-        # 3. Observation min ($orderby=result asc)
-        # 4. Observation max ($orderby=result desc)
+        # 1. Datastreams with count and min Observation expanded
+        # 2. Datastreams with max Observation expanded
 
-        ds_resp = {"value": [{"@iot.id": "DS_1", "ObservedProperty": {"name": "Temp"}}]}
-        count_resp = {"@iot.count": 100, "value": []}
-        min_resp = {"value": [{"result": 5.0}]}
-        max_resp = {"value": [{"result": 25.0}]}
+        min_resp = {
+            "value": [
+                {
+                    "@iot.id": "DS_1",
+                    "Observations@iot.count": 100,
+                    "Observations": [{"result": 5.0}],
+                },
+                {
+                    "@iot.id": "DS_2",
+                    "Observations@iot.count": 0,
+                    "Observations": [],
+                },
+            ]
+        }
+        max_resp = {
+            "value": [
+                {"@iot.id": "DS_1", "Observations": [{"result": 25.0}]},
+                {"@iot.id": "DS_2", "Observations": []},
+            ]
+        }
 
-        with patch("app.services.time_series_service.requests.get") as mock_get:
+        with patch("app.services.time_series_service.http_session.get") as mock_get:
             mock_get.side_effect = [
                 MagicMock(
-                    status_code=200, json=lambda: ds_resp, raise_for_status=lambda: None
+                    status_code=200,
+                    json=lambda: min_resp,
+                    raise_for_status=lambda: None,
+                ),
+                MagicMock(
+                    status_code=200,
+                    json=lambda: max_resp,
+                    raise_for_status=lambda: None,
                 ),
-                MagicMock(status_code=200, json=lambda: count_resp),
-                MagicMock(status_code=200, json=lambda: min_resp),
-                MagicMock(status_code=200, json=lambda: max_resp),
             ]
 
             result = service.get_station_statistics(
-                station_id="ST1", start_time=None, end_time=None
+                station_id="ST1", start_time=datetime(2023, 1, 1), end_time=None
             )
 
             assert result["id"] == "ST1"
             assert result["total_measurements"] == 100
             assert result["statistics"]["min"] == 5.0
             assert result["statistics"]["max"] == 25.0
+            assert mock_get.call_count == 2
+            params = mock_get.call_args_list[0].kwargs["params"]
+            assert params["$select"] == "id"
+            assert params["$expand"] == (
+                "Observations("
+                "$filter=phenomenonTime ge 2023-01-01T00:00:00Z;"
+                "$orderby=result asc;$top=1;$select=result;$count=true)"
+            )
             assert "station_id" not in result
@@ -143,6 +143,10 @@ class TestProjectService:
 
         assert result.user_id == "new-user"
         mock_db.add.assert_called()
+        # Server defaults come back with the INSERT; no reload afterwards
+        mock_db.flush.assert_called_once()
+        mock_db.expunge.assert_called_once_with(result)
+        mock_db.refresh.assert_not_called()
 
     def test_add_member_non_owner_fail(self, mock_db, sample_project):
         mock_db.query.return_value.filter.return_value.first.return_value = (
@@ -154,6 +158,23 @@ class TestProjectService:
             ProjectService.add_member(mock_db, sample_project.id, m_in, USER_OTHER)
         assert exc.value.status_code == 403
 
+    def test_add_sensor_upserts_link(self, mock_db, sample_project):
+        from sqlalchemy.dialects import postgresql
+
+        mock_db.query.return_value.filter.return_value.first.return_value = (
+            sample_project
+        )
+        mock_db.execute.return_value.rowcount = 0  # already linked
+
+        result = ProjectService.add_sensor(mock_db, sample_project.id, "42", USER_OWNER)
+
+        assert result == {"project_id": sample_project.id, "sensor_id": "42"}
+        stmt = mock_db.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (project_id, sensor_id) DO NOTHING" in sql
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+
 
 class TestDashboardService:
     def test_get_public_dashboard(self, mock_db, sample_dashboard):